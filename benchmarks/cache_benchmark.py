@@ -0,0 +1,81 @@
+"""
+Compares the size, save time and load time of a parse cache entry in the binary cache format and in the
+JSON format used before it.
+
+    python -m benchmarks.cache_benchmark --messages 100000
+"""
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.generator import generate_dictionary
+from python_fluent_scanner.types.compact import CompactCacheEntry
+from python_fluent_scanner.types.models import FluentDictionaryCacheEntry, FluentFileStamp
+from python_fluent_scanner.utils.cache_format import dump_entry, load_entry
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """
+    The function returns the best time of `repeat` calls of `function`, in seconds.
+    """
+    timings: List[float] = []
+
+    for _ in range(repeat):
+        started_at: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entry: CompactCacheEntry = CompactCacheEntry(
+        stamp=FluentFileStamp(
+            path="en.ftl",
+            size=0,
+            mtime_ns=0,
+            is_stat_reliable=True,
+            content_hash="0" * 64,
+        ),
+        duplicates=[],
+        dictionary=generate_dictionary("en", args.messages),
+    )
+    json_data: str = entry.to_model().model_dump_json()
+    binary_data: bytes = dump_entry(entry)
+
+    assert load_entry(binary_data) == entry
+
+    results: Dict[str, Tuple[int, float, float]] = {
+        "json": (
+            len(json_data.encode("utf-8")),
+            measure(lambda: entry.to_model().model_dump_json(), args.repeat),
+            measure(
+                lambda: CompactCacheEntry.from_model(
+                    FluentDictionaryCacheEntry.model_validate_json(json_data)
+                ),
+                args.repeat,
+            ),
+        ),
+        "binary": (
+            len(binary_data),
+            measure(lambda: dump_entry(entry), args.repeat),
+            measure(lambda: load_entry(binary_data), args.repeat),
+        ),
+    }
+
+    print(f"{args.messages} messages")
+
+    for name, (size, save, load) in results.items():
+        print(
+            f"{name:>8}: {size / 1_000_000:6.2f} MB, save {save * 1000:7.1f} ms, "
+            f"load {load * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compares the set-based `FluentComparator.compare` with the previous copy-and-pop comparison loop on
+large synthetic dictionaries.
+
+    python -m benchmarks.compare_benchmark --messages 100000 --error-rate 0.01
+"""
+import argparse
+import gc
+import time
+from copy import copy
+from typing import Callable, Dict, List
+
+from benchmarks.generator import generate_dictionary
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.types.compact import CompactDictionary
+from python_fluent_scanner.types.models import (
+    FluentDictionary,
+    FluentMessage,
+    FluentPlaceable,
+)
+
+
+def compare_by_copy(dict_a: FluentDictionary, dict_b: FluentDictionary) -> List[str]:
+    """
+    The function reproduces the comparison loop used before `FluentComparator`, which copies the
+    messages of `dict_b` and the placeables of every common message and pops them one by one, on the
+    pydantic models the reader returned at the time.
+    """
+    errors: List[str] = []
+    dict_b_messages: Dict[str, FluentMessage] = copy(dict_b.messages)
+
+    for message_name in dict_a.messages:
+        if message_name in dict_b_messages:
+            dict_b_messages.pop(message_name)
+            message_a: FluentMessage = dict_a.messages[message_name]
+            placeables_b: Dict[str, FluentPlaceable] = copy(
+                dict_b.messages[message_name].placeables
+            )
+
+            for placeable_name, placeable_a in message_a.placeables.items():
+                if placeable_b := placeables_b.get(placeable_name):
+                    placeables_b.pop(placeable_name)
+                    if placeable_b.placeable_type != placeable_a.placeable_type:
+                        errors.append(message_name)
+                else:
+                    errors.append(message_name)
+
+            if placeables_b:
+                errors.append(message_name)
+        else:
+            errors.append(message_name)
+
+    if dict_b_messages:
+        errors.extend(dict_b_messages)
+
+    return errors
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """
+    The function returns the best time of `repeat` calls of `function`, in seconds. The garbage
+    collector is disabled while timing, its passes over the synthetic dictionaries dominate otherwise.
+    """
+    timings: List[float] = []
+
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        started_at: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+        gc.enable()
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    root: CompactDictionary = generate_dictionary("en", args.messages)
+    dictionary: CompactDictionary = generate_dictionary(
+        "ru", args.messages, error_rate=args.error_rate, seed=1
+    )
+    root_model: FluentDictionary = root.to_model()
+    dictionary_model: FluentDictionary = dictionary.to_model()
+    comparator: FluentComparator = FluentComparator()
+    root_signatures = comparator.get_signatures(root)
+
+    results: Dict[str, float] = {
+        "copy and pop": measure(lambda: compare_by_copy(root_model, dictionary_model), args.repeat),
+        "signatures": measure(lambda: comparator.compare(root, dictionary), args.repeat),
+        "signatures, root precomputed": measure(
+            lambda: comparator.compare(root, dictionary, signatures_a=root_signatures),
+            args.repeat,
+        ),
+    }
+
+    for name, seconds in results.items():
+        print(f"{name:>30}: {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import random
+from typing import Dict, List, Tuple
+
+from python_fluent_scanner.types.compact import (
+    SELECT_EXPRESSION,
+    VARIABLE,
+    CompactDictionary,
+    CompactPlaceables,
+    make_placeables,
+)
+
+
+def generate_dictionary_source(message_count: int, seed: int = 0) -> str:
+    """
+    The function generates the source of a synthetic Fluent dictionary with plain messages, variables
+    and select expressions. The output only depends on its arguments.
+
+    :param message_count: The `message_count` parameter is the number of messages to generate
+    :type message_count: int
+    :param seed: The `seed` parameter is the seed of the random generator
+    :type seed: int
+    :return: the source of the dictionary.
+    """
+    generator: random.Random = random.Random(seed)
+    lines: List[str] = []
+
+    for index in range(message_count):
+        kind: int = generator.randrange(3)
+
+        if kind == 0:
+            lines.append(f"message-{index} = Plain text of message {index}")
+        elif kind == 1:
+            lines.append(f"message-{index} = Hello {{ $name_{index} }}, you have {{ $count }} items")
+        else:
+            lines.append(
+                f"message-{index} = {{ $count ->\n"
+                f"    [one] One item in {index}\n"
+                f"   *[other] {{ $count }} items in {index}\n"
+                f"}}"
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_dictionary(
+    language_code: str, message_count: int, error_rate: float = 0.0, seed: int = 0
+) -> CompactDictionary:
+    """
+    The function generates a synthetic CompactDictionary without going through the parser. Each message
+    has up to three placeables and, with probability `error_rate`, is missing, renamed or has one of
+    its placeables removed.
+
+    :param language_code: The `language_code` parameter is the code of the language of the dictionary
+    :type language_code: str
+    :param message_count: The `message_count` parameter is the number of messages to generate
+    :type message_count: int
+    :param error_rate: The `error_rate` parameter is the probability that a message has an error
+    :type error_rate: float
+    :param seed: The `seed` parameter is the seed of the random generator used for the errors
+    :type seed: int
+    :return: the generated dictionary.
+    """
+    generator: random.Random = random.Random(seed)
+    messages: Dict[str, CompactPlaceables] = {}
+
+    for index in range(message_count):
+        message_name: str = f"message-{index}"
+        placeables: Dict[str, int] = {
+            f"var_{index % 7}_{position}": SELECT_EXPRESSION if position == 2 else VARIABLE
+            for position in range(index % 4)
+        }
+
+        if generator.random() < error_rate:
+            error: int = generator.randrange(3)
+
+            if error == 0:
+                continue
+            elif error == 1:
+                message_name += "-renamed"
+            elif placeables:
+                placeables.popitem()
+
+        messages[message_name] = make_placeables(placeables)
+
+    return CompactDictionary(
+        language_code=language_code, path=f"{language_code}.ftl", messages=messages
+    )
+
+
+def generate_locale_sources(
+    locale_count: int,
+    message_count: int,
+    placeable_density: float = 1.0,
+    select_ratio: float = 0.2,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, str]:
+    """
+    The function generates the sources of synthetic locales: a root locale `en` and translations of it
+    where, with probability `error_rate`, a message is missing, renamed or has one of its placeables
+    removed. The output only depends on its arguments.
+
+    :param locale_count: The `locale_count` parameter is the number of locales, the root one included
+    :type locale_count: int
+    :param message_count: The `message_count` parameter is the number of messages of the root locale
+    :type message_count: int
+    :param placeable_density: The `placeable_density` parameter is the average number of placeables of
+    a message
+    :type placeable_density: float
+    :param select_ratio: The `select_ratio` parameter is the probability that a message with placeables
+    is a select expression on its first placeable
+    :type select_ratio: float
+    :param error_rate: The `error_rate` parameter is the probability that a message of a translation has
+    an error
+    :type error_rate: float
+    :param seed: The `seed` parameter is the seed of the random generator
+    :type seed: int
+    :return: a dictionary that maps the language codes to the sources of their dictionaries.
+    """
+    generator: random.Random = random.Random(seed)
+    messages: List[Tuple[str, List[str], bool]] = []
+
+    for index in range(message_count):
+        placeable_count: int = int(placeable_density) + (
+            generator.random() < placeable_density % 1
+        )
+        placeables: List[str] = [
+            f"var_{index % 7}_{position}" for position in range(placeable_count)
+        ]
+        messages.append(
+            (
+                f"message-{index}",
+                placeables,
+                bool(placeables) and generator.random() < select_ratio,
+            )
+        )
+
+    sources: Dict[str, str] = {}
+
+    for locale_index in range(locale_count):
+        lines: List[str] = []
+
+        for message_name, placeables, is_select in messages:
+            if locale_index and generator.random() < error_rate:
+                error: int = generator.randrange(3)
+
+                if error == 0:
+                    continue
+                elif error == 1:
+                    message_name += "-renamed"
+                elif placeables:
+                    placeables = placeables[:-1]
+                    is_select = is_select and bool(placeables)
+
+            text: str = " and ".join(f"{{ ${placeable} }}" for placeable in placeables)
+
+            if is_select:
+                lines.append(
+                    f"{message_name} = {{ ${placeables[0]} ->\n"
+                    f"    [one] One {text}\n"
+                    f"   *[other] Many {text}\n"
+                    f"}}"
+                )
+            else:
+                lines.append(f"{message_name} = Text of {message_name} {text}")
+
+        sources["en" if locale_index == 0 else f"l{locale_index}"] = "\n".join(lines) + "\n"
+
+    return sources
@@ -0,0 +1,63 @@
+"""
+Measures the memory used by a parsed dictionary with tracemalloc, in the compact representation used by
+the reader and the comparator and in the pydantic models used before it.
+
+    python -m benchmarks.memory_benchmark --messages 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from benchmarks.generator import generate_dictionary_source
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.enums import FluentReaderBackends
+
+
+def measure(function: Callable[[], object]) -> Tuple[int, int]:
+    """
+    The function returns the peak and the retained number of bytes allocated by a call of `function`,
+    the result of the call being retained until both are measured.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    result: object = function()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del result
+
+    return peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    source: str = generate_dictionary_source(args.messages)
+    reader: FluentReader = FluentReader(backend=FluentReaderBackends.FAST)
+
+    # The pydantic dictionary is converted from a parsed compact one, so its peak includes the compact
+    # dictionary as well; the retained memory is the one of the models alone.
+    results: Dict[str, Tuple[int, int]] = {
+        "compact": measure(
+            lambda: reader.parse_by_source(source=source, language_code="en")
+        ),
+        "pydantic": measure(
+            lambda: reader.parse_by_source(source=source, language_code="en").to_model()
+        ),
+    }
+
+    print(f"{args.messages} messages")
+
+    for name, (peak, retained) in results.items():
+        print(
+            f"{name:>10}: peak {peak / 1_000_000:7.1f} MB, retained {retained / 1_000_000:7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures how `FluentReader.parse_by_config` scales with the number of locales when dictionaries are
+parsed sequentially and in a process pool.
+
+    python -m benchmarks.parse_benchmark --messages 5000 --locales 1 2 4 8 16
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.generator import generate_dictionary_source
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.models import ScannerConfig
+
+
+def measure(config: ScannerConfig, jobs: int) -> float:
+    """
+    The function returns the number of seconds spent to parse the dictionaries of a configuration
+    without the parse cache.
+    """
+    reader: FluentReader = FluentReader(jobs=jobs)
+    started_at: float = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader.parse_by_config(config=config)
+
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--locales", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'locales':>8} {'sequential, s':>14} {f'jobs={args.jobs}, s':>14} {'speedup':>8}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+
+        for locale_count in args.locales:
+            dictionaries: Dict[str, str] = {}
+
+            for index in range(locale_count):
+                path: str = f"locale_{index}.ftl"
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(generate_dictionary_source(args.messages, seed=index))
+                dictionaries[f"l{index}"] = path
+
+            config: ScannerConfig = ScannerConfig(
+                root_locale="l0", dictionaries=dictionaries
+            )
+            timings: List[float] = [measure(config, jobs=1), measure(config, jobs=args.jobs)]
+
+            print(
+                f"{locale_count:>8} {timings[0]:>14.3f} {timings[1]:>14.3f} {timings[0] / timings[1]:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
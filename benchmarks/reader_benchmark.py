@@ -0,0 +1,44 @@
+"""
+Measures the throughput of the reader backends in MB/s on a synthetic dictionary, and checks that both
+give the same dictionary.
+
+    python -m benchmarks.reader_benchmark --messages 20000
+"""
+import argparse
+import time
+from typing import Dict
+
+from benchmarks.generator import generate_dictionary_source
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.compact import CompactDictionary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source: str = generate_dictionary_source(args.messages)
+    megabytes: float = len(source.encode("utf-8")) / 1_000_000
+    dictionaries: Dict[FluentReaderBackends, CompactDictionary] = {}
+
+    print(f"{megabytes:.2f} MB, {args.messages} messages")
+
+    for backend in FluentReaderBackends:
+        reader: FluentReader = FluentReader(backend=backend)
+        best: float = float("inf")
+
+        for _ in range(args.repeat):
+            started_at: float = time.perf_counter()
+            dictionaries[backend] = reader.parse_by_source(source=source, language_code="en")
+            best = min(best, time.perf_counter() - started_at)
+
+        print(f"{backend.value:>5}: {best:7.3f} s, {megabytes / best:7.2f} MB/s")
+
+    assert dictionaries[FluentReaderBackends.AST] == dictionaries[FluentReaderBackends.FAST]
+
+
+if __name__ == "__main__":
+    main()
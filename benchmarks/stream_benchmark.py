@@ -0,0 +1,115 @@
+"""
+Measures the peak memory and the time of reading a large synthetic dictionary at once and as a stream of
+memory-mapped chunks. Each reading runs in its own process, so that its peak resident memory can be
+measured.
+
+    python -m benchmarks.stream_benchmark --size-mb 500
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.generator import generate_dictionary_source
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import CompactCacheEntry
+from python_fluent_scanner.types.enums import FluentReaderBackends
+
+# The number of messages generated at a time when the file is written.
+BLOCK_MESSAGES: int = 10_000
+
+
+def write_dictionary(path: str, size_mb: int) -> None:
+    """
+    The function writes a synthetic dictionary of at least `size_mb` megabytes, block by block, with a
+    unique name for each message.
+    """
+    block: str = generate_dictionary_source(BLOCK_MESSAGES)
+    size: int = 0
+    index: int = 0
+
+    with open(path, "w") as file:
+        while size < size_mb * 1_000_000:
+            data: str = block.replace("message-", f"message-{index}-")
+            size += file.write(data)
+            index += 1
+
+
+def read(path: str, backend: FluentReaderBackends, stream: bool) -> None:
+    """
+    The function reads a dictionary and prints the time, the peak resident memory of the process and the
+    number of messages as JSON.
+    """
+    reader: FluentReader = FluentReader(
+        backend=backend, stream_min_bytes=1 if stream else sys.maxsize
+    )
+
+    start: float = time.perf_counter()
+    entry: CompactCacheEntry = reader.read_file_entry(path=path, language_code="en")
+    seconds: float = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "seconds": seconds,
+                "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                "messages": len(entry.dictionary.messages),
+                "duplicates": len(entry.duplicates),
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument(
+        "--backend",
+        type=FluentReaderBackends,
+        default=FluentReaderBackends.FAST,
+        choices=list(FluentReaderBackends),
+    )
+    parser.add_argument("--read", help=argparse.SUPPRESS)
+    parser.add_argument("--stream", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.read:
+        read(path=args.read, backend=args.backend, stream=args.stream)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "large.ftl")
+        write_dictionary(path=path, size_mb=args.size_mb)
+
+        print(
+            f"{os.path.getsize(path) / 1_000_000:.0f} MB file, {args.backend.value} backend"
+        )
+
+        for name, options in (("whole", []), ("stream", ["--stream"])):
+            output: str = subprocess.check_output(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.stream_benchmark",
+                    "--read",
+                    path,
+                    "--backend",
+                    args.backend.value,
+                    *options,
+                ],
+                text=True,
+            )
+            result = json.loads(output)
+
+            print(
+                f"{name:>8}: {result['seconds']:7.1f} s, peak RSS {result['max_rss_mb']:7.1f} MB, "
+                f"{result['messages']} messages, {result['duplicates']} duplicates"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Times the stages of a check on synthetic locales separately: parsing the files, comparing the
+dictionaries with the root one, and saving and loading the parse cache entries. The results are written
+as JSON and compared with a stored baseline; the suite fails when a stage is slower than its baseline
+by more than the threshold.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --update-baseline
+
+The baseline depends on the machine, update it when the suite runs somewhere else.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.generator import generate_locale_sources
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import CompactCacheEntry, CompactDictionary
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.utils.cache import ScannerCache
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """
+    The function returns the best time of `repeat` calls of `function`, in seconds.
+    """
+    timings: List[float] = []
+
+    for _ in range(repeat):
+        started_at: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings)
+
+
+def run_suite(
+    parameters: Dict[str, Any], backend: FluentReaderBackends, repeat: int
+) -> Dict[str, float]:
+    """
+    The function generates the locales of `parameters` in a temporary directory and times every stage,
+    the files being parsed with `backend`.
+
+    :return: a dictionary that maps the names of the stages to their best times, in seconds.
+    """
+    sources: Dict[str, str] = generate_locale_sources(**parameters)
+    previous_dir: str = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+
+        try:
+            for language_code, source in sources.items():
+                with open(f"{language_code}.ftl", "w") as file:
+                    file.write(source)
+
+            reader: FluentReader = FluentReader(backend=backend)
+            dictionaries: Dict[str, CompactDictionary] = {}
+
+            def parse() -> None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for language_code in sources:
+                        dictionaries[language_code] = reader.parse_by_file(
+                            path=f"{language_code}.ftl", language_code=language_code
+                        )
+
+            stages: Dict[str, float] = {"parse": measure(parse, repeat)}
+
+            comparator: FluentComparator = FluentComparator()
+            root_dictionary: CompactDictionary = dictionaries.pop("en")
+            stages["compare"] = measure(
+                lambda: list(
+                    comparator.compare_many(
+                        root_dictionary=root_dictionary,
+                        dictionaries=list(dictionaries.values()),
+                    )
+                ),
+                repeat,
+            )
+
+            cache: ScannerCache = ScannerCache()
+            entries: List[CompactCacheEntry] = [
+                reader.read_file_entry(
+                    path=f"{language_code}.ftl", language_code=language_code
+                )
+                for language_code in sources
+            ]
+            stages["cache_set"] = measure(
+                lambda: [
+                    cache.set_entry(entry=entry, backend=backend) for entry in entries
+                ],
+                repeat,
+            )
+            stages["cache_get"] = measure(
+                lambda: [
+                    cache.get_entry(
+                        language_code=entry.dictionary.language_code,
+                        path=entry.stamp.path,
+                        backend=backend,
+                    )
+                    for entry in entries
+                ],
+                repeat,
+            )
+        finally:
+            os.chdir(previous_dir)
+
+    return stages
+
+
+def find_regressions(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_delta: float = 0.0,
+) -> List[str]:
+    """
+    The function compares the times of the stages with the ones of the baseline.
+
+    :param results: The `results` parameter is the results of the suite
+    :type results: Dict[str, Any]
+    :param baseline: The `baseline` parameter is the results of the suite stored as the baseline
+    :type baseline: Dict[str, Any]
+    :param threshold: The `threshold` parameter is the allowed slowdown of a stage, e.g. 0.25 for 25%
+    :type threshold: float
+    :param min_delta: The `min_delta` parameter is the smallest slowdown of a stage in seconds reported as
+    a regression, so that the noise of the very short stages is ignored
+    :type min_delta: float
+    :return: the descriptions of the stages that are slower than the baseline by more than the threshold.
+    """
+    if (results["parameters"], results["reader"]) != (
+        baseline["parameters"],
+        baseline["reader"],
+    ):
+        raise ValueError("The baseline was recorded with other parameters")
+
+    regressions: List[str] = []
+
+    for stage, seconds in results["stages"].items():
+        baseline_seconds: float = baseline["stages"].get(stage, 0)
+
+        if (
+            baseline_seconds
+            and seconds > baseline_seconds * (1 + threshold)
+            and seconds - baseline_seconds >= min_delta
+        ):
+            regressions.append(
+                f"{stage}: {seconds * 1000:.1f} ms, baseline {baseline_seconds * 1000:.1f} ms "
+                f"(+{(seconds / baseline_seconds - 1) * 100:.0f}%)"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--locales", type=int, default=4)
+    parser.add_argument("--placeable-density", type=float, default=1.0)
+    parser.add_argument("--select-ratio", type=float, default=0.2)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reader",
+        type=FluentReaderBackends,
+        default=FluentReaderBackends.AST,
+        choices=list(FluentReaderBackends),
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="file to write the results to as JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the results as the baseline instead of comparing them with it",
+    )
+    args = parser.parse_args()
+
+    parameters: Dict[str, Any] = {
+        "locale_count": args.locales,
+        "message_count": args.messages,
+        "placeable_density": args.placeable_density,
+        "select_ratio": args.select_ratio,
+        "error_rate": args.error_rate,
+        "seed": args.seed,
+    }
+    results: Dict[str, Any] = {
+        "parameters": parameters,
+        "reader": args.reader.value,
+        "python": platform.python_version(),
+        "stages": run_suite(
+            parameters=parameters, backend=args.reader, repeat=args.repeat
+        ),
+    }
+
+    for stage, seconds in results["stages"].items():
+        print(f"{stage:>10}: {seconds * 1000:9.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+
+        print(f"Baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            regressions: List[str] = find_regressions(
+                results=results,
+                baseline=json.load(file),
+                threshold=args.threshold,
+                min_delta=args.min_delta_ms / 1000,
+            )
+
+        for regression in regressions:
+            print(f"Regression of {regression}")
+
+        if regressions:
+            sys.exit(1)
+
+        print(f"No stage is slower than the baseline by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
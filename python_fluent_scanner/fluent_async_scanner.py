@@ -0,0 +1,189 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import CompactDictionary, CompactDuplicate
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import (
+    FluentDuplicate,
+    FluentFinding,
+    FluentScanResult,
+    ScannerConfig,
+)
+
+
+class FluentAsyncScanner:
+    """
+    Checks dictionaries from a coroutine, e.g. in a service validating uploaded translations. Every
+    dictionary is parsed, then compared with the root dictionary, in its own job of an executor, so the
+    event loop is never blocked and several scans can run at once.
+
+    Nothing is printed, read from the current directory or written to the parse cache. Cancelling a scan
+    cancels its jobs that did not start yet; the jobs already running in the executor finish and their
+    results are dropped.
+    """
+
+    __executor: Optional[Executor]
+    __semaphore: asyncio.Semaphore
+
+    def __init__(
+        self, executor: Optional[Executor] = None, max_concurrency: int = 4
+    ) -> None:
+        """
+        The function initializes a scanner.
+
+        :param executor: The `executor` parameter is the executor running the parsing and the comparison,
+        the default executor of the event loop (a thread pool) if it is not provided; a
+        `ProcessPoolExecutor` parses several dictionaries in parallel
+        :type executor: Optional[Executor]
+        :param max_concurrency: The `max_concurrency` parameter is the maximum number of scans running at
+        once, the other scans wait for one of them to finish
+        :type max_concurrency: int
+        """
+        self.__executor = executor
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __run(self, function: Callable, *args):
+        """
+        The function runs a job in the executor and waits for its result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, function, *args
+        )
+
+    async def scan(
+        self, config: ScannerConfig, sources: Optional[Dict[str, str]] = None
+    ) -> FluentScanResult:
+        """
+        The `scan` function compares every dictionary with the root dictionary.
+
+        :param config: The `config` parameter is the configuration of the scanner, its dictionaries are
+        read from their paths
+        :type config: ScannerConfig
+        :param sources: The `sources` parameter maps language codes to the contents of dictionaries that
+        are already in memory; they replace the dictionaries of the configuration with the same language
+        codes and are added after the others
+        :type sources: Optional[Dict[str, str]]
+        :return: a `FluentScanResult` with the findings of every dictionary except the root one and the
+        duplicate messages of every dictionary, in the order of the configuration.
+        """
+        sources = sources or {}
+        language_codes: List[str] = list(config.dictionaries) + [
+            language_code
+            for language_code in sources
+            if language_code not in config.dictionaries
+        ]
+
+        if config.root_locale not in language_codes:
+            raise ValueError("Incorrect root locale value")
+
+        async with self.__semaphore:
+            results: List[Tuple[CompactDictionary, List[CompactDuplicate]]] = (
+                await asyncio.gather(
+                    *(
+                        self.__run(
+                            _read_dictionary,
+                            language_code,
+                            config.dictionaries.get(language_code),
+                            sources.get(language_code),
+                            config.reader,
+                            config.stream_min_bytes,
+                        )
+                        for language_code in language_codes
+                    )
+                )
+            )
+            dictionaries: Dict[str, CompactDictionary] = {
+                language_code: dictionary
+                for language_code, (dictionary, _) in zip(language_codes, results)
+            }
+            compared: List[str] = [
+                language_code
+                for language_code in language_codes
+                if language_code != config.root_locale
+            ]
+            findings: List[List[FluentFinding]] = await asyncio.gather(
+                *(
+                    self.__run(
+                        _compare_dictionary,
+                        dictionaries[config.root_locale],
+                        dictionaries[language_code],
+                    )
+                    for language_code in compared
+                )
+            )
+
+        return FluentScanResult(
+            root_locale=config.root_locale,
+            findings=dict(zip(compared, findings)),
+            duplicates={
+                language_code: [
+                    FluentDuplicate(
+                        message_name=message_name,
+                        first_path=first_path,
+                        second_path=second_path,
+                    )
+                    for message_name, first_path, second_path in duplicates
+                ]
+                for language_code, (_, duplicates) in zip(language_codes, results)
+            },
+        )
+
+
+async def scan(
+    config: ScannerConfig,
+    sources: Optional[Dict[str, str]] = None,
+    executor: Optional[Executor] = None,
+) -> FluentScanResult:
+    """
+    The `scan` function compares every dictionary with the root dictionary without blocking the event
+    loop, see `FluentAsyncScanner.scan`. Use a shared `FluentAsyncScanner` to limit the number of
+    concurrent scans.
+
+    :param config: The `config` parameter is the configuration of the scanner
+    :type config: ScannerConfig
+    :param sources: The `sources` parameter maps language codes to the contents of dictionaries that are
+    already in memory
+    :type sources: Optional[Dict[str, str]]
+    :param executor: The `executor` parameter is the executor running the parsing and the comparison
+    :type executor: Optional[Executor]
+    :return: the `FluentScanResult` of the scan.
+    """
+    return await FluentAsyncScanner(executor=executor).scan(
+        config=config, sources=sources
+    )
+
+
+def _read_dictionary(
+    language_code: str,
+    path: Optional[str],
+    source: Optional[str],
+    backend: FluentReaderBackends,
+    stream_min_bytes: int,
+) -> Tuple[CompactDictionary, List[CompactDuplicate]]:
+    """
+    The `_read_dictionary` function is the executor job parsing a dictionary, from its source when it is
+    provided and from its path otherwise.
+    """
+    reader: FluentReader = FluentReader(
+        backend=backend, stream_min_bytes=stream_min_bytes
+    )
+
+    if source is not None:
+        return reader.read_by_source(
+            source=source, language_code=language_code, path=path or "<memory>"
+        )
+
+    return reader.read_by_paths(paths={language_code: path})[language_code]
+
+
+def _compare_dictionary(
+    root_dictionary: CompactDictionary, dictionary: CompactDictionary
+) -> List[FluentFinding]:
+    """
+    The `_compare_dictionary` function is the executor job comparing a dictionary with the root
+    dictionary.
+    """
+    return FluentComparator().compare(dict_a=root_dictionary, dict_b=dictionary)
@@ -0,0 +1,235 @@
+import hashlib
+import os
+from typing import Dict, List, Optional, Tuple
+
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.fluent_reporter import FluentReporter, FluentTextReporter
+from python_fluent_scanner.types.compact import CompactDictionary, CompactDuplicate
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import FluentFinding, ScannerConfig
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.config import ConfigReader
+from python_fluent_scanner.utils.discovery import is_dictionary_pattern
+from python_fluent_scanner.utils.shared_cache import SharedCache
+from python_fluent_scanner.utils.timings import span
+
+# The settings of the reader of a configuration: the backend, the size from which files are streamed
+# and whether the shared cache is used. The dictionaries of the configurations with the same settings
+# are read together.
+ReaderSettings = Tuple[FluentReaderBackends, int, bool]
+
+# A dictionary of a project is identified by the path of the configuration file of the project and the
+# language code of the dictionary.
+ProjectDictionaryKey = Tuple[str, str]
+
+
+class FluentBatchScanner:
+    """
+    Checks the dictionaries of several projects, e.g. the sub-projects of a monorepo, in one run. The
+    dictionaries are read together: a file used by several projects, or several files with the same
+    content, are parsed once, and the same pair of a root dictionary and a dictionary is compared once.
+    The comparisons of every project share one process pool, and the results are reported project by
+    project.
+
+    Every message is checked, the saved state of the root dictionaries is neither used nor updated.
+    """
+
+    __configs: Dict[str, ScannerConfig]
+    __jobs: int
+    __reporter: FluentReporter
+
+    def __init__(
+        self,
+        config_filenames: List[str],
+        jobs: int = 1,
+        reporter: Optional[FluentReporter] = None,
+    ) -> None:
+        """
+        The function initializes a scanner by loading the configuration files. The paths of the
+        dictionaries of a configuration file are relative to its directory.
+
+        :param config_filenames: The `config_filenames` parameter is the list of the paths of the
+        configuration files of the projects
+        :type config_filenames: List[str]
+        :param jobs: The `jobs` parameter is the maximum number of processes used to parse and compare
+        dictionaries
+        :type jobs: int
+        :param reporter: The `reporter` parameter reports the duplicate messages, the findings and the
+        summary of the check, as colored text if it is not provided
+        :type reporter: Optional[FluentReporter]
+        """
+        self.__jobs = jobs
+        self.__reporter = reporter or FluentTextReporter()
+
+        with span("config"):
+            self.__configs = {
+                config_filename: ConfigReader(config_filename=config_filename).get_config()
+                for config_filename in dict.fromkeys(config_filenames)
+            }
+
+    def __get_content_key(self, path: str) -> str:
+        """
+        The function returns a key identifying the content of a dictionary: the hash of the contents of a
+        single file, the hash of the real path of a directory or glob pattern.
+        """
+        if is_dictionary_pattern(path):
+            return "path-" + hashlib.sha256(
+                os.path.realpath(path).encode("utf-8")
+            ).hexdigest()
+
+        with open(path, "rb") as file:
+            return "content-" + hashlib.file_digest(file, "sha256").hexdigest()
+
+    def __get_cache_key(self, path: str) -> str:
+        """
+        The function returns the key under which the parse cache stores a dictionary, in place of a
+        language code since the same file may be the dictionary of different languages in different
+        projects.
+        """
+        return hashlib.blake2b(
+            os.path.realpath(path).encode("utf-8"), digest_size=8
+        ).hexdigest()
+
+    def __read_dictionaries(
+        self,
+    ) -> Tuple[
+        Dict[ProjectDictionaryKey, str],
+        Dict[str, Tuple[CompactDictionary, List[CompactDuplicate]]],
+    ]:
+        """
+        The function parses the dictionaries of every project, each distinct content once.
+
+        :return: a tuple of a dictionary that maps the dictionaries of the projects to the keys of their
+        contents, and a dictionary that maps the keys of the contents to their parsed dictionaries and
+        duplicate messages.
+        """
+        content_keys: Dict[ProjectDictionaryKey, str] = {}
+        paths: Dict[ReaderSettings, Dict[str, str]] = {}
+        contents: Dict[str, Tuple[ReaderSettings, str]] = {}
+
+        for config_filename, config in self.__configs.items():
+            settings: ReaderSettings = (
+                config.reader,
+                config.stream_min_bytes,
+                config.shared_cache,
+            )
+
+            for language_code, path in config.dictionaries.items():
+                content_key: str = self.__get_content_key(path)
+                content_keys[config_filename, language_code] = content_key
+
+                if content_key not in contents:
+                    cache_key: str = self.__get_cache_key(path)
+                    contents[content_key] = settings, cache_key
+                    paths.setdefault(settings, {})[cache_key] = path
+
+        parsed: Dict[str, Tuple[CompactDictionary, List[CompactDuplicate]]] = {}
+
+        for (backend, stream_min_bytes, shared_cache), settings_paths in paths.items():
+            reader: FluentReader = FluentReader(
+                cache=ScannerCache(),
+                jobs=self.__jobs,
+                backend=backend,
+                stream_min_bytes=stream_min_bytes,
+                shared_cache=SharedCache() if shared_cache else None,
+            )
+            parsed.update(reader.read_by_paths(paths=settings_paths))
+
+        return content_keys, {
+            content_key: parsed[cache_key]
+            for content_key, (_, cache_key) in contents.items()
+        }
+
+    def check(self) -> bool:
+        """
+        The function compares the dictionaries of every project with the root dictionary of the project,
+        and reports the duplicate messages and the findings of each project in the order of the
+        configuration files.
+
+        :return: a boolean value indicating whether any errors were found.
+        """
+        content_keys, contents = self.__read_dictionaries()
+
+        pairs: Dict[Tuple[str, str], Optional[List[FluentFinding]]] = {}
+
+        for config_filename, config in self.__configs.items():
+            for language_code in config.dictionaries:
+                if language_code != config.root_locale:
+                    pairs[
+                        content_keys[config_filename, config.root_locale],
+                        content_keys[config_filename, language_code],
+                    ] = None
+
+        comparisons = FluentComparator().compare_pairs(
+            pairs=[
+                (contents[root_key][0], contents[key][0]) for root_key, key in pairs
+            ],
+            jobs=self.__jobs,
+        )
+
+        with span("compare"):
+            for pair in pairs:
+                pairs[pair] = next(comparisons)
+
+        failed_projects: List[str] = []
+
+        for config_filename, config in self.__configs.items():
+            self.__reporter.report_project(project=config_filename)
+            is_error_found: bool = False
+
+            for language_code, path in config.dictionaries.items():
+                dictionary, duplicates = contents[
+                    content_keys[config_filename, language_code]
+                ]
+                self.__reporter.report_duplicates(
+                    language_code=language_code,
+                    path=path,
+                    duplicates=[
+                        (message_name, path, path)
+                        if first_path == second_path == dictionary.path
+                        else (message_name, first_path, second_path)
+                        for message_name, first_path, second_path in duplicates
+                    ],
+                )
+
+            for language_code, path in config.dictionaries.items():
+                if language_code == config.root_locale:
+                    continue
+
+                findings: List[FluentFinding] = [
+                    finding
+                    if finding.language_code == language_code
+                    else finding.model_copy(update={"language_code": language_code})
+                    for finding in pairs[
+                        content_keys[config_filename, config.root_locale],
+                        content_keys[config_filename, language_code],
+                    ]
+                ]
+                self.__reporter.report_dictionary(
+                    language_code=language_code,
+                    findings=findings,
+                    path=path,
+                    dictionary=contents[content_keys[config_filename, language_code]][0],
+                )
+
+                if findings:
+                    is_error_found = True
+
+            if is_error_found:
+                failed_projects.append(config_filename)
+
+        if failed_projects:
+            self.__reporter.report_status(
+                f"\n ℹ {len(failed_projects)} of {len(self.__configs)} projects have "
+                f"errors: {', '.join(failed_projects)}",
+                "red",
+            )
+        else:
+            self.__reporter.report_status(
+                f"\n✔ {len(self.__configs)} projects checked successfully", "green"
+            )
+
+        self.__reporter.finish(is_error_found=bool(failed_projects))
+
+        return bool(failed_projects)
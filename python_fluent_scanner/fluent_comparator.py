@@ -0,0 +1,518 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet, Dict, Iterator, List, Optional, Set, Tuple
+
+from python_fluent_scanner.types.compact import (
+    PLACEABLE_TYPES,
+    VARIABLE_TYPES,
+    CompactDictionary,
+    CompactPlaceables,
+)
+from python_fluent_scanner.types.enums import FluentFindingTypes
+from python_fluent_scanner.types.models import FluentFinding
+from python_fluent_scanner.utils.similarity import match_names
+
+# Comparing fewer messages than this is faster in the current process than starting a process pool.
+PARALLEL_COMPARE_MIN_MESSAGES: int = 50_000
+
+
+# The signature of a message is the tuple of the (name, type code) pairs of its placeables sorted by name.
+MessageSignature = CompactPlaceables
+
+EMPTY_SIGNATURE: MessageSignature = ()
+
+
+class FluentComparator:
+    def get_signatures(
+        self,
+        dictionary: CompactDictionary,
+        message_names: Optional[AbstractSet[str]] = None,
+    ) -> Dict[str, MessageSignature]:
+        """
+        The function `get_signatures` computes the signature of the messages of a dictionary. Two
+        messages have equal signatures if and only if they have the same placeables with the same types.
+
+        :param dictionary: The `dictionary` parameter is the `CompactDictionary` to compute signatures for
+        :type dictionary: CompactDictionary
+        :param message_names: The `message_names` parameter limits the signatures to these messages, all
+        the messages of the dictionary are used if it is not provided
+        :type message_names: Optional[AbstractSet[str]]
+        :return: a dictionary that maps the message names to their signatures, in the order of the
+        messages of the dictionary.
+        """
+        signatures: Dict[str, MessageSignature] = {}
+        messages: Dict[str, CompactPlaceables] = dictionary.messages
+
+        for message_name, placeables in messages.items():
+            if message_names is not None and message_name not in message_names:
+                continue
+
+            if len(placeables) < 2:
+                signatures[message_name] = placeables
+            else:
+                signatures[message_name] = tuple(sorted(placeables))
+
+        return signatures
+
+    def get_fingerprints(
+        self, signatures: Dict[str, MessageSignature]
+    ) -> Dict[str, str]:
+        """
+        The function `get_fingerprints` computes a short hash of each message signature that stays the
+        same across runs, so signatures can be stored in the cache and compared later.
+
+        :param signatures: The `signatures` parameter is the result of `get_signatures`
+        :type signatures: Dict[str, MessageSignature]
+        :return: a dictionary that maps the message names to their fingerprints.
+        """
+        fingerprints: Dict[str, str] = {}
+
+        for message_name, signature in signatures.items():
+            fingerprints[message_name] = hashlib.blake2b(
+                ";".join(
+                    f"{placeable_name}:{PLACEABLE_TYPES[code].value}"
+                    for placeable_name, code in signature
+                ).encode("utf-8"),
+                digest_size=8,
+            ).hexdigest()
+
+        return fingerprints
+
+    def __compare_placeables(
+        self,
+        message_name: str,
+        placeables_a: CompactPlaceables,
+        placeables_b: CompactPlaceables,
+        language_code: str,
+    ) -> List[FluentFinding]:
+        """
+        The function `__compare_placeables` compares the placeables of a message in two Fluent
+        dictionaries.
+
+        :param message_name: The `message_name` parameter is a string that represents the name of a message
+        :type message_name: str
+        :param placeables_a: `placeables_a` is the placeables of the message of the reference dictionary
+        :type placeables_a: CompactPlaceables
+        :param placeables_b: `placeables_b` is the placeables of the message of the dictionary checked
+        against the reference
+        :type placeables_b: CompactPlaceables
+        :param language_code: `language_code` is the code of the language of `placeables_b`
+        :type language_code: str
+        :return: a list of the findings about `placeables_b`.
+        """
+        findings: List[FluentFinding] = []
+        types_a: Dict[str, int] = dict(placeables_a)
+        types_b: Dict[str, int] = dict(placeables_b)
+
+        for placeable_name, code_a in types_a.items():
+            code_b: Optional[int] = types_b.get(placeable_name)
+
+            if code_b is not None:
+                if code_b != code_a:
+                    findings.append(
+                        FluentFinding(
+                            finding_type=FluentFindingTypes.PLACEABLE_TYPE_MISMATCH,
+                            language_code=language_code,
+                            message_name=message_name,
+                            placeable_name=placeable_name,
+                            expected_type=PLACEABLE_TYPES[code_a],
+                            actual_type=PLACEABLE_TYPES[code_b],
+                        )
+                    )
+            else:
+                findings.append(
+                    FluentFinding(
+                        finding_type=FluentFindingTypes.MISSING_PLACEABLE,
+                        language_code=language_code,
+                        message_name=message_name,
+                        placeable_name=placeable_name,
+                    )
+                )
+
+        if len(types_b.keys() & types_a.keys()) < len(types_b):
+            findings.append(
+                FluentFinding(
+                    finding_type=FluentFindingTypes.EXTRA_PLACEABLES,
+                    language_code=language_code,
+                    message_name=message_name,
+                    names=[
+                        placeable_name
+                        for placeable_name in types_b
+                        if placeable_name not in types_a
+                    ],
+                )
+            )
+
+        return findings
+
+    def __get_variables(
+        self, dictionary: CompactDictionary, message_name: str
+    ) -> Set[str]:
+        """
+        The function `__get_variables` returns the names of the variables of a message.
+        """
+        return {
+            placeable_name
+            for placeable_name, code in dictionary.messages.get(message_name, ())
+            if code in VARIABLE_TYPES
+        }
+
+    def suggest_renames(
+        self,
+        findings: List[FluentFinding],
+        dict_a: CompactDictionary,
+        dict_b: CompactDictionary,
+    ) -> List[FluentFinding]:
+        """
+        The function `suggest_renames` pairs the missing messages with the extra messages, and the
+        missing variables of each message with its extra variables, whose names are similar enough to
+        be renames, and suggests the extra name as the likely new name of the missing one. The names are
+        matched through an index of their n-grams, so that the cost does not grow with the product of
+        the numbers of missing and extra names. The other placeables, e.g. terms and functions, are not
+        paired, since `FluentRenamer` only renames the `$variable` references.
+
+        :param findings: The `findings` parameter is the list of the findings of a dictionary
+        :type findings: List[FluentFinding]
+        :param dict_a: `dict_a` is the reference dictionary of the findings
+        :type dict_a: CompactDictionary
+        :param dict_b: `dict_b` is the dictionary the findings are about
+        :type dict_b: CompactDictionary
+        :return: the list of the findings, with the `suggestion` of the missing messages and placeables
+        set to the extra name they were likely renamed to, or `None`.
+        """
+        missing_messages: List[str] = []
+        extra_messages: List[str] = []
+        missing_placeables: Dict[str, List[str]] = {}
+        extra_placeables: Dict[str, List[str]] = {}
+
+        for finding in findings:
+            if finding.finding_type == FluentFindingTypes.MISSING_MESSAGE:
+                missing_messages.append(finding.message_name)
+            elif finding.finding_type == FluentFindingTypes.EXTRA_MESSAGES:
+                extra_messages.extend(finding.names)
+            elif finding.finding_type == FluentFindingTypes.MISSING_PLACEABLE:
+                if finding.placeable_name in self.__get_variables(
+                    dict_a, finding.message_name
+                ):
+                    missing_placeables.setdefault(finding.message_name, []).append(
+                        finding.placeable_name
+                    )
+            elif finding.finding_type == FluentFindingTypes.EXTRA_PLACEABLES:
+                variables: Set[str] = self.__get_variables(dict_b, finding.message_name)
+                extra_placeables[finding.message_name] = [
+                    placeable_name
+                    for placeable_name in finding.names
+                    if placeable_name in variables
+                ]
+
+        message_renames: Dict[str, str] = match_names(missing_messages, extra_messages)
+        placeable_renames: Dict[str, Dict[str, str]] = {
+            message_name: match_names(placeable_names, extra_placeables[message_name])
+            for message_name, placeable_names in missing_placeables.items()
+            if message_name in extra_placeables
+        }
+        suggested_findings: List[FluentFinding] = []
+
+        for finding in findings:
+            suggestion: Optional[str] = None
+
+            if finding.finding_type == FluentFindingTypes.MISSING_MESSAGE:
+                suggestion = message_renames.get(finding.message_name)
+            elif finding.finding_type == FluentFindingTypes.MISSING_PLACEABLE:
+                suggestion = placeable_renames.get(finding.message_name, {}).get(
+                    finding.placeable_name
+                )
+
+            if suggestion != finding.suggestion:
+                finding = finding.model_copy(update={"suggestion": suggestion})
+
+            suggested_findings.append(finding)
+
+        return suggested_findings
+
+    def compare(
+        self,
+        dict_a: CompactDictionary,
+        dict_b: CompactDictionary,
+        signatures_a: Optional[Dict[str, MessageSignature]] = None,
+        message_names: Optional[AbstractSet[str]] = None,
+    ) -> List[FluentFinding]:
+        """
+        The function `compare` compares two dictionaries and returns every missing or unexpected message
+        and placeable of `dict_b`. It does not print anything, so dictionaries can be compared
+        concurrently.
+
+        The messages missing from `dict_b` and its extra messages are found with set operations on the
+        message names, and only the common messages whose signatures differ have their placeables
+        compared one by one. The missing names that are likely renames of extra names get a suggestion,
+        see `suggest_renames`.
+
+        :param dict_a: CompactDictionary object representing the reference dictionary of messages
+        :type dict_a: CompactDictionary
+        :param dict_b: The parameter `dict_b` is the CompactDictionary checked against `dict_a`
+        :type dict_b: CompactDictionary
+        :param signatures_a: The `signatures_a` parameter is the result of `get_signatures` for `dict_a`,
+        computed if it is not provided
+        :type signatures_a: Optional[Dict[str, MessageSignature]]
+        :param message_names: The `message_names` parameter limits the comparison to these messages (e.g.
+        the messages of `dict_a` that changed since the last check, and the ones removed from it); all
+        the messages are compared if it is not provided
+        :type message_names: Optional[AbstractSet[str]]
+        :return: a list of the findings about `dict_b`, empty if no errors were found.
+        """
+        if signatures_a is None:
+            signatures_a = self.get_signatures(dict_a)
+
+        findings: List[FluentFinding] = []
+        messages_a: Dict[str, CompactPlaceables] = dict_a.messages
+        messages_b: Dict[str, CompactPlaceables] = dict_b.messages
+        signatures_b: Dict[str, MessageSignature] = self.get_signatures(
+            dict_b, message_names=message_names
+        )
+        language_code: str = dict_b.language_code
+
+        if message_names is None:
+            extra_names: AbstractSet[str] = messages_b.keys() - messages_a.keys()
+        else:
+            extra_names = {
+                message_name
+                for message_name in message_names
+                if message_name in messages_b and message_name not in messages_a
+            }
+
+        for message_name, signature_a in signatures_a.items():
+            if message_names is not None and message_name not in message_names:
+                continue
+
+            signature_b: Optional[MessageSignature] = signatures_b.get(message_name)
+
+            if signature_b is None:
+                findings.append(
+                    FluentFinding(
+                        finding_type=FluentFindingTypes.MISSING_MESSAGE,
+                        language_code=language_code,
+                        message_name=message_name,
+                    )
+                )
+            elif signature_b != signature_a:
+                findings.extend(
+                    self.__compare_placeables(
+                        message_name=message_name,
+                        placeables_a=messages_a[message_name],
+                        placeables_b=messages_b[message_name],
+                        language_code=language_code,
+                    )
+                )
+
+        if extra_names:
+            findings.append(
+                FluentFinding(
+                    finding_type=FluentFindingTypes.EXTRA_MESSAGES,
+                    language_code=language_code,
+                    names=[
+                        message_name
+                        for message_name in messages_b
+                        if message_name in extra_names
+                    ],
+                )
+            )
+
+        return self.suggest_renames(findings, dict_a=dict_a, dict_b=dict_b)
+
+    def update_findings(
+        self,
+        findings: List[FluentFinding],
+        scoped_findings: List[FluentFinding],
+        message_names: AbstractSet[str],
+        dict_a: CompactDictionary,
+        dict_b: CompactDictionary,
+    ) -> List[FluentFinding]:
+        """
+        The function `update_findings` patches the findings of a full comparison of two dictionaries with
+        the findings of a comparison limited to some messages, so that the result is the same as a full
+        comparison of the current dictionaries.
+
+        :param findings: The `findings` parameter is the result of an earlier comparison of the dictionaries
+        :type findings: List[FluentFinding]
+        :param scoped_findings: The `scoped_findings` parameter is the result of `compare` called with
+        `message_names` on the current dictionaries
+        :type scoped_findings: List[FluentFinding]
+        :param message_names: The `message_names` parameter is the set of the messages that changed in any
+        of the dictionaries since `findings` were computed
+        :type message_names: AbstractSet[str]
+        :param dict_a: `dict_a` is the current reference dictionary
+        :type dict_a: CompactDictionary
+        :param dict_b: `dict_b` is the current dictionary checked against `dict_a`
+        :type dict_b: CompactDictionary
+        :return: the updated list of the findings about `dict_b`.
+        """
+        positions: Dict[str, int] = {
+            message_name: position for position, message_name in enumerate(dict_a.messages)
+        }
+        message_findings: List[FluentFinding] = []
+        extra_names: Set[str] = set()
+
+        for finding in findings:
+            if finding.finding_type == FluentFindingTypes.EXTRA_MESSAGES:
+                extra_names.update(
+                    message_name
+                    for message_name in finding.names
+                    if message_name not in message_names
+                )
+            elif finding.message_name not in message_names:
+                message_findings.append(finding)
+
+        for finding in scoped_findings:
+            if finding.finding_type == FluentFindingTypes.EXTRA_MESSAGES:
+                extra_names.update(finding.names)
+            else:
+                message_findings.append(finding)
+
+        message_findings.sort(
+            key=lambda finding: positions.get(finding.message_name, len(positions))
+        )
+
+        if extra_names:
+            message_findings.append(
+                FluentFinding(
+                    finding_type=FluentFindingTypes.EXTRA_MESSAGES,
+                    language_code=dict_b.language_code,
+                    names=[
+                        message_name
+                        for message_name in dict_b.messages
+                        if message_name in extra_names
+                    ],
+                )
+            )
+
+        return self.suggest_renames(message_findings, dict_a=dict_a, dict_b=dict_b)
+
+    def compare_many(
+        self,
+        root_dictionary: CompactDictionary,
+        dictionaries: List[CompactDictionary],
+        jobs: int = 1,
+        message_names: Optional[AbstractSet[str]] = None,
+    ) -> Iterator[List[FluentFinding]]:
+        """
+        The function `compare_many` compares several dictionaries with the root dictionary, in a process
+        pool when there are enough messages to outweigh the cost of starting it.
+
+        :param root_dictionary: The `root_dictionary` parameter is the reference dictionary
+        :type root_dictionary: CompactDictionary
+        :param dictionaries: The `dictionaries` parameter is the list of the dictionaries to check
+        :type dictionaries: List[CompactDictionary]
+        :param jobs: The `jobs` parameter is the maximum number of processes used for the comparison
+        :type jobs: int
+        :param message_names: The `message_names` parameter limits the comparison to these messages
+        :type message_names: Optional[AbstractSet[str]]
+        :return: an iterator over the findings of each dictionary, in the order of `dictionaries`.
+        """
+        message_count: int = sum(len(dictionary.messages) for dictionary in dictionaries)
+
+        if (
+            jobs > 1
+            and len(dictionaries) > 1
+            and message_count >= PARALLEL_COMPARE_MIN_MESSAGES
+        ):
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(dictionaries)),
+                initializer=_set_root_dictionary,
+                initargs=(root_dictionary, message_names),
+            ) as executor:
+                yield from executor.map(_compare_with_root_dictionary, dictionaries)
+        else:
+            root_signatures: Dict[str, MessageSignature] = self.get_signatures(
+                root_dictionary, message_names=message_names
+            )
+
+            for dictionary in dictionaries:
+                yield self.compare(
+                    dict_a=root_dictionary,
+                    signatures_a=root_signatures,
+                    dict_b=dictionary,
+                    message_names=message_names,
+                )
+
+    def compare_pairs(
+        self,
+        pairs: List[Tuple[CompactDictionary, CompactDictionary]],
+        jobs: int = 1,
+    ) -> Iterator[List[FluentFinding]]:
+        """
+        The function `compare_pairs` compares several dictionaries, each with its own root dictionary (e.g.
+        the dictionaries of several projects), in one process pool when there are enough messages to
+        outweigh the cost of starting it.
+
+        :param pairs: The `pairs` parameter is the list of the (root dictionary, dictionary) pairs
+        :type pairs: List[Tuple[CompactDictionary, CompactDictionary]]
+        :param jobs: The `jobs` parameter is the maximum number of processes used for the comparison
+        :type jobs: int
+        :return: an iterator over the findings of each dictionary, in the order of `pairs`.
+        """
+        message_count: int = sum(len(dictionary.messages) for _, dictionary in pairs)
+
+        if jobs > 1 and len(pairs) > 1 and message_count >= PARALLEL_COMPARE_MIN_MESSAGES:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pairs))) as executor:
+                yield from executor.map(
+                    _compare_pair,
+                    [root_dictionary for root_dictionary, _ in pairs],
+                    [dictionary for _, dictionary in pairs],
+                )
+        else:
+            signatures: Dict[int, Dict[str, MessageSignature]] = {}
+
+            for root_dictionary, dictionary in pairs:
+                if id(root_dictionary) not in signatures:
+                    signatures[id(root_dictionary)] = self.get_signatures(root_dictionary)
+
+                yield self.compare(
+                    dict_a=root_dictionary,
+                    signatures_a=signatures[id(root_dictionary)],
+                    dict_b=dictionary,
+                )
+
+
+_root_dictionary: Optional[CompactDictionary] = None
+_root_signatures: Dict[str, MessageSignature] = {}
+_message_names: Optional[AbstractSet[str]] = None
+_comparator: Optional[FluentComparator] = None
+
+
+def _set_root_dictionary(
+    root_dictionary: CompactDictionary, message_names: Optional[AbstractSet[str]]
+) -> None:
+    """
+    The `_set_root_dictionary` function is the process pool initializer of `FluentComparator.compare_many`,
+    it sends the root dictionary to each worker once instead of once per task and computes its
+    signatures there.
+    """
+    global _root_dictionary, _root_signatures, _message_names, _comparator
+    _comparator = FluentComparator()
+    _root_dictionary = root_dictionary
+    _message_names = message_names
+    _root_signatures = _comparator.get_signatures(
+        root_dictionary, message_names=message_names
+    )
+
+
+def _compare_with_root_dictionary(dictionary: CompactDictionary) -> List[FluentFinding]:
+    """
+    The `_compare_with_root_dictionary` function is the process pool task of
+    `FluentComparator.compare_many`.
+    """
+    return _comparator.compare(
+        dict_a=_root_dictionary,
+        signatures_a=_root_signatures,
+        dict_b=dictionary,
+        message_names=_message_names,
+    )
+
+
+def _compare_pair(
+    root_dictionary: CompactDictionary, dictionary: CompactDictionary
+) -> List[FluentFinding]:
+    """
+    The `_compare_pair` function is the process pool task of `FluentComparator.compare_pairs`.
+    """
+    return FluentComparator().compare(dict_a=root_dictionary, dict_b=dictionary)
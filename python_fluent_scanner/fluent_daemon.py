@@ -0,0 +1,408 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set
+
+from termcolor import cprint
+from python_fluent_scanner.fluent_watcher import FluentWatcher
+from python_fluent_scanner.types.enums import FluentFindingTypes
+from python_fluent_scanner.types.models import FluentFinding, ScannerConfig
+from python_fluent_scanner.utils.run_stamp import CACHE_FOLDER_NAME
+
+DAEMON_SOCKET_PATH: str = os.path.join(CACHE_FOLDER_NAME, "daemon.sock")
+
+
+class FluentDaemonError(RuntimeError):
+    """
+    The error returned by the daemon for a request it could not handle.
+    """
+
+
+class _FluentDaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    block_on_close = False
+    fluent_daemon: "FluentDaemon"
+
+
+class _FluentDaemonHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        """
+        The function answers the requests of a connection, one JSON object per line, until the client
+        closes it.
+        """
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            response: Dict[str, Any] = self.server.fluent_daemon.handle_request(line)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+            self.wfile.write(b"\n")
+            self.wfile.flush()
+
+
+class FluentDaemon:
+    """
+    Keeps the dictionaries of a configuration and the fingerprints of their messages in memory, and
+    answers the requests of editors over a Unix domain socket, so that a check does not pay the startup and
+    parse costs. Each request and response is a JSON object on one line:
+
+    - `{"command": "check", "language_code": "ru", "path": "...", "source": "..."}` replaces the file
+      `path` of the dictionary with the unsaved buffer `source` (both optional, `path` defaults to the
+      path of the dictionary) and returns the findings of the affected dictionaries
+    - `{"command": "close", "language_code": "ru", "path": "..."}` drops the buffer of a file of the
+      dictionary and loads the file again
+    - `{"command": "missing", "language_code": "ru"}` returns the messages of the root dictionary missing
+      from a dictionary
+    - `{"command": "findings"}` returns the findings of every dictionary
+    - `{"command": "shutdown"}` stops the daemon
+
+    The files without a buffer are checked for changes before each request. The responses have
+    `"ok": true`, or `"ok": false` and an `"error"`.
+    """
+
+    __watcher: FluentWatcher
+    __root_locale: str
+    __language_codes: Set[str]
+    __socket_path: str
+    __lock: threading.Lock
+    __server: Optional[_FluentDaemonServer]
+
+    def __init__(
+        self,
+        config: ScannerConfig,
+        socket_path: str = DAEMON_SOCKET_PATH,
+        jobs: int = 1,
+    ) -> None:
+        """
+        The function initializes a daemon, loads and compares every dictionary of the configuration.
+
+        :param config: The `config` parameter is the configuration of the scanner
+        :type config: ScannerConfig
+        :param socket_path: The `socket_path` parameter is the path of the Unix domain socket
+        :type socket_path: str
+        :param jobs: The `jobs` parameter is the maximum number of processes used for the first parse
+        :type jobs: int
+        """
+        self.__watcher = FluentWatcher(config=config, jobs=jobs, use_inotify=False)
+        self.__watcher.check()
+        self.__root_locale = config.root_locale
+        self.__language_codes = set(config.dictionaries)
+        self.__socket_path = socket_path
+        self.__lock = threading.Lock()
+        self.__server = None
+
+    def __dump_findings(
+        self, findings: Dict[str, List[FluentFinding]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        The function converts findings to JSON objects.
+        """
+        return {
+            language_code: [finding.model_dump(mode="json") for finding in items]
+            for language_code, items in findings.items()
+        }
+
+    def __get_language_code(self, request: Dict[str, Any]) -> str:
+        """
+        The function returns the language code of a request, which must be one of the configuration.
+        """
+        language_code: Any = request.get("language_code")
+
+        if not isinstance(language_code, str) or (
+            language_code not in self.__language_codes
+        ):
+            raise FluentDaemonError(f"Unknown language code {language_code}")
+
+        return language_code
+
+    def __get_affected_findings(
+        self, language_code: str
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function returns the findings of the dictionaries affected by a dictionary: every other
+        dictionary for the root dictionary, the dictionary itself otherwise.
+        """
+        findings: Dict[str, List[FluentFinding]] = self.__watcher.get_findings()
+
+        if language_code == self.__root_locale:
+            return findings
+
+        return {language_code: findings[language_code]}
+
+    def __get_path(self, request: Dict[str, Any]) -> Optional[str]:
+        """
+        The function returns the path of the file of a request, if it has one.
+        """
+        path: Any = request.get("path")
+
+        if path is not None and not isinstance(path, str):
+            raise FluentDaemonError("The path must be a string")
+
+        return path
+
+    def __check(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        language_code: str = self.__get_language_code(request)
+        path: Optional[str] = self.__get_path(request)
+        source: Any = request.get("source")
+
+        if source is not None:
+            if not isinstance(source, str):
+                raise FluentDaemonError("The source must be a string")
+
+            self.__watcher.set_overlay(
+                language_code=language_code, source=source, path=path
+            )
+
+        return {
+            "findings": self.__dump_findings(
+                self.__get_affected_findings(language_code)
+            )
+        }
+
+    def __close(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        language_code: str = self.__get_language_code(request)
+        self.__watcher.remove_overlay(
+            language_code=language_code, path=self.__get_path(request)
+        )
+
+        return {
+            "findings": self.__dump_findings(
+                self.__get_affected_findings(language_code)
+            )
+        }
+
+    def __missing(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        language_code: str = self.__get_language_code(request)
+
+        return {
+            "messages": [
+                finding.message_name
+                for finding in self.__watcher.get_findings().get(language_code, [])
+                if finding.finding_type == FluentFindingTypes.MISSING_MESSAGE
+            ]
+        }
+
+    def __findings(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {"findings": self.__dump_findings(self.__watcher.get_findings())}
+
+    def __shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if self.__server:
+            threading.Thread(target=self.__server.shutdown).start()
+
+        return {}
+
+    def handle_request(self, line: bytes) -> Dict[str, Any]:
+        """
+        The function answers a request after loading the dictionary files that changed.
+
+        :param line: The `line` parameter is the request, a JSON object
+        :type line: bytes
+        :return: the response.
+        """
+        commands: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "check": self.__check,
+            "close": self.__close,
+            "missing": self.__missing,
+            "findings": self.__findings,
+            "shutdown": self.__shutdown,
+        }
+
+        try:
+            request: Any = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "The request is not valid JSON"}
+
+        try:
+            if not isinstance(request, dict) or request.get("command") not in commands:
+                raise FluentDaemonError("Unknown command")
+
+            with self.__lock:
+                if changed_language_codes := self.__watcher.poll():
+                    self.__watcher.update(language_codes=changed_language_codes)
+
+                return {"ok": True, **commands[request["command"]](request)}
+        except (FluentDaemonError, OSError, UnicodeDecodeError, ValueError) as error:
+            # A file may be unreadable for a moment, e.g. while an editor saves it: the error is
+            # returned, and the file is loaded again after its next change.
+            return {"ok": False, "error": str(error)}
+
+    def serve(self) -> None:
+        """
+        The function listens on the socket and answers the requests until a `shutdown` request or Ctrl+C.
+        A socket left by a daemon that did not stop properly is replaced.
+        """
+        if os.path.exists(self.__socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                try:
+                    connection.connect(self.__socket_path)
+                except OSError:
+                    os.remove(self.__socket_path)
+                else:
+                    raise FluentDaemonError(
+                        f"A daemon is already listening on {self.__socket_path}"
+                    )
+
+        if os.path.dirname(self.__socket_path):
+            os.makedirs(os.path.dirname(self.__socket_path), exist_ok=True)
+
+        self.__server = _FluentDaemonServer(self.__socket_path, _FluentDaemonHandler)
+        self.__server.fluent_daemon = self
+
+        cprint(f"ℹ Listening on {self.__socket_path}, press Ctrl+C to stop", "yellow")
+
+        try:
+            self.__server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.__server.server_close()
+            os.remove(self.__socket_path)
+
+
+class FluentDaemonClient:
+    """
+    Sends requests to a `FluentDaemon` over one connection to its socket.
+    """
+
+    __socket_path: str
+    __timeout: Optional[float]
+    __connection: Optional[socket.socket]
+    __file: Optional[BinaryIO]
+
+    def __init__(
+        self, socket_path: str = DAEMON_SOCKET_PATH, timeout: Optional[float] = None
+    ) -> None:
+        """
+        The function initializes a client, which connects on its first request.
+
+        :param socket_path: The `socket_path` parameter is the path of the socket of the daemon
+        :type socket_path: str
+        :param timeout: The `timeout` parameter is the maximum number of seconds to wait for a response
+        :type timeout: Optional[float]
+        """
+        self.__socket_path = socket_path
+        self.__timeout = timeout
+        self.__connection = None
+        self.__file = None
+
+    def __enter__(self) -> "FluentDaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def request(self, command: str, **parameters: Any) -> Dict[str, Any]:
+        """
+        The function sends a request to the daemon and waits for its response.
+
+        :param command: The `command` parameter is the command of the request, see `FluentDaemon`
+        :type command: str
+        :return: the response.
+        :raises FluentDaemonError: if the daemon could not handle the request.
+        """
+        if self.__connection is None:
+            self.__connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__connection.settimeout(self.__timeout)
+            self.__connection.connect(self.__socket_path)
+            self.__file = self.__connection.makefile("rb")
+
+        self.__connection.sendall(
+            json.dumps({"command": command, **parameters}).encode("utf-8") + b"\n"
+        )
+        line: bytes = self.__file.readline()
+
+        if not line:
+            self.close()
+            raise FluentDaemonError("The daemon closed the connection")
+
+        response: Dict[str, Any] = json.loads(line)
+
+        if not response["ok"]:
+            raise FluentDaemonError(response["error"])
+
+        return response
+
+    def __load_findings(
+        self, response: Dict[str, Any]
+    ) -> Dict[str, List[FluentFinding]]:
+        return {
+            language_code: [FluentFinding(**finding) for finding in findings]
+            for language_code, findings in response["findings"].items()
+        }
+
+    def check(
+        self,
+        language_code: str,
+        source: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function checks a dictionary, with the contents of an unsaved buffer if `source` is provided.
+
+        :param language_code: The `language_code` parameter is the code of the language of the dictionary
+        :type language_code: str
+        :param source: The `source` parameter is the contents of the buffer, the whole file
+        :type source: Optional[str]
+        :param path: The `path` parameter is the path of the file of the buffer, required when the
+        dictionary is a directory or a glob pattern
+        :type path: Optional[str]
+        :return: a dictionary that maps the language codes of the affected dictionaries to their findings:
+        every other dictionary for the root dictionary, the dictionary itself otherwise.
+        """
+        parameters: Dict[str, Any] = {"language_code": language_code}
+
+        if source is not None:
+            parameters["source"] = source
+
+        if path is not None:
+            parameters["path"] = path
+
+        return self.__load_findings(self.request("check", **parameters))
+
+    def close_buffer(
+        self, language_code: str, path: Optional[str] = None
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function drops the buffer of a file of a dictionary, which is then checked again.
+
+        :param path: The `path` parameter is the path of the file of the buffer, see `check`
+        :type path: Optional[str]
+        :return: the findings of the affected dictionaries, see `check`.
+        """
+        parameters: Dict[str, Any] = {"language_code": language_code}
+
+        if path is not None:
+            parameters["path"] = path
+
+        return self.__load_findings(self.request("close", **parameters))
+
+    def get_missing_messages(self, language_code: str) -> List[str]:
+        """
+        The function lists the messages of the root dictionary missing from a dictionary.
+        """
+        return self.request("missing", language_code=language_code)["messages"]
+
+    def get_findings(self) -> Dict[str, List[FluentFinding]]:
+        """
+        The function returns the findings of every dictionary.
+        """
+        return self.__load_findings(self.request("findings"))
+
+    def shutdown(self) -> None:
+        """
+        The function stops the daemon.
+        """
+        self.request("shutdown")
+        self.close()
+
+    def close(self) -> None:
+        """
+        The function closes the connection to the daemon.
+        """
+        if self.__connection is not None:
+            self.__file.close()
+            self.__connection.close()
+            self.__connection = None
+            self.__file = None
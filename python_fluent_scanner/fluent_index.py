@@ -0,0 +1,356 @@
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from python_fluent_scanner.fluent_comparator import FluentComparator, MessageSignature
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import (
+    VARIABLE_TYPES,
+    CompactDictionary,
+    CompactFileStamp,
+    CompactIndex,
+)
+from python_fluent_scanner.types.models import ScannerConfig
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.discovery import find_dictionary_files
+from python_fluent_scanner.utils.run_stamp import RACY_STAT_WINDOW_NS
+from python_fluent_scanner.utils.shared_cache import SharedCache
+from python_fluent_scanner.utils.timings import span
+
+# The stamps of the files of a dictionary, `None` if they cannot prove that the files did not change.
+FileStamps = Optional[Tuple[CompactFileStamp, ...]]
+
+
+def get_file_stamps(path: str) -> FileStamps:
+    """
+    The function stamps the files of a dictionary with their size and mtime.
+
+    :param path: The `path` parameter is the path of the dictionary in the configuration
+    :type path: str
+    :return: the stamps of the files, or `None` if a file is missing or was modified too recently for
+    its size and mtime to prove later that it did not change.
+    """
+    stamps: List[CompactFileStamp] = []
+    read_at_ns: int = time.time_ns()
+
+    for file_path in find_dictionary_files(path):
+        try:
+            stat: os.stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+
+        if read_at_ns - stat.st_mtime_ns <= RACY_STAT_WINDOW_NS:
+            return None
+
+        stamps.append((file_path, stat.st_size, stat.st_mtime_ns))
+
+    return tuple(stamps)
+
+
+class FluentIndex:
+    """
+    An inverted index of the dictionaries of a configuration, which answers in constant time which
+    locales define or miss a message, which messages use a variable and which messages have the same
+    placeables as a message, instead of walking the messages of every locale.
+
+    The index is saved in the cache folder and updated with the messages that changed only: the locales
+    whose files did not change since they were indexed are not read again.
+    """
+
+    __index: CompactIndex
+    __bits: Dict[str, int]
+
+    def __init__(
+        self, language_codes: List[str], index: Optional[CompactIndex] = None
+    ) -> None:
+        """
+        The function initializes an index.
+
+        :param language_codes: The `language_codes` parameter is the list of the language codes of the
+        configuration
+        :type language_codes: List[str]
+        :param index: The `index` parameter is a saved index, which is discarded if it was built for
+        other language codes
+        :type index: Optional[CompactIndex]
+        """
+        if index is None or index.language_codes != list(language_codes):
+            index = CompactIndex(
+                language_codes=list(language_codes),
+                stamps={},
+                fingerprints={},
+                signatures={},
+                message_locales={},
+                variable_messages={},
+                signature_messages={},
+            )
+
+        self.__index = index
+        self.__bits = {
+            language_code: 1 << position
+            for position, language_code in enumerate(index.language_codes)
+        }
+
+    @classmethod
+    def load(cls, language_codes: List[str], cache: ScannerCache) -> "FluentIndex":
+        """
+        The function loads the index saved in the cache, or creates an empty index if there is none.
+
+        :param language_codes: The `language_codes` parameter is the list of the language codes of the
+        configuration
+        :type language_codes: List[str]
+        :param cache: The `cache` parameter is the cache holding the index
+        :type cache: ScannerCache
+        :return: the index.
+        """
+        return cls(language_codes=language_codes, index=cache.get_index())
+
+    def save(self, cache: ScannerCache) -> None:
+        """
+        The function saves the index in the cache.
+        """
+        cache.set_index(self.__index)
+
+    def get_stale_locales(self, paths: Dict[str, str]) -> Dict[str, FileStamps]:
+        """
+        The function finds the locales whose files changed since they were indexed.
+
+        :param paths: The `paths` parameter maps the language codes to the paths of their dictionaries
+        :type paths: Dict[str, str]
+        :return: a dictionary that maps the language codes of the locales to update to the current
+        stamps of their files, see `update`.
+        """
+        stale_locales: Dict[str, FileStamps] = {}
+
+        for language_code, path in paths.items():
+            stamps: FileStamps = get_file_stamps(path)
+
+            if stamps is None or self.__index.stamps.get(language_code) != stamps:
+                stale_locales[language_code] = stamps
+
+        return stale_locales
+
+    def __clear_bit(self, bitsets: Dict[str, int], key: str, bit: int) -> None:
+        """
+        The function removes a locale from a bitset, and the bitset if it has no locale left.
+        """
+        locales: int = bitsets[key] & ~bit
+
+        if locales:
+            bitsets[key] = locales
+        else:
+            del bitsets[key]
+
+    def __add_message(
+        self, message_name: str, fingerprint: str, signature: MessageSignature, bit: int
+    ) -> None:
+        """
+        The function adds a message of a locale to the index.
+        """
+        index: CompactIndex = self.__index
+        index.message_locales[message_name] = (
+            index.message_locales.get(message_name, 0) | bit
+        )
+        index.signatures.setdefault(fingerprint, signature)
+
+        messages: Dict[str, int] = index.signature_messages.setdefault(fingerprint, {})
+        messages[message_name] = messages.get(message_name, 0) | bit
+
+        for placeable_name, code in signature:
+            if code in VARIABLE_TYPES:
+                messages = index.variable_messages.setdefault(placeable_name, {})
+                messages[message_name] = messages.get(message_name, 0) | bit
+
+    def __remove_message(self, message_name: str, fingerprint: str, bit: int) -> None:
+        """
+        The function removes a message of a locale from the index.
+        """
+        index: CompactIndex = self.__index
+        self.__clear_bit(index.message_locales, message_name, bit)
+
+        signature: MessageSignature = index.signatures[fingerprint]
+        self.__clear_bit(index.signature_messages[fingerprint], message_name, bit)
+
+        if not index.signature_messages[fingerprint]:
+            del index.signature_messages[fingerprint]
+            del index.signatures[fingerprint]
+
+        for placeable_name, code in signature:
+            if code in VARIABLE_TYPES:
+                self.__clear_bit(
+                    index.variable_messages[placeable_name], message_name, bit
+                )
+
+                if not index.variable_messages[placeable_name]:
+                    del index.variable_messages[placeable_name]
+
+    def update(self, dictionary: CompactDictionary, stamps: FileStamps = None) -> None:
+        """
+        The function indexes the current messages of a locale. Only the messages that were added,
+        removed or whose placeables changed since the locale was last indexed are updated.
+
+        :param dictionary: The `dictionary` parameter is the dictionary of the locale
+        :type dictionary: CompactDictionary
+        :param stamps: The `stamps` parameter is the stamps of the files the dictionary was read from,
+        see `get_stale_locales`
+        :type stamps: FileStamps
+        """
+        language_code: str = dictionary.language_code
+        bit: int = self.__bits[language_code]
+        comparator: FluentComparator = FluentComparator()
+        signatures: Dict[str, MessageSignature] = comparator.get_signatures(dictionary)
+
+        # Most messages share a few signatures, whose fingerprints are only computed once.
+        signature_fingerprints: Dict[MessageSignature, str] = {}
+        fingerprints: Dict[str, str] = {}
+
+        for message_name, signature in signatures.items():
+            fingerprint: Optional[str] = signature_fingerprints.get(signature)
+
+            if fingerprint is None:
+                fingerprint = signature_fingerprints[signature] = sys.intern(
+                    comparator.get_fingerprints({message_name: signature})[message_name]
+                )
+
+            fingerprints[message_name] = fingerprint
+
+        indexed_fingerprints: Dict[str, str] = self.__index.fingerprints.get(
+            language_code, {}
+        )
+
+        for message_name, fingerprint in indexed_fingerprints.items():
+            if fingerprints.get(message_name) != fingerprint:
+                self.__remove_message(message_name, fingerprint, bit)
+
+        for message_name, fingerprint in fingerprints.items():
+            if indexed_fingerprints.get(message_name) != fingerprint:
+                self.__add_message(
+                    message_name, fingerprint, signatures[message_name], bit
+                )
+
+        self.__index.fingerprints[language_code] = fingerprints
+        self.__index.stamps[language_code] = stamps
+
+    def __get_language_codes(self, locales: int) -> List[str]:
+        """
+        The function returns the language codes of the locales of a bitset, in the order of the
+        configuration.
+        """
+        return [
+            language_code for language_code, bit in self.__bits.items() if locales & bit
+        ]
+
+    def __get_messages(self, messages: Dict[str, int]) -> Dict[str, List[str]]:
+        """
+        The function returns the language codes of the locales of the bitsets of messages.
+        """
+        return {
+            message_name: self.__get_language_codes(locales)
+            for message_name, locales in messages.items()
+        }
+
+    def get_language_codes(self) -> List[str]:
+        """
+        The function returns the language codes of the index, in the order of the configuration.
+        """
+        return list(self.__index.language_codes)
+
+    def get_locales(self, message_name: str) -> List[str]:
+        """
+        The function returns the language codes of the locales that define a message.
+        """
+        return self.__get_language_codes(
+            self.__index.message_locales.get(message_name, 0)
+        )
+
+    def get_missing_locales(self, message_name: str) -> List[str]:
+        """
+        The function returns the language codes of the locales that do not define a message.
+        """
+        return self.__get_language_codes(
+            ~self.__index.message_locales.get(message_name, 0)
+        )
+
+    def get_variable_messages(self, variable_name: str) -> Dict[str, List[str]]:
+        """
+        The function finds the messages that use a variable in any locale.
+
+        :param variable_name: The `variable_name` parameter is the name of the variable, without `$`
+        :type variable_name: str
+        :return: a dictionary that maps the names of the messages to the language codes of the locales in
+        which they use the variable.
+        """
+        return self.__get_messages(
+            self.__index.variable_messages.get(variable_name, {})
+        )
+
+    def get_fingerprint(self, message_name: str, language_code: str) -> Optional[str]:
+        """
+        The function returns the fingerprint of the signature of a message in a locale, `None` if the
+        locale does not define the message.
+        """
+        return self.__index.fingerprints.get(language_code, {}).get(message_name)
+
+    def get_signature_messages(
+        self, message_name: str, language_code: str
+    ) -> Dict[str, List[str]]:
+        """
+        The function finds the messages with the same placeables, of the same types, as a message in a
+        locale.
+
+        :param message_name: The `message_name` parameter is the name of the message
+        :type message_name: str
+        :param language_code: The `language_code` parameter is the code of the language of the message
+        :type language_code: str
+        :return: a dictionary that maps the names of the messages, the message itself included, to the
+        language codes of the locales in which they have these placeables; empty if the locale does not
+        define the message.
+        """
+        fingerprint: Optional[str] = self.get_fingerprint(message_name, language_code)
+
+        if fingerprint is None:
+            return {}
+
+        return self.__get_messages(self.__index.signature_messages[fingerprint])
+
+
+def get_index(config: ScannerConfig, jobs: int = 1) -> FluentIndex:
+    """
+    The function loads the index of the dictionaries of a configuration, after updating the locales
+    whose files changed since they were indexed, which are read through the parse cache.
+
+    :param config: The `config` parameter is the configuration of the scanner
+    :type config: ScannerConfig
+    :param jobs: The `jobs` parameter is the maximum number of processes used to parse dictionaries
+    :type jobs: int
+    :return: the up-to-date index.
+    """
+    cache: ScannerCache = ScannerCache()
+    index: FluentIndex = FluentIndex.load(
+        language_codes=list(config.dictionaries), cache=cache
+    )
+    stale_locales: Dict[str, FileStamps] = index.get_stale_locales(
+        paths=config.dictionaries
+    )
+
+    if stale_locales:
+        reader: FluentReader = FluentReader(
+            cache=cache,
+            jobs=jobs,
+            backend=config.reader,
+            stream_min_bytes=config.stream_min_bytes,
+            shared_cache=SharedCache() if config.shared_cache else None,
+        )
+
+        for language_code, (dictionary, _) in reader.read_by_paths(
+            paths={
+                language_code: config.dictionaries[language_code]
+                for language_code in stale_locales
+            }
+        ).items():
+            with span(f"index {language_code}"):
+                index.update(dictionary=dictionary, stamps=stale_locales[language_code])
+
+        index.save(cache)
+
+    return index
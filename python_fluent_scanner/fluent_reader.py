@@ -1,18 +1,99 @@
+import hashlib
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from fluent.syntax import parse
 from fluent.syntax import ast
 from fluent.syntax.errors import ParseError
-from typing import Dict
-
-from termcolor import cprint, colored
-from python_fluent_scanner.types.enums import FluentPlaceableTypes
-from python_fluent_scanner.types.models import (
-    ScannerConfig,
-    FluentDictionary,
-    FluentMessage,
-    FluentPlaceable,
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from termcolor import cprint
+from python_fluent_scanner.fluent_reporter import FluentTextReporter
+from python_fluent_scanner.fluent_tokenizer import FluentTokenizer, FluentTokenizerError
+from python_fluent_scanner.types.compact import (
+    ATTRIBUTE,
+    FUNCTION,
+    MESSAGE_REFERENCE,
+    SELECT_EXPRESSION,
+    TERM_REFERENCE,
+    VARIABLE,
+    CompactCacheEntry,
+    CompactDictionary,
+    CompactDuplicate,
+    CompactLocaleEntry,
+    CompactPlaceables,
+    make_placeables,
+)
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import ScannerConfig, FluentFileStamp
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.discovery import find_dictionary_files, is_dictionary_pattern
+from python_fluent_scanner.utils.run_stamp import RACY_STAT_WINDOW_NS
+from python_fluent_scanner.utils.shared_cache import SharedCache
+from python_fluent_scanner.utils.timings import span
+from python_fluent_scanner.utils.stream import (
+    STREAM_MIN_BYTES,
+    hash_content,
+    iter_entry_chunks,
 )
 
+# Parsing less than this many bytes is faster in the current process than starting a process pool.
+PARALLEL_PARSE_MIN_BYTES: int = 256 * 1024
+
+# A file of a locale is identified by the language code of the locale and the path of the file.
+FileKey = Tuple[str, str]
+
+
+class _StaleCacheError(Exception):
+    """
+    The error raised when files must be parsed again while the rebuild lock of the cache is not held.
+    """
+
+
 class FluentReader:
+    __cache: Optional[ScannerCache]
+    __jobs: int
+    __backend: FluentReaderBackends
+    __stream_min_bytes: int
+    __shared_cache: Optional[SharedCache]
+    __is_rebuilding: bool
+
+    def __init__(
+        self,
+        cache: Optional[ScannerCache] = None,
+        jobs: int = 1,
+        backend: FluentReaderBackends = FluentReaderBackends.AST,
+        stream_min_bytes: int = STREAM_MIN_BYTES,
+        shared_cache: Optional[SharedCache] = None,
+    ) -> None:
+        """
+        The function initializes a reader with an optional parse cache.
+
+        :param cache: The `cache` parameter is an optional `ScannerCache`; when provided, files whose
+        content did not change since the last run are loaded from it instead of being parsed again
+        :type cache: Optional[ScannerCache]
+        :param jobs: The `jobs` parameter is the maximum number of processes used to parse files
+        :type jobs: int
+        :param backend: The `backend` parameter selects how messages are extracted: `AST` parses files
+        with `fluent.syntax`, `FAST` uses `FluentTokenizer` and falls back to `AST` for the files it
+        cannot handle
+        :type backend: FluentReaderBackends
+        :param stream_min_bytes: The `stream_min_bytes` parameter is the size from which files are
+        memory-mapped and parsed chunk by chunk, so that the memory used does not grow with their size
+        :type stream_min_bytes: int
+        :param shared_cache: The `shared_cache` parameter is an optional `SharedCache`; when provided,
+        files whose content was already parsed by any project are loaded from it instead of being parsed
+        :type shared_cache: Optional[SharedCache]
+        """
+        self.__cache = cache
+        self.__jobs = jobs
+        self.__backend = backend
+        self.__stream_min_bytes = stream_min_bytes
+        self.__shared_cache = shared_cache
+        self.__is_rebuilding = False
+
     def __is_comment(self, entry: ast.Entry) -> bool:
         """
         The function checks if an entry is a comment in an abstract syntax tree.
@@ -31,68 +112,791 @@ class FluentReader:
             ),
         )
 
-    def __get_entry_placeables(self, entry: ast.Entry) -> Dict[str, FluentPlaceable]:
+    def __get_entry_placeables(self, entry: ast.Message) -> CompactPlaceables:
         """
-        The function `__get_entry_placeables` extracts placeables from an AST entry object in a Fluent file
-        and returns them as a list of strings.
+        The function `__get_entry_placeables` extracts the placeables of a message in the order of the
+        source: the variables, function calls and message and term references found anywhere in its value
+        and its attributes (inside select expressions, their variants, call arguments and nested
+        placeables), and the attributes themselves. A variable used as the selector of a select expression
+        anywhere in the message has the `SELECT_EXPRESSION` type.
+
+        The tree is walked with an explicit stack rather than a generic visitor, which would call a method
+        per node, since messages are numerous.
+
+        :param entry: The `entry` parameter is the message to extract the placeables of
+        :type entry: ast.Message
+        :return: a tuple of the (name, type code) pairs of the placeables.
         """
+        placeables: Dict[str, int] = {}
+        patterns: List[Tuple[Optional[str], Optional[ast.Pattern]]] = [(None, entry.value)]
+        patterns.extend(
+            (f".{attribute.id.name}", attribute.value) for attribute in entry.attributes
+        )
+
+        for attribute_name, pattern in patterns:
+            if attribute_name is not None:
+                placeables[attribute_name] = ATTRIBUTE
+
+            if pattern is None:
+                continue
+
+            stack: List[ast.SyntaxNode] = pattern.elements[::-1]
+
+            while stack:
+                node: ast.SyntaxNode = stack.pop()
+                node_type: type = type(node)
 
-        placeables: Dict[str, FluentPlaceable] = {}
+                if node_type is ast.TextElement:
+                    continue
 
-        for value in entry.value.elements:
-            if isinstance(value, ast.Placeable):
-                if isinstance(value.expression, ast.SelectExpression):
-                    placeables[value.expression.selector.id.name] = FluentPlaceable(
-                        placeable_type=FluentPlaceableTypes.SELECT_EXPRESSION,
+                if node_type is ast.Placeable:
+                    stack.append(node.expression)
+                elif node_type is ast.VariableReference:
+                    if node.id.name not in placeables:
+                        placeables[node.id.name] = VARIABLE
+                elif node_type is ast.SelectExpression:
+                    for variant in reversed(node.variants):
+                        stack.extend(variant.value.elements[::-1])
+
+                    if type(node.selector) is ast.VariableReference:
+                        placeables[node.selector.id.name] = SELECT_EXPRESSION
+                    else:
+                        stack.append(node.selector)
+                elif node_type is ast.FunctionReference:
+                    placeables.setdefault(f"{node.id.name}()", FUNCTION)
+                    stack.extend(node.arguments.positional[::-1])
+                elif node_type is ast.MessageReference:
+                    placeables.setdefault(
+                        f"{node.id.name}.{node.attribute.name}"
+                        if node.attribute
+                        else node.id.name,
+                        MESSAGE_REFERENCE,
                     )
-                elif isinstance(value.expression, ast.VariableReference):
-                    placeables[value.expression.id.name] = FluentPlaceable(
-                        placeable_type=FluentPlaceableTypes.VARIABLE,
+                elif node_type is ast.TermReference:
+                    placeables.setdefault(
+                        f"-{node.id.name}.{node.attribute.name}"
+                        if node.attribute
+                        else f"-{node.id.name}",
+                        TERM_REFERENCE,
                     )
-                else:
+
+                    if node.arguments:
+                        stack.extend(node.arguments.positional[::-1])
+                elif node_type is not ast.StringLiteral and node_type is not ast.NumberLiteral:
                     raise ValueError("Unknown placeable type")
 
-        return placeables
+        return make_placeables(placeables)
 
-    def parse_by_file(self, path: str, language_code: str) -> FluentDictionary:
-        """
-        The `parse_by_file` function takes a file path and a language code as input, reads the file, parses
-        its contents using the Fluent library, and returns a FluentDictionary object containing the parsed
-        messages from the file.
+    def __parse_chunk(
+        self,
+        source: str,
+        messages: Dict[str, CompactPlaceables],
+        duplicates: List[str],
+        path: str,
+        language_code: str,
+        is_last: bool = True,
+    ) -> str:
         """
+        The `__parse_chunk` function parses the contents of a Fluent file, or a chunk of it, and adds its
+        messages to `messages` and the names of the messages defined again to `duplicates`. As in the
+        Fluent runtime, the first definition of a message is kept, in a file as across the files of a
+        dictionary.
 
-        with open(path, "r", encoding="utf-8") as file:
+        :param is_last: The `is_last` parameter is False when more chunks of the file follow; an entry
+        that cannot be parsed at the end of the chunk may then continue in the next chunk
+        :type is_last: bool
+        :return: the end of the chunk that must be parsed again with the next chunk, if any.
+        """
+        if self.__backend == FluentReaderBackends.FAST:
             try:
-                resource = parse(file.read())
-            except ParseError:
-                cprint(f"An error occurred while parsing {language_code} from {path}")
+                chunk_messages, chunk_duplicates = FluentTokenizer().parse(
+                    source, defined=messages
+                )
+                messages.update(chunk_messages)
+                duplicates.extend(chunk_duplicates)
+
+                return ""
+            except FluentTokenizerError:
+                pass
+
+        try:
+            resource = parse(source)
+        except ParseError:
+            cprint(f"An error occurred while parsing {language_code} from {path}")
 
-        messages: Dict[str, FluentMessage] = {}
+        rest: str = ""
+
+        if not is_last and resource.body and isinstance(resource.body[-1], ast.Junk):
+            rest = source[resource.body[-1].span.start :]
 
         for entry in resource.body:
             if isinstance(entry, ast.Message):
-                if messages.get(entry.id.name):
-                    print(colored(f"DICT({language_code}):", "blue"), f"Found duplicate for {entry.id.name}")
+                if entry.id.name in messages:
+                    duplicates.append(entry.id.name)
+                else:
+                    messages[sys.intern(entry.id.name)] = self.__get_entry_placeables(
+                        entry=entry
+                    )
+
+        return rest
+
+    def __parse_source(
+        self, source: str, path: str, language_code: str
+    ) -> Tuple[CompactDictionary, List[str]]:
+        """
+        The `__parse_source` function parses the contents of a Fluent file and extracts its messages.
+
+        :return: a tuple of the CompactDictionary with the parsed messages and the list of message names
+        that were defined more than once.
+        """
+        messages: Dict[str, CompactPlaceables] = {}
+        duplicates: List[str] = []
+
+        self.__parse_chunk(
+            source=source,
+            messages=messages,
+            duplicates=duplicates,
+            path=path,
+            language_code=language_code,
+        )
+
+        return (
+            CompactDictionary(language_code=language_code, path=path, messages=messages),
+            duplicates,
+        )
+
+    def __parse_stream(
+        self, content: mmap.mmap, path: str, language_code: str
+    ) -> Tuple[CompactDictionary, List[str]]:
+        """
+        The `__parse_stream` function parses a memory-mapped Fluent file chunk by chunk, each chunk ending
+        before a top-level entry, so that only one chunk and its AST are in memory at a time. It extracts
+        the same messages and duplicates as `__parse_source` on the whole file.
+
+        :return: a tuple of the CompactDictionary with the parsed messages and the list of message names
+        that were defined more than once.
+        """
+        messages: Dict[str, CompactPlaceables] = {}
+        duplicates: List[str] = []
+        rest: str = ""
+
+        for chunk in iter_entry_chunks(content):
+            rest = self.__parse_chunk(
+                source=rest + chunk,
+                messages=messages,
+                duplicates=duplicates,
+                path=path,
+                language_code=language_code,
+                is_last=False,
+            )
+
+        if rest:
+            self.__parse_chunk(
+                source=rest,
+                messages=messages,
+                duplicates=duplicates,
+                path=path,
+                language_code=language_code,
+            )
+
+        return (
+            CompactDictionary(language_code=language_code, path=path, messages=messages),
+            duplicates,
+        )
+
+    def read_file_entry(
+        self, path: str, language_code: str, cached_content_hash: Optional[str] = None
+    ) -> Union[FluentFileStamp, CompactCacheEntry]:
+        """
+        The `read_file_entry` function reads a file, stamps it and parses it unless its content hash
+        equals `cached_content_hash`.
+
+        :param path: The `path` parameter is the path of the Fluent file
+        :type path: str
+        :param language_code: The `language_code` parameter is the code of the language of the file
+        :type language_code: str
+        :param cached_content_hash: The `cached_content_hash` parameter is the content hash of the cached
+        entry of the file, if there is one
+        :type cached_content_hash: Optional[str]
+        :return: only the new `FluentFileStamp` when the content did not change, otherwise a new
+        `CompactCacheEntry` with the parsed dictionary, or the dictionary of the shared cache if the
+        content is in it.
+        """
+        stat: os.stat_result = os.stat(path)
+        read_at_ns: int = time.time_ns()
+        stamp: FluentFileStamp = FluentFileStamp(
+            path=path,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            is_stat_reliable=read_at_ns - stat.st_mtime_ns > RACY_STAT_WINDOW_NS,
+            content_hash="",
+        )
+
+        with open(path, "rb") as file:
+            if stat.st_size and stat.st_size >= self.__stream_min_bytes:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    stamp.content_hash = hash_content(mapped)
+
+                    if stamp.content_hash == cached_content_hash:
+                        return stamp
+
+                    if shared_entry := self.__get_shared_entry(
+                        stamp=stamp, language_code=language_code
+                    ):
+                        return shared_entry
+
+                    dictionary, duplicates = self.__parse_stream(
+                        content=mapped, path=path, language_code=language_code
+                    )
+            else:
+                content: bytes = file.read()
+                stamp.content_hash = hashlib.sha256(content).hexdigest()
+
+                if stamp.content_hash == cached_content_hash:
+                    return stamp
+
+                if shared_entry := self.__get_shared_entry(
+                    stamp=stamp, language_code=language_code
+                ):
+                    return shared_entry
 
-                messages[entry.id.name] = FluentMessage(
-                    placeables=self.__get_entry_placeables(entry=entry),
+                dictionary, duplicates = self.__parse_source(
+                    source=content.decode("utf-8"), path=path, language_code=language_code
                 )
 
-        return FluentDictionary(
-            language_code=language_code, path=path, messages=messages
+        entry: CompactCacheEntry = CompactCacheEntry(
+            stamp=stamp, duplicates=duplicates, dictionary=dictionary
         )
 
-    def parse_by_config(self, config: ScannerConfig) -> Dict[str, FluentDictionary]:
+        if self.__shared_cache:
+            self.__shared_cache.set(entry=entry, backend=self.__backend)
+
+        return entry
+
+    def __get_shared_entry(
+        self, stamp: FluentFileStamp, language_code: str
+    ) -> Optional[CompactCacheEntry]:
         """
-        The `parse_by_config` function parses multiple Fluent dictionaries based on a given configuration.
+        The `__get_shared_entry` function looks up the content hash of a file in the shared cache.
+        """
+        if not self.__shared_cache:
+            return None
+
+        return self.__shared_cache.get(
+            stamp=stamp, language_code=language_code, backend=self.__backend
+        )
+
+    def __is_stamp_up_to_date(self, stamp: FluentFileStamp, path: str) -> bool:
+        """
+        The `__is_stamp_up_to_date` function checks whether the size and mtime of a file prove that it did
+        not change since it was stamped, so the file does not even need to be read.
         """
+        try:
+            stat: os.stat_result = os.stat(path)
+        except FileNotFoundError:
+            return False
+
+        return (
+            stamp.is_stat_reliable
+            and stamp.size == stat.st_size
+            and stamp.mtime_ns == stat.st_mtime_ns
+        )
 
-        dictionaries: Dict[str, FluentDictionary] = {}
+    def __get_cached_entry(
+        self, path: str, language_code: str
+    ) -> Tuple[Optional[CompactCacheEntry], bool]:
+        """
+        The `__get_cached_entry` function looks up the parse cache entry of a file.
 
-        for language_code in config.dictionaries:
-            path: str = config.dictionaries[language_code]
-            dictionaries[language_code] = self.parse_by_file(
+        :return: a tuple of the cached entry (or `None`) and a boolean that is True when the size and
+        mtime of the file prove that the entry is still up to date, so the file does not even need to be
+        read.
+        """
+        if not self.__cache:
+            return None, False
+
+        entry: Optional[CompactCacheEntry] = self.__cache.get_entry(
+            language_code=language_code, path=path, backend=self.__backend
+        )
+
+        if not entry or entry.stamp.path != path:
+            return None, False
+
+        return entry, self.__is_stamp_up_to_date(stamp=entry.stamp, path=path)
+
+    def __read_files(
+        self, files: List[FileKey]
+    ) -> Dict[FileKey, CompactCacheEntry]:
+        """
+        The `__read_files` function returns the dictionaries of several files, parsing only the files that
+        are not in the parse cache or whose content changed since they were cached.
+
+        Files are parsed in a process pool when there are several of them and they are large enough
+        to outweigh the cost of starting the pool; only the extracted dictionaries are sent back.
+
+        :param files: The `files` parameter is the list of the (language code, path) pairs of the files
+        :type files: List[FileKey]
+        :return: a dictionary that maps the (language code, path) pairs to their entries, in the order of
+        `files`.
+        """
+        entries: Dict[FileKey, Optional[CompactCacheEntry]] = {}
+        pending: Dict[FileKey, Optional[CompactCacheEntry]] = {}
+
+        for language_code, path in files:
+            entry, is_up_to_date = self.__get_cached_entry(
                 path=path, language_code=language_code
             )
+            entries[language_code, path] = entry if is_up_to_date else None
+
+            if not is_up_to_date:
+                pending[language_code, path] = entry
+
+        if pending and self.__cache and not self.__is_rebuilding:
+            raise _StaleCacheError()
+
+        results: Dict[FileKey, Union[FluentFileStamp, CompactCacheEntry]] = {}
+        pending_size: int = sum(os.path.getsize(path) for _, path in pending)
+
+        if (
+            self.__jobs > 1
+            and len(pending) > 1
+            and pending_size >= PARALLEL_PARSE_MIN_BYTES
+        ):
+            with span("parse (process pool)"), ProcessPoolExecutor(
+                max_workers=min(self.__jobs, len(pending))
+            ) as executor:
+                futures: Dict[FileKey, Future] = {
+                    (language_code, path): executor.submit(
+                        _read_file_entry,
+                        path,
+                        language_code,
+                        entry.stamp.content_hash if entry else None,
+                        self.__backend,
+                        self.__stream_min_bytes,
+                        self.__shared_cache,
+                    )
+                    for (language_code, path), entry in pending.items()
+                }
+                for key, future in futures.items():
+                    results[key] = future.result()
+        else:
+            for (language_code, path), entry in pending.items():
+                with span(f"parse {language_code}"):
+                    results[language_code, path] = self.read_file_entry(
+                        path=path,
+                        language_code=language_code,
+                        cached_content_hash=(
+                            entry.stamp.content_hash if entry else None
+                        ),
+                    )
+
+        for key, result in results.items():
+            if isinstance(result, FluentFileStamp):
+                result = CompactCacheEntry(
+                    stamp=result,
+                    duplicates=pending[key].duplicates,
+                    dictionary=pending[key].dictionary,
+                )
+
+            entries[key] = result
+
+            if self.__cache:
+                self.__cache.set_entry(entry=result, backend=self.__backend)
+
+        return entries
+
+    def __get_stale_files(
+        self, files: List[str], locale_entry: Optional[CompactLocaleEntry]
+    ) -> List[str]:
+        """
+        The `__get_stale_files` function finds the files of a locale that were added or may have changed
+        since the parse cache entry of the locale was saved.
+        """
+        if not locale_entry:
+            return files
+
+        return [
+            path
+            for path in files
+            if path not in locale_entry.stamps
+            or not self.__is_stamp_up_to_date(stamp=locale_entry.stamps[path], path=path)
+        ]
+
+    def __get_affected_files(
+        self,
+        language_code: str,
+        files: List[str],
+        entries: Dict[FileKey, CompactCacheEntry],
+        locale_entry: Optional[CompactLocaleEntry],
+    ) -> List[str]:
+        """
+        The `__get_affected_files` function finds the unchanged files of a locale that define a message
+        also defined, now or before, by a file that changed or was removed: which definition of the
+        message is kept may change, so these files must be merged from their own entries.
+        """
+        if not locale_entry:
+            return []
+
+        affected_names: Set[str] = set()
+        paths: Set[str] = set(files)
+
+        for path in files:
+            if (language_code, path) in entries:
+                affected_names.update(entries[language_code, path].dictionary.messages)
+                affected_names.update(locale_entry.file_messages.get(path, ()))
+
+        for path, message_names in locale_entry.file_messages.items():
+            if path not in paths:
+                affected_names.update(message_names)
+
+        if not affected_names:
+            return []
+
+        return [
+            path
+            for path in files
+            if (language_code, path) not in entries
+            and not affected_names.isdisjoint(locale_entry.file_messages[path])
+        ]
+
+    def __merge_locale(
+        self,
+        language_code: str,
+        path: str,
+        files: List[str],
+        entries: Dict[FileKey, CompactCacheEntry],
+        locale_entry: Optional[CompactLocaleEntry],
+    ) -> CompactLocaleEntry:
+        """
+        The `__merge_locale` function merges the dictionaries of the files of a locale, in the order of the
+        files. The first definition of a message is kept and the others are reported as duplicates.
+
+        The files that were read are merged from their entries, the others from the previous merged
+        dictionary and index of the locale, which are still valid for them, so that a change of one
+        file does not require loading every other file of the locale.
+
+        :return: the new parse cache entry of the locale.
+        """
+        merged: CompactLocaleEntry = CompactLocaleEntry(
+            path=path,
+            stamps={},
+            file_messages={},
+            file_duplicates={},
+            duplicates=[],
+            dictionary=CompactDictionary(
+                language_code=language_code, path=path, messages={}, sources={}
+            ),
+        )
+        messages: Dict[str, CompactPlaceables] = merged.dictionary.messages
+        sources: Dict[str, str] = merged.dictionary.sources
+
+        for file_path in files:
+            entry: Optional[CompactCacheEntry] = entries.get((language_code, file_path))
+
+            if entry:
+                merged.stamps[file_path] = entry.stamp
+                message_names: List[str] = list(entry.dictionary.messages)
+                file_messages: Dict[str, CompactPlaceables] = entry.dictionary.messages
+                duplicates: List[str] = entry.duplicates
+            else:
+                merged.stamps[file_path] = locale_entry.stamps[file_path]
+                message_names = locale_entry.file_messages[file_path]
+                file_messages = locale_entry.dictionary.messages
+                duplicates = locale_entry.file_duplicates[file_path]
+
+            merged.file_messages[file_path] = message_names
+            merged.file_duplicates[file_path] = duplicates
+            merged.duplicates.extend(
+                (message_name, file_path, file_path) for message_name in duplicates
+            )
+
+            for message_name in message_names:
+                if message_name in messages:
+                    merged.duplicates.append((message_name, sources[message_name], file_path))
+                else:
+                    messages[message_name] = file_messages[message_name]
+                    sources[message_name] = file_path
+
+        return merged
+
+    def __print_duplicates(
+        self, language_code: str, path: str, duplicates: List[CompactDuplicate]
+    ) -> None:
+        """
+        The function prints a warning for each message that was defined more than once in a dictionary,
+        with the files of both definitions when the dictionary is split into several files.
+        """
+        FluentTextReporter().report_duplicates(
+            language_code=language_code, path=path, duplicates=duplicates
+        )
+
+    def parse_by_file(self, path: str, language_code: str) -> CompactDictionary:
+        """
+        The `parse_by_file` function takes a file path and a language code as input, reads the file, parses
+        its contents using the Fluent library, and returns a CompactDictionary object containing the parsed
+        messages from the file. Files that did not change since the last run are loaded from the cache.
+        """
+        return self.parse_by_paths(paths={language_code: path})[language_code]
+
+    def read_by_source(
+        self, source: str, language_code: str, path: str = "<memory>"
+    ) -> Tuple[CompactDictionary, List[CompactDuplicate]]:
+        """
+        The `read_by_source` function parses the contents of a Fluent file that is already in memory,
+        without printing anything.
+
+        :param source: The `source` parameter is the contents of the Fluent file
+        :type source: str
+        :param language_code: The `language_code` parameter is the code of the language of the source
+        :type language_code: str
+        :param path: The `path` parameter is the path reported for the source
+        :type path: str
+        :return: a tuple of the CompactDictionary with the parsed messages and its duplicate messages.
+        """
+        dictionary, duplicates = self.__parse_source(
+            source=source, path=path, language_code=language_code
+        )
+
+        return dictionary, [(message_name, path, path) for message_name in duplicates]
+
+    def parse_by_source(
+        self, source: str, language_code: str, path: str = "<memory>"
+    ) -> CompactDictionary:
+        """
+        The `parse_by_source` function parses the contents of a Fluent file that is already in memory and
+        reports its duplicate messages.
+
+        :param source: The `source` parameter is the contents of the Fluent file
+        :type source: str
+        :param language_code: The `language_code` parameter is the code of the language of the source
+        :type language_code: str
+        :param path: The `path` parameter is the path reported for the source
+        :type path: str
+        :return: the CompactDictionary with the parsed messages.
+        """
+        dictionary, duplicates = self.read_by_source(
+            source=source, language_code=language_code, path=path
+        )
+
+        self.__print_duplicates(
+            language_code=language_code, path=path, duplicates=duplicates
+        )
+
+        return dictionary
+
+    def __read_overlay(
+        self, source: str, path: str, language_code: str
+    ) -> CompactCacheEntry:
+        """
+        The `__read_overlay` function parses the unsaved contents of a file into an entry that replaces the
+        entry of the file; it is never cached.
+        """
+        content: bytes = source.encode("utf-8")
+        dictionary, duplicates = self.__parse_source(
+            source=source, path=path, language_code=language_code
+        )
+
+        return CompactCacheEntry(
+            stamp=FluentFileStamp(
+                path=path,
+                size=len(content),
+                mtime_ns=0,
+                is_stat_reliable=False,
+                content_hash=hashlib.sha256(content).hexdigest(),
+            ),
+            duplicates=duplicates,
+            dictionary=dictionary,
+        )
+
+    def read_by_paths(
+        self, paths: Dict[str, str], overlays: Optional[Dict[FileKey, str]] = None
+    ) -> Dict[str, Tuple[CompactDictionary, List[CompactDuplicate]]]:
+        """
+        The `read_by_paths` function parses several dictionaries, one per language code, without printing
+        anything.
+
+        The path of a dictionary is either a Fluent file, or a directory or glob pattern designating
+        several files (see `find_dictionary_files`), which are merged into one dictionary. Only the files
+        that changed since the last run are read again, and the merged dictionary is patched with them.
+        When files changed, they are parsed by one process at a time, so that concurrent runs sharing the
+        cache do not parse the same files.
+
+        :param paths: The `paths` parameter maps language codes to the paths of their dictionaries
+        :type paths: Dict[str, str]
+        :param overlays: The `overlays` parameter maps (language code, path) pairs of files to contents
+        that replace them, e.g. the unsaved buffers of an editor; the dictionaries patched with them are
+        not cached
+        :type overlays: Optional[Dict[FileKey, str]]
+        :return: a dictionary that maps the language codes to the tuples of their parsed dictionaries and
+        their duplicate messages, in the order of `paths`.
+        """
+        overlay_entries: Dict[FileKey, CompactCacheEntry] = {
+            (language_code, path): self.__read_overlay(
+                source=source, path=path, language_code=language_code
+            )
+            for (language_code, path), source in (overlays or {}).items()
+        }
+
+        if not self.__cache:
+            return self.__read_by_paths(paths=paths, overlay_entries=overlay_entries)
+
+        try:
+            return self.__read_by_paths(paths=paths, overlay_entries=overlay_entries)
+        except _StaleCacheError:
+            pass
+
+        # Another process may be parsing the same files: it is waited for, and its entries are reused.
+        with self.__cache.rebuild_lock():
+            self.__is_rebuilding = True
+
+            try:
+                return self.__read_by_paths(paths=paths, overlay_entries=overlay_entries)
+            finally:
+                self.__is_rebuilding = False
+
+    def __read_by_paths(
+        self,
+        paths: Dict[str, str],
+        overlay_entries: Dict[FileKey, CompactCacheEntry],
+    ) -> Dict[str, Tuple[CompactDictionary, List[CompactDuplicate]]]:
+        """
+        The `__read_by_paths` function parses several dictionaries, see `read_by_paths`. It raises
+        `_StaleCacheError` before parsing anything when files changed and the rebuild lock of the cache
+        is not held. The files that have an entry in `overlay_entries` are not read.
+        """
+        files: Dict[str, List[str]] = {}
+        locale_entries: Dict[str, Optional[CompactLocaleEntry]] = {}
+        stale_files: List[FileKey] = []
+
+        for language_code, path in paths.items():
+            if not is_dictionary_pattern(path):
+                if (language_code, path) not in overlay_entries:
+                    stale_files.append((language_code, path))
+                continue
+
+            files[language_code] = find_dictionary_files(path)
+            locale_entry: Optional[CompactLocaleEntry] = (
+                self.__cache.get_locale_entry(
+                    language_code=language_code, backend=self.__backend
+                )
+                if self.__cache
+                else None
+            )
+            locale_entries[language_code] = (
+                locale_entry if locale_entry and locale_entry.path == path else None
+            )
+            stale_files.extend(
+                (language_code, file_path)
+                for file_path in self.__get_stale_files(
+                    files=files[language_code], locale_entry=locale_entries[language_code]
+                )
+                if (language_code, file_path) not in overlay_entries
+            )
+
+        entries: Dict[FileKey, CompactCacheEntry] = self.__read_files(files=stale_files)
+        entries.update(overlay_entries)
+        entries.update(
+            self.__read_files(
+                files=[
+                    (language_code, file_path)
+                    for language_code in files
+                    for file_path in self.__get_affected_files(
+                        language_code=language_code,
+                        files=files[language_code],
+                        entries=entries,
+                        locale_entry=locale_entries[language_code],
+                    )
+                ]
+            )
+        )
+
+        dictionaries: Dict[str, Tuple[CompactDictionary, List[CompactDuplicate]]] = {}
+
+        for language_code, path in paths.items():
+            if language_code not in files:
+                entry: CompactCacheEntry = entries[language_code, path]
+                dictionaries[language_code] = entry.dictionary, [
+                    (message_name, path, path) for message_name in entry.duplicates
+                ]
+            else:
+                locale_entry = locale_entries[language_code]
+
+                if (
+                    not locale_entry
+                    or list(locale_entry.stamps) != files[language_code]
+                    or any(key[0] == language_code for key in entries)
+                ):
+                    with span(f"merge {language_code}"):
+                        locale_entry = self.__merge_locale(
+                            language_code=language_code,
+                            path=path,
+                            files=files[language_code],
+                            entries=entries,
+                            locale_entry=locale_entry,
+                        )
+
+                    if self.__cache and not any(
+                        key[0] == language_code for key in overlay_entries
+                    ):
+                        self.__cache.set_locale_entry(
+                            entry=locale_entry, backend=self.__backend
+                        )
+
+                dictionaries[language_code] = (
+                    locale_entry.dictionary,
+                    locale_entry.duplicates,
+                )
+
+        return dictionaries
+
+    def parse_by_paths(
+        self, paths: Dict[str, str], overlays: Optional[Dict[FileKey, str]] = None
+    ) -> Dict[str, CompactDictionary]:
+        """
+        The `parse_by_paths` function parses several dictionaries, one per language code (see
+        `read_by_paths`), and reports the duplicate messages found in them in the order of `paths`.
+
+        :param paths: The `paths` parameter maps language codes to the paths of their dictionaries
+        :type paths: Dict[str, str]
+        :param overlays: The `overlays` parameter maps (language code, path) pairs of files to contents
+        that replace them, see `read_by_paths`
+        :type overlays: Optional[Dict[FileKey, str]]
+        :return: a dictionary that maps the language codes to their parsed dictionaries.
+        """
+        dictionaries: Dict[str, CompactDictionary] = {}
+
+        for language_code, (dictionary, duplicates) in self.read_by_paths(
+            paths=paths, overlays=overlays
+        ).items():
+            self.__print_duplicates(
+                language_code=language_code,
+                path=paths[language_code],
+                duplicates=duplicates,
+            )
+            dictionaries[language_code] = dictionary
 
         return dictionaries
+
+    def parse_by_config(self, config: ScannerConfig) -> Dict[str, CompactDictionary]:
+        """
+        The `parse_by_config` function parses multiple Fluent dictionaries based on a given configuration.
+        """
+        return self.parse_by_paths(paths=config.dictionaries)
+
+
+def _read_file_entry(
+    path: str,
+    language_code: str,
+    cached_content_hash: Optional[str],
+    backend: FluentReaderBackends,
+    stream_min_bytes: int,
+    shared_cache: Optional[SharedCache],
+) -> Union[FluentFileStamp, CompactCacheEntry]:
+    """
+    The `_read_file_entry` function is the process pool task of `FluentReader.read_file_entry`.
+    """
+    return FluentReader(
+        backend=backend, stream_min_bytes=stream_min_bytes, shared_cache=shared_cache
+    ).read_file_entry(
+        path=path, language_code=language_code, cached_content_hash=cached_content_hash
+    )
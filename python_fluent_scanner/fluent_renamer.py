@@ -0,0 +1,140 @@
+import os
+import re
+import stat
+import tempfile
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from python_fluent_scanner.types.compact import CompactDictionary
+from python_fluent_scanner.types.enums import FluentFindingTypes
+from python_fluent_scanner.types.models import FluentFinding
+
+# A message or a term starts at the beginning of a line with its identifier followed by `=`.
+ENTRY_PATTERN: Pattern[str] = re.compile(r"(-?[a-zA-Z][a-zA-Z0-9_-]*)([ \t]*=)")
+
+# The renames of the messages of a file, and the renames of the variables of each of its messages.
+FileRenames = Tuple[Dict[str, str], Dict[str, Dict[str, str]]]
+
+
+class FluentRenamer:
+    """
+    Applies the renames suggested by the comparator to the files of a dictionary: an extra message is
+    renamed to the missing message it was likely renamed from, and an extra variable of a message to the
+    missing variable. Each file is rewritten in one streaming pass, then replaces the original file
+    atomically.
+    """
+
+    def get_renames(
+        self, dictionary: CompactDictionary, findings: List[FluentFinding]
+    ) -> Dict[str, FileRenames]:
+        """
+        The function groups the suggested renames of a dictionary by the file that defines the renamed
+        messages.
+
+        :param dictionary: The `dictionary` parameter is the dictionary the findings are about
+        :type dictionary: CompactDictionary
+        :param findings: The `findings` parameter is the list of the findings of the dictionary
+        :type findings: List[FluentFinding]
+        :return: a dictionary that maps the paths of the files to their renames.
+        """
+        renames: Dict[str, FileRenames] = {}
+
+        for finding in findings:
+            if finding.suggestion is None:
+                continue
+
+            if finding.finding_type == FluentFindingTypes.MISSING_MESSAGE:
+                message_renames, _ = renames.setdefault(
+                    dictionary.get_source(finding.suggestion), ({}, {})
+                )
+                message_renames[finding.suggestion] = finding.message_name
+            elif finding.finding_type == FluentFindingTypes.MISSING_PLACEABLE:
+                _, variable_renames = renames.setdefault(
+                    dictionary.get_source(finding.message_name), ({}, {})
+                )
+                variable_renames.setdefault(finding.message_name, {})[
+                    finding.suggestion
+                ] = finding.placeable_name
+
+        return renames
+
+    def __get_variable_pattern(self, variable_renames: Dict[str, str]) -> Pattern[str]:
+        """
+        The function returns the pattern of the references to the renamed variables of a message.
+        """
+        return re.compile(
+            r"\$("
+            + "|".join(
+                map(re.escape, sorted(variable_renames, key=len, reverse=True))
+            )
+            + r")(?![a-zA-Z0-9_-])"
+        )
+
+    def rename(
+        self,
+        path: str,
+        message_renames: Dict[str, str],
+        variable_renames: Dict[str, Dict[str, str]],
+    ) -> int:
+        """
+        The function renames messages, and variables of messages, in a Fluent file. The file is read and
+        written one line at a time; only the identifiers of the renamed messages and the `$variable`
+        references of the renamed variables are changed, the rest of the file is kept as is.
+
+        :param path: The `path` parameter is the path of the Fluent file
+        :type path: str
+        :param message_renames: The `message_renames` parameter maps the current names of messages to
+        their new names
+        :type message_renames: Dict[str, str]
+        :param variable_renames: The `variable_renames` parameter maps the names of messages to the
+        current and new names of their variables
+        :type variable_renames: Dict[str, Dict[str, str]]
+        :return: the number of renamed messages and variable references; the file is not written when
+        it is 0.
+        """
+        patterns: Dict[str, Pattern[str]] = {
+            message_name: self.__get_variable_pattern(renames)
+            for message_name, renames in variable_renames.items()
+            if renames
+        }
+        rename_count: int = 0
+        message_name: Optional[str] = None
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp"
+        )
+
+        try:
+            with open(path, encoding="utf-8", newline="") as source, os.fdopen(
+                descriptor, "w", encoding="utf-8", newline=""
+            ) as target:
+                for line in source:
+                    if match := ENTRY_PATTERN.match(line):
+                        message_name = match.group(1)
+
+                        if message_name in message_renames:
+                            line = (
+                                message_renames[message_name] + line[match.end(1) :]
+                            )
+                            rename_count += 1
+                    elif line.startswith("#"):
+                        message_name = None
+
+                    if message_name in patterns:
+                        renames: Dict[str, str] = variable_renames[message_name]
+                        line, count = patterns[message_name].subn(
+                            lambda reference: f"${renames[reference.group(1)]}", line
+                        )
+                        rename_count += count
+
+                    target.write(line)
+
+            if rename_count:
+                os.chmod(temporary_path, stat.S_IMODE(os.stat(path).st_mode))
+                os.replace(temporary_path, path)
+            else:
+                os.remove(temporary_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        return rename_count
@@ -0,0 +1,550 @@
+import json
+import sys
+from collections import Counter
+from typing import Any, Dict, List, Optional, TextIO
+
+from termcolor import colored, cprint
+from python_fluent_scanner.types.compact import CompactDictionary, CompactDuplicate
+from python_fluent_scanner.types.enums import FluentFindingTypes, FluentReportFormats
+from python_fluent_scanner.types.models import FluentFinding
+
+# The category of the duplicate messages in the summary and in the SARIF rules, next to the finding types.
+DUPLICATE_MESSAGE: str = "DUPLICATE_MESSAGE"
+
+SARIF_SCHEMA: str = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_RULES: Dict[str, str] = {
+    FluentFindingTypes.MISSING_MESSAGE.value: "A message of the root dictionary is missing",
+    FluentFindingTypes.EXTRA_MESSAGES.value: "Messages are not in the root dictionary",
+    FluentFindingTypes.MISSING_PLACEABLE.value: "A placeable of the root message is missing",
+    FluentFindingTypes.PLACEABLE_TYPE_MISMATCH.value: "A placeable has another type in the root message",
+    FluentFindingTypes.EXTRA_PLACEABLES.value: "Placeables are not in the root message",
+    DUPLICATE_MESSAGE: "A message is defined more than once",
+}
+
+
+def describe_finding(finding: FluentFinding) -> str:
+    """
+    The function describes a finding of the comparison of a dictionary with the root dictionary.
+
+    :param finding: The `finding` parameter is the `FluentFinding` to describe
+    :type finding: FluentFinding
+    :return: the description of the finding.
+    """
+    suggestion: str = (
+        f" (renamed to `{finding.suggestion}`?)" if finding.suggestion is not None else ""
+    )
+
+    if finding.finding_type == FluentFindingTypes.MISSING_MESSAGE:
+        return f"message `{finding.message_name}` was not found{suggestion}"
+    elif finding.finding_type == FluentFindingTypes.EXTRA_MESSAGES:
+        return f"found unexpected extra messages: {', '.join(finding.names)}"
+    elif finding.finding_type == FluentFindingTypes.MISSING_PLACEABLE:
+        return f"in message `{finding.message_name}` placeable `{finding.placeable_name}` was not found{suggestion}"
+    elif finding.finding_type == FluentFindingTypes.PLACEABLE_TYPE_MISMATCH:
+        return f"in message `{finding.message_name}` placeable `{finding.placeable_name}` types mismatch ({finding.expected_type.value} != {finding.actual_type.value})"
+    else:
+        return f"in message `{finding.message_name}` found unexpected extra placeables: {', '.join(finding.names)}"
+
+
+def describe_duplicate(path: str, duplicate: CompactDuplicate) -> str:
+    """
+    The function describes a message that was defined more than once in a dictionary, with the files of
+    both definitions when the dictionary is split into several files.
+
+    :param path: The `path` parameter is the path of the dictionary
+    :type path: str
+    :param duplicate: The `duplicate` parameter is the (message name, first path, second path) tuple
+    :type duplicate: CompactDuplicate
+    :return: the description of the duplicate message.
+    """
+    message_name, first_path, second_path = duplicate
+
+    if first_path != second_path:
+        location: str = f" in {first_path} and {second_path}"
+    elif first_path != path:
+        location = f" in {first_path}"
+    else:
+        location = ""
+
+    return f"Found duplicate for {message_name}{location}"
+
+
+def get_finding_paths(
+    finding: FluentFinding, path: str, dictionary: Optional[CompactDictionary] = None
+) -> List[str]:
+    """
+    The function finds the files of a dictionary that a finding is about: the file that defines its
+    message, the files that define the extra messages, or the dictionary itself for a missing message.
+
+    :param finding: The `finding` parameter is the `FluentFinding` about the dictionary
+    :type finding: FluentFinding
+    :param path: The `path` parameter is the path of the dictionary
+    :type path: str
+    :param dictionary: The `dictionary` parameter is the dictionary, whose `sources` map its messages to
+    their files when it is split into several files
+    :type dictionary: Optional[CompactDictionary]
+    :return: the list of the paths of the files, without duplicates.
+    """
+    if dictionary is None or finding.finding_type == FluentFindingTypes.MISSING_MESSAGE:
+        return [path]
+
+    message_names: List[str] = (
+        finding.names
+        if finding.finding_type == FluentFindingTypes.EXTRA_MESSAGES
+        else [finding.message_name]
+    )
+    paths: Dict[str, None] = {
+        dictionary.sources.get(message_name, path): None for message_name in message_names
+    }
+
+    return list(paths) or [path]
+
+
+class FluentReporter:
+    """
+    Reports the outcome of a check as it goes: the duplicate messages of each dictionary when it is read,
+    the findings of each dictionary when it is compared, and a summary at the end. The reporter counts
+    the findings and duplicates of each locale by category for the summary, and of each project when
+    several projects are checked at once.
+    """
+
+    __project: Optional[str]
+    __counts: Dict[Optional[str], Dict[str, Counter]]
+
+    def __init__(self) -> None:
+        """
+        The function initializes a reporter with empty counts.
+        """
+        self.__project = None
+        self.__counts = {}
+
+    def __get_counts(self, language_code: str) -> Counter:
+        """
+        The function returns the counts of a locale of the current project.
+        """
+        return self.__counts.setdefault(self.__project, {}).setdefault(
+            language_code, Counter()
+        )
+
+    def get_project(self) -> Optional[str]:
+        """
+        The function returns the project whose dictionaries are being reported, if several projects are
+        checked at once.
+        """
+        return self.__project
+
+    def report_project(self, project: str) -> None:
+        """
+        The function starts reporting the dictionaries of a project, when several projects are checked at
+        once.
+
+        :param project: The `project` parameter is the path of the configuration file of the project
+        :type project: str
+        """
+        self.__project = project
+        self.__counts.setdefault(project, {})
+
+    def report_status(self, message: str, color: str) -> None:
+        """
+        The function reports the progress of a check, for the people reading the output.
+
+        :param message: The `message` parameter is the text of the status
+        :type message: str
+        :param color: The `color` parameter is the termcolor color of the status
+        :type color: str
+        """
+
+    def report_duplicates(
+        self, language_code: str, path: str, duplicates: List[CompactDuplicate]
+    ) -> None:
+        """
+        The function reports the messages that were defined more than once in a dictionary.
+
+        :param language_code: The `language_code` parameter is the code of the language of the dictionary
+        :type language_code: str
+        :param path: The `path` parameter is the path of the dictionary
+        :type path: str
+        :param duplicates: The `duplicates` parameter is the list of the duplicate messages
+        :type duplicates: List[CompactDuplicate]
+        """
+        if duplicates:
+            self.__get_counts(language_code)[DUPLICATE_MESSAGE] += len(duplicates)
+
+    def report_dictionary(
+        self,
+        language_code: str,
+        findings: List[FluentFinding],
+        path: str = "",
+        dictionary: Optional[CompactDictionary] = None,
+    ) -> None:
+        """
+        The function reports the findings of the comparison of a dictionary with the root dictionary.
+
+        :param language_code: The `language_code` parameter is the code of the language of the dictionary
+        :type language_code: str
+        :param findings: The `findings` parameter is the list of the findings about the dictionary
+        :type findings: List[FluentFinding]
+        :param path: The `path` parameter is the path of the dictionary
+        :type path: str
+        :param dictionary: The `dictionary` parameter is the dictionary, used to report each finding in
+        the file that defines its message
+        :type dictionary: Optional[CompactDictionary]
+        """
+        self.__get_counts(language_code).update(
+            finding.finding_type.value for finding in findings
+        )
+
+    def get_summary(self, is_error_found: bool) -> Dict[str, Any]:
+        """
+        The function summarizes the reported findings and duplicates.
+
+        :param is_error_found: The `is_error_found` parameter is True if the check found errors
+        :type is_error_found: bool
+        :return: the summary, with the counts of each locale by category, grouped by project when
+        several projects were checked.
+        """
+        all_counts: List[Counter] = [
+            counts
+            for project_counts in self.__counts.values()
+            for counts in project_counts.values()
+        ]
+        duplicate_count: int = sum(counts[DUPLICATE_MESSAGE] for counts in all_counts)
+        summary: Dict[str, Any] = {
+            "is_error_found": is_error_found,
+            "findings": sum(sum(counts.values()) for counts in all_counts)
+            - duplicate_count,
+            "duplicates": duplicate_count,
+        }
+
+        if self.__project is None:
+            summary["locales"] = {
+                language_code: dict(counts)
+                for language_code, counts in self.__counts.get(None, {}).items()
+            }
+        else:
+            summary["projects"] = {
+                project: {
+                    language_code: dict(counts)
+                    for language_code, counts in project_counts.items()
+                }
+                for project, project_counts in self.__counts.items()
+            }
+
+        return summary
+
+    def finish(self, is_error_found: bool) -> None:
+        """
+        The function ends the report once the check is over.
+
+        :param is_error_found: The `is_error_found` parameter is True if the check found errors
+        :type is_error_found: bool
+        """
+
+
+class FluentTextReporter(FluentReporter):
+    """
+    Prints the report as colored text for a terminal.
+    """
+
+    def report_status(self, message: str, color: str) -> None:
+        cprint(message, color)
+
+    def report_project(self, project: str) -> None:
+        super().report_project(project=project)
+        cprint(f"\nCHECKING PROJECT {project}:", "white", attrs=["bold"])
+
+    def report_duplicates(
+        self, language_code: str, path: str, duplicates: List[CompactDuplicate]
+    ) -> None:
+        super().report_duplicates(
+            language_code=language_code, path=path, duplicates=duplicates
+        )
+
+        for duplicate in duplicates:
+            print(
+                colored(f"DICT({language_code}):", "blue"),
+                describe_duplicate(path=path, duplicate=duplicate),
+            )
+
+    def report_dictionary(
+        self,
+        language_code: str,
+        findings: List[FluentFinding],
+        path: str = "",
+        dictionary: Optional[CompactDictionary] = None,
+    ) -> None:
+        super().report_dictionary(
+            language_code=language_code,
+            findings=findings,
+            path=path,
+            dictionary=dictionary,
+        )
+        cprint(f"\nCHECKING DICTIONARY {language_code}:", "white")
+
+        for finding in findings:
+            print(
+                colored(f"DICT({finding.language_code}):", "red"),
+                describe_finding(finding),
+            )
+
+        if not findings:
+            cprint(f"✔︎ No errors found", "green")
+
+
+class FluentJsonLinesReporter(FluentReporter):
+    """
+    Writes the report as JSON Lines: a `duplicate` record per duplicate message, a `finding` record per
+    finding, written as soon as its dictionary is compared, and a `summary` record at the end. The status
+    is printed to stderr, so that the output only has records.
+    """
+
+    __stream: TextIO
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        The function initializes a reporter.
+
+        :param stream: The `stream` parameter is the stream the records are written to, stdout if it is
+        not provided
+        :type stream: Optional[TextIO]
+        """
+        super().__init__()
+        self.__stream = stream or sys.stdout
+
+    def __write(self, record: Dict[str, Any]) -> None:
+        if (project := self.get_project()) is not None and record["type"] != "summary":
+            record = {"type": record["type"], "project": project, **record}
+
+        self.__stream.write(json.dumps(record, ensure_ascii=False))
+        self.__stream.write("\n")
+
+    def report_status(self, message: str, color: str) -> None:
+        print(message.strip(), file=sys.stderr)
+
+    def report_duplicates(
+        self, language_code: str, path: str, duplicates: List[CompactDuplicate]
+    ) -> None:
+        super().report_duplicates(
+            language_code=language_code, path=path, duplicates=duplicates
+        )
+
+        for message_name, first_path, second_path in duplicates:
+            self.__write(
+                {
+                    "type": "duplicate",
+                    "language_code": language_code,
+                    "message_name": message_name,
+                    "first_path": first_path,
+                    "second_path": second_path,
+                }
+            )
+
+        self.__stream.flush()
+
+    def report_dictionary(
+        self,
+        language_code: str,
+        findings: List[FluentFinding],
+        path: str = "",
+        dictionary: Optional[CompactDictionary] = None,
+    ) -> None:
+        super().report_dictionary(
+            language_code=language_code,
+            findings=findings,
+            path=path,
+            dictionary=dictionary,
+        )
+
+        for finding in findings:
+            self.__write(
+                {
+                    "type": "finding",
+                    "path": get_finding_paths(
+                        finding=finding, path=path, dictionary=dictionary
+                    )[0],
+                    **finding.model_dump(mode="json"),
+                }
+            )
+
+        self.__stream.flush()
+
+    def finish(self, is_error_found: bool) -> None:
+        self.__write(
+            {"type": "summary", **self.get_summary(is_error_found=is_error_found)}
+        )
+        self.__stream.flush()
+
+
+class FluentSarifReporter(FluentReporter):
+    """
+    Writes the report as a SARIF 2.1.0 log with one run, for code scanning tools. The results are written
+    as soon as their dictionary is compared, one per line, and the log is closed by `finish` with the
+    summary in the properties of the run. The log is only started by the first result or by `finish`, so
+    that nothing is written when the check fails before reporting anything. The status is printed to
+    stderr.
+    """
+
+    __stream: TextIO
+    __result_count: int
+    __is_started: bool
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        The function initializes a reporter.
+
+        :param stream: The `stream` parameter is the stream the log is written to, stdout if it is not
+        provided
+        :type stream: Optional[TextIO]
+        """
+        super().__init__()
+        self.__stream = stream or sys.stdout
+        self.__result_count = 0
+        self.__is_started = False
+
+    def __start(self) -> None:
+        """
+        The function writes the beginning of the log, unless it is already written.
+        """
+        if self.__is_started:
+            return
+
+        self.__is_started = True
+        tool: Dict[str, Any] = {
+            "driver": {
+                "name": "fluent_scanner",
+                "informationUri": "https://github.com/Radim296/python_fluent_scanner",
+                "rules": [
+                    {"id": rule_id, "shortDescription": {"text": description}}
+                    for rule_id, description in SARIF_RULES.items()
+                ],
+            }
+        }
+        self.__stream.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+            f'"runs": [{{"tool": {json.dumps(tool)}, "results": ['
+        )
+
+    def __write_result(
+        self,
+        rule_id: str,
+        level: str,
+        text: str,
+        language_code: str,
+        paths: List[str],
+        message_name: Optional[str],
+    ) -> None:
+        """
+        The function writes a result of the log.
+        """
+        location: Dict[str, Any] = {
+            "physicalLocation": {"artifactLocation": {"uri": paths[0]}}
+        }
+
+        if message_name is not None:
+            location["logicalLocations"] = [{"name": message_name, "kind": "member"}]
+
+        result: Dict[str, Any] = {
+            "ruleId": rule_id,
+            "level": level,
+            "message": {"text": f"DICT({language_code}): {text}"},
+            "locations": [location],
+            "properties": {"languageCode": language_code},
+        }
+
+        if (project := self.get_project()) is not None:
+            result["properties"]["project"] = project
+
+        if len(paths) > 1:
+            result["relatedLocations"] = [
+                {"physicalLocation": {"artifactLocation": {"uri": path}}}
+                for path in paths[1:]
+            ]
+
+        self.__start()
+        self.__stream.write(",\n" if self.__result_count else "\n")
+        self.__stream.write(json.dumps(result, ensure_ascii=False))
+        self.__result_count += 1
+
+    def report_status(self, message: str, color: str) -> None:
+        print(message.strip(), file=sys.stderr)
+
+    def report_duplicates(
+        self, language_code: str, path: str, duplicates: List[CompactDuplicate]
+    ) -> None:
+        super().report_duplicates(
+            language_code=language_code, path=path, duplicates=duplicates
+        )
+
+        for duplicate in duplicates:
+            message_name, first_path, second_path = duplicate
+            self.__write_result(
+                rule_id=DUPLICATE_MESSAGE,
+                level="warning",
+                text=describe_duplicate(path=path, duplicate=duplicate),
+                language_code=language_code,
+                paths=(
+                    [second_path]
+                    if first_path == second_path
+                    else [second_path, first_path]
+                ),
+                message_name=message_name,
+            )
+
+        self.__stream.flush()
+
+    def report_dictionary(
+        self,
+        language_code: str,
+        findings: List[FluentFinding],
+        path: str = "",
+        dictionary: Optional[CompactDictionary] = None,
+    ) -> None:
+        super().report_dictionary(
+            language_code=language_code,
+            findings=findings,
+            path=path,
+            dictionary=dictionary,
+        )
+
+        for finding in findings:
+            self.__write_result(
+                rule_id=finding.finding_type.value,
+                level="error",
+                text=describe_finding(finding),
+                language_code=language_code,
+                paths=get_finding_paths(
+                    finding=finding, path=path, dictionary=dictionary
+                ),
+                message_name=finding.message_name,
+            )
+
+        self.__stream.flush()
+
+    def finish(self, is_error_found: bool) -> None:
+        summary: Dict[str, Any] = self.get_summary(is_error_found=is_error_found)
+        self.__start()
+        self.__stream.write(
+            f'\n], "properties": {{"summary": {json.dumps(summary)}}}}}]}}\n'
+        )
+        self.__stream.flush()
+
+
+def get_reporter(
+    report_format: FluentReportFormats, stream: Optional[TextIO] = None
+) -> FluentReporter:
+    """
+    The function creates the reporter of a format.
+
+    :param report_format: The `report_format` parameter is the format of the report
+    :type report_format: FluentReportFormats
+    :param stream: The `stream` parameter is the stream of the JSON Lines and SARIF reports, stdout if it
+    is not provided
+    :type stream: Optional[TextIO]
+    :return: the reporter.
+    """
+    if report_format == FluentReportFormats.JSONL:
+        return FluentJsonLinesReporter(stream=stream)
+    elif report_format == FluentReportFormats.SARIF:
+        return FluentSarifReporter(stream=stream)
+    else:
+        return FluentTextReporter()
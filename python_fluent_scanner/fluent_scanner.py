@@ -1,205 +1,532 @@
-from copy import copy
-from typing import Dict, List, Optional
+import os
+from typing import Dict, Iterator, List, Optional, Set
 
-from termcolor import colored, cprint
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_index import FileStamps, FluentIndex
+from python_fluent_scanner.fluent_renamer import FileRenames, FluentRenamer
+from python_fluent_scanner.fluent_reporter import FluentReporter, FluentTextReporter
 from python_fluent_scanner.utils.cache import ScannerCache
 from python_fluent_scanner.utils.config import ConfigReader
+from python_fluent_scanner.utils.discovery import (
+    find_dictionary_files,
+    is_dictionary_pattern,
+    matches_dictionary_path,
+)
+from python_fluent_scanner.utils.git import get_changed_files, get_file_at
+from python_fluent_scanner.utils.run_stamp import save_run_stamp
+from python_fluent_scanner.utils.shared_cache import SharedCache
+from python_fluent_scanner.utils.timings import span
 from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import CompactDictionary, CompactPlaceables
 from python_fluent_scanner.types.models import (
+    FluentFinding,
     ScannerConfig,
-    FluentDictionary,
-    FluentMessage,
-    FluentPlaceable,
+    FluentDictionaryState,
 )
 
 
 class FluentScanner:
     __config: ScannerConfig
-    __dictionaries: Dict[str, FluentDictionary]
+    __dictionaries: Dict[str, CompactDictionary]
+    __jobs: int
+    __since: Optional[str]
+    __reporter: FluentReporter
+    __fix_renames: bool
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        jobs: int = 1,
+        since: Optional[str] = None,
+        reporter: Optional[FluentReporter] = None,
+        fix_renames: bool = False,
+    ) -> None:
         """
         The function initializes an object by loading configuration and dictionaries.
+
+        :param jobs: The `jobs` parameter is the maximum number of processes used to parse dictionaries
+        :type jobs: int
+        :param since: The `since` parameter is a git revision; when provided, only the dictionaries
+        changed since this revision are parsed and checked, see `check_since`
+        :type since: Optional[str]
+        :param reporter: The `reporter` parameter reports the duplicate messages, the findings and the
+        summary of the check, as colored text if it is not provided
+        :type reporter: Optional[FluentReporter]
+        :param fix_renames: The `fix_renames` parameter renames the extra messages and variables of the
+        dictionaries to the missing ones they were likely renamed from, see `FluentRenamer`
+        :type fix_renames: bool
         """
+        self.__jobs = jobs
+        self.__since = since
+        self.__reporter = reporter or FluentTextReporter()
+        self.__fix_renames = fix_renames
         self.__load_config()
-        self.__load_dictionaries()
+
+        if since is None:
+            self.__load_dictionaries()
 
     def __load_config(self):
         """
         The function loads a configuration file using a ConfigReader object and assigns the configuration to
         a class variable.
         """
-        config_reader: ConfigReader = ConfigReader()
-        self.__config = config_reader.get_config()
+        with span("config"):
+            config_reader: ConfigReader = ConfigReader()
+            self.__config = config_reader.get_config()
+
+    def __get_reader(self) -> FluentReader:
+        """
+        The function creates the FluentReader of the configuration, which reuses the parse cache for files
+        that did not change since the last run.
+        """
+        return FluentReader(
+            cache=ScannerCache(),
+            jobs=self.__jobs,
+            backend=self.__config.reader,
+            stream_min_bytes=self.__config.stream_min_bytes,
+            shared_cache=SharedCache() if self.__config.shared_cache else None,
+        )
+
+    def __read_dictionaries(self, paths: Dict[str, str]) -> Dict[str, CompactDictionary]:
+        """
+        The function parses dictionaries using a FluentReader object and reports their duplicate messages.
+
+        :param paths: The `paths` parameter maps language codes to the paths of their dictionaries
+        :type paths: Dict[str, str]
+        :return: a dictionary that maps the language codes to their parsed dictionaries.
+        """
+        dictionaries: Dict[str, CompactDictionary] = {}
+
+        for language_code, (dictionary, duplicates) in (
+            self.__get_reader().read_by_paths(paths=paths).items()
+        ):
+            self.__reporter.report_duplicates(
+                language_code=language_code,
+                path=paths[language_code],
+                duplicates=duplicates,
+            )
+            dictionaries[language_code] = dictionary
+
+        return dictionaries
 
     def __load_dictionaries(self):
         """
-        The function loads dictionaries using a FluentReader object and a configuration.
+        The function loads dictionaries using a FluentReader object and a configuration, and updates the
+        index of the dictionaries with the locales whose files changed if the configuration enables it.
         """
-        fluent_reader: FluentReader = FluentReader()
-        self.__dictionaries = fluent_reader.parse_by_config(config=self.__config)
+        if not self.__config.index:
+            self.__dictionaries = self.__read_dictionaries(
+                paths=self.__config.dictionaries
+            )
+            return
 
-    def __is_root_dictionary_changed(self) -> bool:
+        cache: ScannerCache = ScannerCache()
+        index: FluentIndex = FluentIndex.load(
+            language_codes=list(self.__config.dictionaries), cache=cache
+        )
+        # The files are stamped before they are read, so that a file modified meanwhile is stale.
+        stale_locales: Dict[str, FileStamps] = index.get_stale_locales(
+            paths=self.__config.dictionaries
+        )
+        self.__dictionaries = self.__read_dictionaries(paths=self.__config.dictionaries)
+
+        if stale_locales:
+            with span("index"):
+                for language_code, stamps in stale_locales.items():
+                    index.update(
+                        dictionary=self.__dictionaries[language_code], stamps=stamps
+                    )
+
+                index.save(cache)
+
+    def __get_fingerprints(self, dictionary: CompactDictionary) -> Dict[str, str]:
+        """
+        The function computes the fingerprints of the messages of a dictionary.
+        """
+        comparator: FluentComparator = FluentComparator()
+
+        return comparator.get_fingerprints(comparator.get_signatures(dictionary))
+
+    def __get_root_fingerprints(self) -> Dict[str, str]:
+        """
+        The function computes the fingerprints of the messages of the root dictionary.
+        """
+        return self.__get_fingerprints(self.__dictionaries[self.__config.root_locale])
+
+    def __get_changed_messages(
+        self, saved_fingerprints: Dict[str, str], fingerprints: Dict[str, str]
+    ) -> Set[str]:
         """
-        The function checks if the root dictionary has been changed by comparing it with the saved state in
-        the cache.
-        :return: a boolean value. It returns True if the root dictionary has changed since it was last saved
-        in the cache, and False if it has not changed.
+        The function finds the messages that were added, removed or whose placeables changed between two
+        versions of a dictionary.
+
+        :param saved_fingerprints: The `saved_fingerprints` parameter is the fingerprints of the messages
+        of the previous version of the dictionary
+        :type saved_fingerprints: Dict[str, str]
+        :param fingerprints: The `fingerprints` parameter is the fingerprints of the messages of the
+        current version of the dictionary
+        :type fingerprints: Dict[str, str]
+        :return: the set of the names of the changed messages.
+        """
+        changed_messages: Set[str] = {
+            message_name
+            for message_name, fingerprint in fingerprints.items()
+            if saved_fingerprints.get(message_name) != fingerprint
+        }
+        changed_messages.update(saved_fingerprints.keys() - fingerprints.keys())
+
+        return changed_messages
+
+    def __get_changed_root_messages(
+        self, root_fingerprints: Dict[str, str]
+    ) -> Optional[Set[str]]:
+        """
+        The function finds the messages of the root dictionary that were added, removed or whose placeables
+        changed since the root dictionary was last checked successfully, by comparing the fingerprints of
+        its messages with the ones saved in the cache.
+
+        :param root_fingerprints: The `root_fingerprints` parameter is the current fingerprints of the
+        messages of the root dictionary
+        :type root_fingerprints: Dict[str, str]
+        :return: the set of the names of the changed messages, empty if the root dictionary did not change,
+        or `None` if there is no saved state and every message must be checked.
         """
         cache: ScannerCache = ScannerCache()
 
-        saved_root_dictionary_state: Optional[FluentDictionary] = cache.get(
+        saved_root_dictionary_state: Optional[FluentDictionaryState] = cache.get_state(
             language_code=self.__config.root_locale
         )
-        root_dictionary: FluentDictionary = self.__dictionaries[
-            self.__config.root_locale
-        ]
 
-        if saved_root_dictionary_state:
-            if saved_root_dictionary_state == root_dictionary:
-                return False
-            else:
-                return True
-        else:
-            return True
+        if not saved_root_dictionary_state:
+            return None
 
-    def __print_error(self, message: str, dictionary: FluentDictionary) -> None:
-        print(colored(f"DICT({dictionary.language_code}):", "red"), message)
+        return self.__get_changed_messages(
+            saved_fingerprints=saved_root_dictionary_state.fingerprints,
+            fingerprints=root_fingerprints,
+        )
 
-    def __check_placeables(
-        self, message_name: str, dict_a: FluentDictionary, dict_b: FluentDictionary
-    ) -> bool:
+    def __apply_renames(
+        self, dictionary: CompactDictionary, findings: List[FluentFinding]
+    ) -> None:
         """
-        The function `__check_placeables` compares the placeables in two Fluent dictionaries and checks for
-        any errors or mismatches.
+        The function renames the extra messages and variables of a dictionary to the missing ones they
+        were likely renamed from, as suggested by its findings, in the files of the dictionary.
 
-        :param message_name: The `message_name` parameter is a string that represents the name of a message
-        :type message_name: str
-        :param dict_a: `dict_a` is an instance of the `FluentDictionary` class. It represents a dictionary
-        of Fluent messages, where each message is identified by a unique name and contains a collection of
-        placeables
-        :type dict_a: FluentDictionary
-        :param dict_b: `dict_b` is an instance of the `FluentDictionary` class
-        :type dict_b: FluentDictionary
-        :return: a boolean value indicating whether any errors were found during the comparison of
-        placeables between two Fluent dictionaries.
+        :param dictionary: The `dictionary` parameter is the dictionary the findings are about
+        :type dictionary: CompactDictionary
+        :param findings: The `findings` parameter is the list of the findings of the dictionary
+        :type findings: List[FluentFinding]
         """
-        is_error_found: bool = False
+        renamer: FluentRenamer = FluentRenamer()
+        renames: Dict[str, FileRenames] = renamer.get_renames(
+            dictionary=dictionary, findings=findings
+        )
 
-        message_a: FluentMessage = dict_a.messages[message_name]
-        message_b: FluentMessage = dict_b.messages[message_name]
+        for path, (message_renames, variable_renames) in renames.items():
+            rename_count: int = renamer.rename(
+                path=path,
+                message_renames=message_renames,
+                variable_renames=variable_renames,
+            )
 
-        message_b_placeables: Dict[str, FluentPlaceable] = copy(message_b.placeables)
+            if rename_count:
+                self.__reporter.report_status(
+                    f"ℹ Renamed {rename_count} messages and variables in {path}", "yellow"
+                )
 
-        for placeable_name in message_a.placeables:
-            placeable_a: FluentPlaceable = message_a.placeables[placeable_name]
+    def __check_dictionaries(self, message_names: Optional[Set[str]] = None) -> bool:
+        """
+        The function `__check_dictionaries` compares every dictionary with the root dictionary, then
+        prints the findings of each dictionary in the order of the configuration.
 
-            if placeable_b := message_b_placeables.get(placeable_name):
-                message_b_placeables.pop(placeable_name)
-                if placeable_b.placeable_type != placeable_a.placeable_type:
-                    is_error_found = True
-                    self.__print_error(
-                        f"in message `{message_name}` placeable `{placeable_name}` types mismatch ({placeable_a.placeable_type.value} != {placeable_b.placeable_type.value})",
-                        dictionary=dict_b,
-                    )
-            else:
-                is_error_found = True
-                self.__print_error(
-                    f"in message `{message_name}` placeable `{placeable_name}` was not found",
-                    dictionary=dict_b,
-                )
+        :param message_names: The `message_names` parameter limits the check to these messages, every
+        message is checked if it is not provided
+        :type message_names: Optional[Set[str]]
+        :return: a boolean value indicating whether any errors were found during the dictionary check.
+        """
+        root_dictionary: CompactDictionary = self.__dictionaries[
+            self.__config.root_locale
+        ]
+        dictionaries: List[CompactDictionary] = [
+            self.__dictionaries[language_code]
+            for language_code in self.__dictionaries
+            if language_code != self.__config.root_locale
+        ]
+
+        is_error_found: bool = False
+
+        comparisons: Iterator[List[FluentFinding]] = FluentComparator().compare_many(
+            root_dictionary=root_dictionary,
+            dictionaries=dictionaries,
+            jobs=self.__jobs,
+            message_names=message_names,
+        )
+
+        for dictionary in dictionaries:
+            with span(f"compare {dictionary.language_code}"):
+                findings: List[FluentFinding] = next(comparisons)
 
-        if message_b_placeables:
-            is_error_found = True
-            self.__print_error(
-                f"in message `{message_name}` found unexpected extra placeables: {', '.join(list(message_b_placeables.keys()))}",
-                dictionary=dict_b,
+            self.__reporter.report_dictionary(
+                language_code=dictionary.language_code,
+                findings=findings,
+                path=self.__config.dictionaries[dictionary.language_code],
+                dictionary=dictionary,
             )
 
+            if findings and self.__fix_renames:
+                self.__apply_renames(dictionary=dictionary, findings=findings)
+
+            if findings:
+                is_error_found = True
+
         return is_error_found
 
-    def __check_messages(
-        self, dict_a: FluentDictionary, dict_b: FluentDictionary
-    ) -> bool:
+    def __read_dictionary_at(
+        self, language_code: str, path: str, ref: str, changed_files: Set[str]
+    ) -> Optional[CompactDictionary]:
         """
-        The function `__check_messages` compares two dictionaries and checks for any missing or unexpected
-        messages.
+        The function reads a dictionary as it was at a git revision. The files of a dictionary split into
+        several files are its current files and its files removed since the revision, merged in the order
+        of their paths, the first definition of a message winning.
 
-        :param dict_a: FluentDictionary object representing the first dictionary of messages
-        :type dict_a: FluentDictionary
-        :param dict_b: The parameter `dict_b` is a FluentDictionary object
-        :type dict_b: FluentDictionary
-        :return: a boolean value indicating whether any errors were found during the message comparison
-        process.
+        :param changed_files: The `changed_files` parameter is the set of the files changed since the
+        revision
+        :type changed_files: Set[str]
+        :return: the dictionary, or `None` if none of its files existed at the revision.
         """
-        is_error_found: bool = False
-        dict_b_messages: Dict[str, FluentMessage] = copy(dict_b.messages)
-
-        for message_name in dict_a.messages:
-            if message_name in dict_b_messages:
-                dict_b_messages.pop(message_name)
-                if self.__check_placeables(
-                    message_name=message_name, dict_a=dict_a, dict_b=dict_b
-                ):
-                    if not is_error_found:
-                        is_error_found = True
-            else:
-                is_error_found = True
-                self.__print_error(
-                    f"message `{message_name}` was not found", dictionary=dict_b
-                )
+        files: Set[str] = {
+            os.path.normpath(file_path) for file_path in find_dictionary_files(path)
+        }
 
-        if dict_b_messages:
-            is_error_found = True
-            self.__print_error(
-                f"found unexpected extra messages: {', '.join(list(dict_b_messages.keys()))}",
-                dictionary=dict_b,
+        if is_dictionary_pattern(path):
+            files.update(
+                file_path
+                for file_path in changed_files
+                if matches_dictionary_path(file_path, path)
             )
 
-        return is_error_found
+        reader: FluentReader = FluentReader(
+            backend=self.__config.reader,
+            stream_min_bytes=self.__config.stream_min_bytes,
+        )
+        messages: Dict[str, CompactPlaceables] = {}
+        is_found: bool = False
+
+        for file_path in sorted(files):
+            source: Optional[str] = get_file_at(ref=ref, path=file_path)
+
+            if source is None:
+                continue
+
+            dictionary, _ = reader.read_by_source(
+                source=source, language_code=language_code, path=file_path
+            )
+            is_found = True
+
+            for message_name, placeables in dictionary.messages.items():
+                messages.setdefault(message_name, placeables)
+
+        if not is_found:
+            return None
 
-    def __check_dictionaries(self) -> bool:
+        return CompactDictionary(
+            language_code=language_code, path=path, messages=messages
+        )
+
+    def __get_changed_messages_since(
+        self, dictionary: CompactDictionary, ref: str, changed_files: Set[str]
+    ) -> Optional[Set[str]]:
         """
-        The function `__check_dictionaries` checks for errors in a collection of dictionaries and returns a
-        boolean indicating whether any errors were found.
-        :return: a boolean value indicating whether any errors were found during the dictionary check.
+        The function finds the messages of a dictionary that changed since a git revision.
+
+        :return: the set of the names of the changed messages, or `None` if the dictionary did not exist
+        at the revision and every message must be checked.
         """
-        root_dictionary: FluentDictionary = self.__dictionaries[
-            self.__config.root_locale
-        ]
+        baseline: Optional[CompactDictionary] = self.__read_dictionary_at(
+            language_code=dictionary.language_code,
+            path=self.__config.dictionaries[dictionary.language_code],
+            ref=ref,
+            changed_files=changed_files,
+        )
+
+        if baseline is None:
+            return None
+
+        return self.__get_changed_messages(
+            saved_fingerprints=self.__get_fingerprints(baseline),
+            fingerprints=self.__get_fingerprints(dictionary),
+        )
+
+    def check_since(self, ref: str) -> bool:
+        """
+        The function checks only what changed since a git revision, without any saved state, e.g. on a
+        fresh CI runner. The dictionaries whose files did not change are only parsed when the root
+        dictionary changed, and only its changed messages are compared with them; a changed dictionary is
+        compared on the changed messages of the root dictionary and on its own changed messages. The
+        previous versions of the changed files are read with `git show`.
+
+        :param ref: The `ref` parameter is the git revision, e.g. the target branch of a merge request
+        :type ref: str
+        :return: a boolean value indicating whether any errors were found.
+        """
+        changed_files: Set[str] = get_changed_files(ref=ref)
+        root_locale: str = self.__config.root_locale
+        changed_locales: Set[str] = {
+            language_code
+            for language_code, path in self.__config.dictionaries.items()
+            if any(
+                matches_dictionary_path(file_path, path) for file_path in changed_files
+            )
+        }
+
+        if not changed_locales:
+            self.__reporter.report_status(
+                f"✔︎ No dictionary changed since {ref}", "green"
+            )
+            self.__reporter.finish(is_error_found=False)
+            return False
+
+        root_changed: bool = root_locale in changed_locales
+        self.__dictionaries = self.__read_dictionaries(
+            paths={
+                language_code: path
+                for language_code, path in self.__config.dictionaries.items()
+                if root_changed
+                or language_code in changed_locales
+                or language_code == root_locale
+            }
+        )
+        root_dictionary: CompactDictionary = self.__dictionaries[root_locale]
+        changed_root_messages: Optional[Set[str]] = (
+            self.__get_changed_messages_since(
+                dictionary=root_dictionary, ref=ref, changed_files=changed_files
+            )
+            if root_changed
+            else set()
+        )
+
+        if changed_root_messages is None:
+            self.__reporter.report_status(
+                f"ℹ Root dictionary added since {ref}, comparing with others..", "yellow"
+            )
+        else:
+            self.__reporter.report_status(
+                f"ℹ Checking dictionaries changed since {ref} "
+                f"({len(changed_root_messages)} messages of the root dictionary changed)..",
+                "yellow",
+            )
 
         is_error_found: bool = False
+        signatures = FluentComparator().get_signatures(root_dictionary)
+
+        for language_code, dictionary in self.__dictionaries.items():
+            if language_code == root_locale:
+                continue
+
+            message_names: Optional[Set[str]] = changed_root_messages
+
+            if language_code in changed_locales and message_names is not None:
+                changed_messages: Optional[Set[str]] = (
+                    self.__get_changed_messages_since(
+                        dictionary=dictionary, ref=ref, changed_files=changed_files
+                    )
+                )
+                message_names = (
+                    None
+                    if changed_messages is None
+                    else message_names | changed_messages
+                )
+
+            if message_names is not None and not message_names:
+                continue
 
-        for language_code in self.__dictionaries:
-            if language_code != self.__config.root_locale:
-                dictionary: FluentDictionary = self.__dictionaries[language_code]
+            with span(f"compare {language_code}"):
+                findings: List[FluentFinding] = FluentComparator().compare(
+                    dict_a=root_dictionary,
+                    dict_b=dictionary,
+                    signatures_a=signatures,
+                    message_names=message_names,
+                )
+            self.__reporter.report_dictionary(
+                language_code=language_code,
+                findings=findings,
+                path=self.__config.dictionaries[language_code],
+                dictionary=dictionary,
+            )
+
+            if findings and self.__fix_renames:
+                self.__apply_renames(dictionary=dictionary, findings=findings)
+
+            if findings:
+                is_error_found = True
+
+        if is_error_found:
+            self.__reporter.report_status(
+                f"\n ℹ The changes since {ref} have errors", "red"
+            )
+        else:
+            self.__reporter.report_status(
+                f"\n✔ Dictionaries checked successfully", "green"
+            )
 
-                cprint(f"\nCHECKING DICTIONARY {language_code}:", "white")
-                if not self.__check_messages(dict_a=root_dictionary, dict_b=dictionary):
-                    cprint(f"✔︎ No errors found", "green")
-                else:
-                    if not is_error_found:
-                        is_error_found = True
+        self.__reporter.finish(is_error_found=is_error_found)
 
         return is_error_found
 
-    def check(self) -> None:
+    def check(self) -> bool:
         """
-        The function checks if the root dictionary has changed and compares it with other dictionaries.
+        The function checks which messages of the root dictionary changed and compares them with the
+        other dictionaries.
+
+        :return: a boolean value indicating whether any errors were found.
         """
-        if self.__is_root_dictionary_changed():
-            cprint("ℹ Root dictionary changed, comparing with others..", "yellow")
+        if self.__since is not None:
+            return self.check_since(ref=self.__since)
+
+        is_error_found: bool = False
+
+        root_fingerprints: Dict[str, str] = self.__get_root_fingerprints()
+        changed_messages: Optional[Set[str]] = self.__get_changed_root_messages(
+            root_fingerprints=root_fingerprints
+        )
+
+        if changed_messages is None or changed_messages:
+            if changed_messages is None:
+                self.__reporter.report_status(
+                    "ℹ Root dictionary changed, comparing with others..", "yellow"
+                )
+            else:
+                self.__reporter.report_status(
+                    f"ℹ Root dictionary changed ({len(changed_messages)} messages), comparing with others..",
+                    "yellow",
+                )
 
-            if self.__check_dictionaries():
-                cprint(
+            is_error_found = self.__check_dictionaries(message_names=changed_messages)
+
+            if is_error_found:
+                self.__reporter.report_status(
                     f"\n ℹ The state of the root dictionary not changed, you must solve the errors first",
                     "red",
                 )
             else:
+                root_dictionary: CompactDictionary = self.__dictionaries[
+                    self.__config.root_locale
+                ]
                 cache: ScannerCache = ScannerCache()
-                cache.set(
-                    dictionary=self.__dictionaries[self.__config.root_locale]
+                cache.set_state(
+                    FluentDictionaryState(
+                        language_code=root_dictionary.language_code,
+                        path=root_dictionary.path,
+                        fingerprints=root_fingerprints,
+                    )
+                )
+                save_run_stamp()
+                self.__reporter.report_status(
+                    f"\n✔ Dictionaries checked successfully", "green"
                 )
-                cprint(f"\n✔ Dictionaries checked successfully", "green")
         else:
-            cprint("✔︎ Root dictionary is up to date", "green")
+            save_run_stamp()
+            self.__reporter.report_status("✔︎ Root dictionary is up to date", "green")
+
+        self.__reporter.finish(is_error_found=is_error_found)
+
+        return is_error_found
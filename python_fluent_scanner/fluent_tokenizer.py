@@ -0,0 +1,461 @@
+import re
+import sys
+from typing import Container, Dict, List, Optional, Tuple
+
+from python_fluent_scanner.types.compact import (
+    ATTRIBUTE,
+    FUNCTION,
+    MESSAGE_REFERENCE,
+    SELECT_EXPRESSION,
+    TERM_REFERENCE,
+    VARIABLE,
+    CompactPlaceables,
+    make_placeables,
+)
+
+IDENTIFIER_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]*")
+FUNCTION_NAME_RE = re.compile(r"[A-Z][A-Z0-9_-]*")
+NUMBER_RE = re.compile(r"-?[0-9]+(?:\.[0-9]+)?")
+STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+BLANK_RE = re.compile(r"[ \r\n]*")
+BLANK_INLINE_RE = re.compile(r" *")
+TEXT_RE = re.compile(r"[{}\n]")
+
+# Kinds of the inline expressions returned by `FluentTokenizer.__parse_expression`: variable references,
+# expressions that can be used both as placeables and as selectors (literals and function calls), term
+# attributes, which can only be used as selectors, and the expressions that cannot be used as selectors
+# (message and term references, nested placeables).
+VARIABLE_EXPRESSION: int = 0
+OTHER_EXPRESSION: int = 1
+TERM_ATTRIBUTE_EXPRESSION: int = 2
+REFERENCE_EXPRESSION: int = 3
+
+
+class FluentTokenizerError(ValueError):
+    """
+    The error raised when the tokenizer meets a construct it does not support or a syntax error. The
+    reader then parses the file with `fluent.syntax` instead.
+    """
+
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(f"{message} at position {position}")
+
+
+class FluentTokenizer:
+    """
+    A hand-written tokenizer that extracts the messages of a Fluent file and their placeables in a
+    single pass, without building the `fluent.syntax` AST. It extracts the same placeables as the AST
+    reader: variables, function calls, message and term references and attributes, at any depth.
+
+    The tokenizer understands the whole Fluent syntax (comments, terms, attributes, nested placeables,
+    string literals, function calls and select expressions), and raises `FluentTokenizerError` on the
+    syntax errors it detects, including the unindented lines and the unterminated select expressions
+    that make the AST reader drop a message as junk, so that the reader falls back to the AST.
+    """
+
+    __source: str
+    __length: int
+
+    def __char(self, position: int) -> str:
+        """
+        The function returns the character at a position of the source, or an empty string at the end.
+        """
+        return self.__source[position] if position < self.__length else ""
+
+    def __skip_blank(self, position: int) -> int:
+        """
+        The function returns the position of the first character after `position` that is not a space
+        or a line break.
+        """
+        return BLANK_RE.match(self.__source, position).end()
+
+    def __skip_blank_inline(self, position: int) -> int:
+        """
+        The function returns the position of the first character after `position` that is not a space.
+        """
+        return BLANK_INLINE_RE.match(self.__source, position).end()
+
+    def __parse_identifier(self, position: int) -> Tuple[int, str]:
+        """
+        The function parses an identifier.
+
+        :return: a tuple of the position right after the identifier and the identifier.
+        """
+        match: Optional[re.Match] = IDENTIFIER_RE.match(self.__source, position)
+
+        if not match:
+            raise FluentTokenizerError("Expected an identifier", position)
+
+        return match.end(), match.group()
+
+    def __parse_call_arguments(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> int:
+        """
+        The function parses the arguments of a function call or a parametrized term, `position` is the
+        position right after the opening parenthesis. The placeables of the positional arguments are added
+        to `placeables` when it is provided.
+
+        :return: the position right after the closing parenthesis.
+        """
+        position = self.__skip_blank(position)
+
+        while self.__char(position) != ")":
+            match: Optional[re.Match] = IDENTIFIER_RE.match(self.__source, position)
+            is_named: bool = False
+
+            if match:
+                after_name: int = self.__skip_blank(match.end())
+                is_named = self.__char(after_name) == ":"
+
+            if is_named:
+                position = self.__skip_blank(after_name + 1)
+                literal: Optional[re.Match] = STRING_RE.match(
+                    self.__source, position
+                ) or NUMBER_RE.match(self.__source, position)
+
+                if not literal:
+                    raise FluentTokenizerError("Expected a literal", position)
+
+                position = literal.end()
+            else:
+                position, _, _ = self.__parse_expression(position, placeables)
+
+            position = self.__skip_blank(position)
+
+            if self.__char(position) == ",":
+                position = self.__skip_blank(position + 1)
+            elif self.__char(position) != ")":
+                raise FluentTokenizerError("Expected `,` or `)`", position)
+
+        return position + 1
+
+    def __parse_expression(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> Tuple[int, int, str]:
+        """
+        The function parses an inline expression. The variables, function calls and message and term
+        references of the expression are added to `placeables` when it is provided.
+
+        :return: a tuple of the position right after the expression, the kind of the expression and its
+        name (the name of the variable for variable references).
+        """
+        char: str = self.__char(position)
+
+        if char == "$":
+            position, name = self.__parse_identifier(position + 1)
+
+            if placeables is not None and name not in placeables:
+                placeables[name] = VARIABLE
+
+            return position, VARIABLE_EXPRESSION, name
+
+        if char == '"':
+            match: Optional[re.Match] = STRING_RE.match(self.__source, position)
+
+            if not match:
+                raise FluentTokenizerError("Unterminated string literal", position)
+
+            return match.end(), OTHER_EXPRESSION, ""
+
+        if char.isdigit() or (char == "-" and self.__char(position + 1).isdigit()):
+            return NUMBER_RE.match(self.__source, position).end(), OTHER_EXPRESSION, ""
+
+        if char == "{":
+            return (
+                self.__parse_placeable(position + 1, placeables),
+                REFERENCE_EXPRESSION,
+                "",
+            )
+
+        is_term: bool = char == "-"
+        start: int = position + 1 if is_term else position
+        position, name = self.__parse_identifier(start)
+
+        if not is_term and self.__char(position) == "(":
+            if not FUNCTION_NAME_RE.fullmatch(name):
+                raise FluentTokenizerError("Function names must be upper case", position)
+
+            if placeables is not None:
+                placeables.setdefault(f"{name}()", FUNCTION)
+
+            return (
+                self.__parse_call_arguments(position + 1, placeables),
+                OTHER_EXPRESSION,
+                "",
+            )
+
+        has_attribute: bool = self.__char(position) == "."
+
+        if has_attribute:
+            position, _ = self.__parse_identifier(position + 1)
+
+        if placeables is not None:
+            placeables.setdefault(
+                self.__source[start - 1 if is_term else start : position],
+                TERM_REFERENCE if is_term else MESSAGE_REFERENCE,
+            )
+
+        if is_term:
+            after_name: int = self.__skip_blank(position)
+
+            if self.__char(after_name) == "(":
+                position = self.__parse_call_arguments(after_name + 1, placeables)
+
+            if has_attribute:
+                return position, TERM_ATTRIBUTE_EXPRESSION, ""
+
+        return position, REFERENCE_EXPRESSION, ""
+
+    def __parse_variants(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> int:
+        """
+        The function parses the variants of a select expression, `position` is the position right after
+        the arrow.
+
+        :return: the position right after the closing brace of the select expression.
+        """
+        has_default_variant: bool = False
+
+        while True:
+            line_start: int = position
+            position = self.__skip_blank(position)
+
+            if self.__char(position) == "}":
+                if not has_default_variant or "\n" not in self.__source[line_start:position]:
+                    raise FluentTokenizerError("Invalid end of select expression", position)
+                return position + 1
+
+            if "\n" not in self.__source[line_start:position]:
+                raise FluentTokenizerError("Variants must start on a new line", position)
+
+            if self.__char(position) == "*":
+                if has_default_variant:
+                    raise FluentTokenizerError("Multiple default variants", position)
+                has_default_variant = True
+                position += 1
+
+            if self.__char(position) != "[":
+                raise FluentTokenizerError("Expected a variant key", position)
+
+            position = self.__skip_blank(position + 1)
+            key: Optional[re.Match] = NUMBER_RE.match(
+                self.__source, position
+            ) or IDENTIFIER_RE.match(self.__source, position)
+
+            if not key:
+                raise FluentTokenizerError("Invalid variant key", position)
+
+            position = self.__skip_blank(key.end())
+
+            if self.__char(position) != "]":
+                raise FluentTokenizerError("Expected `]`", position)
+
+            position = self.__parse_variant_pattern(position + 1, placeables)
+
+    def __parse_variant_pattern(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> int:
+        """
+        The function parses the pattern of a variant.
+
+        :return: the position of the end of the line that precedes the next variant or the closing brace.
+        """
+        source: str = self.__source
+        has_value: bool = False
+
+        while True:
+            match: Optional[re.Match] = TEXT_RE.search(source, position)
+
+            if not match:
+                raise FluentTokenizerError("Unterminated select expression", position)
+
+            char: str = match.group()
+
+            if source[position : match.start()].strip(" \r"):
+                has_value = True
+
+            if char == "{":
+                has_value = True
+                position = self.__parse_placeable(match.end(), placeables)
+            elif char == "}":
+                raise FluentTokenizerError("Unexpected `}`", match.start())
+            else:
+                next_position: int = self.__skip_blank(match.end())
+                next_char: str = self.__char(next_position)
+
+                if next_char in ("[", "*", "}"):
+                    if not has_value:
+                        raise FluentTokenizerError("Expected a variant value", position)
+
+                    return match.start()
+
+                # The text of a variant continues on indented lines only, an unindented line ends the
+                # select expression without its closing brace.
+                if next_char != "{" and source[next_position - 1] in ("\n", "\r"):
+                    raise FluentTokenizerError("Unterminated select expression", next_position)
+
+                position = match.end()
+
+    def __parse_placeable(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> int:
+        """
+        The function parses a placeable, `position` is the position right after its opening brace. The
+        placeables found in it, including the variants of a select expression, are added to `placeables`
+        when it is provided; a variable used as a selector has the `SELECT_EXPRESSION` type.
+
+        :return: the position right after the closing brace of the placeable.
+        """
+        position = self.__skip_blank(position)
+        position, kind, name = self.__parse_expression(position, placeables)
+        position = self.__skip_blank(position)
+
+        if self.__source.startswith("->", position):
+            if kind == REFERENCE_EXPRESSION:
+                raise FluentTokenizerError("Invalid selector", position)
+
+            if placeables is not None and kind == VARIABLE_EXPRESSION:
+                placeables[name] = SELECT_EXPRESSION
+
+            return self.__parse_variants(
+                self.__skip_blank_inline(position + 2), placeables
+            )
+
+        if self.__char(position) != "}":
+            raise FluentTokenizerError("Expected `}`", position)
+
+        if kind == TERM_ATTRIBUTE_EXPRESSION:
+            raise FluentTokenizerError("Term attributes cannot be used as placeables", position)
+
+        return position + 1
+
+    def __parse_entry_body(
+        self, position: int, placeables: Optional[Dict[str, int]]
+    ) -> int:
+        """
+        The function parses the value and the attributes of a message or a term, `position` is the
+        position right after the equal sign. The placeables of the value and of the attributes, and the
+        attributes themselves, are added to `placeables` when it is provided, which it is for messages.
+
+        :return: the position of the beginning of the line of the next entry, or the end of the source.
+        """
+        source: str = self.__source
+        has_value: bool = False
+        has_attributes: bool = False
+
+        while True:
+            match: Optional[re.Match] = TEXT_RE.search(source, position)
+            end: int = match.start() if match else self.__length
+
+            if not has_attributes and source[position:end].strip(" \r"):
+                has_value = True
+
+            if not match:
+                position = self.__length
+                break
+
+            char: str = match.group()
+
+            if char == "{":
+                if not has_attributes:
+                    has_value = True
+                position = self.__parse_placeable(match.end(), placeables)
+                continue
+
+            if char == "}":
+                raise FluentTokenizerError("Unexpected `}`", match.start())
+
+            position = match.end()
+            indented: int = self.__skip_blank_inline(position)
+            next_char: str = self.__char(indented)
+
+            if next_char in ("\n", "\r"):
+                continue
+
+            if indented == position or not next_char:
+                break
+
+            if next_char == ".":
+                indented, attribute_name = self.__parse_identifier(indented + 1)
+                indented = self.__skip_blank_inline(indented)
+
+                if self.__char(indented) != "=":
+                    raise FluentTokenizerError("Expected `=`", indented)
+
+                if placeables is not None:
+                    placeables[f".{attribute_name}"] = ATTRIBUTE
+
+                has_attributes = True
+                position = indented + 1
+            elif next_char in ("[", "*", "}"):
+                raise FluentTokenizerError("Unexpected special character", indented)
+
+        if not has_value and not has_attributes:
+            raise FluentTokenizerError("Expected a value", position)
+
+        if not has_value and placeables is None:
+            raise FluentTokenizerError("Terms must have a value", position)
+
+        return position
+
+    def parse(
+        self, source: str, defined: Container[str] = ()
+    ) -> Tuple[Dict[str, CompactPlaceables], List[str]]:
+        """
+        The function extracts the messages of a Fluent file.
+
+        :param source: The `source` parameter is the contents of the Fluent file
+        :type source: str
+        :param defined: The `defined` parameter is the names of the messages defined before the source,
+        when the source is a chunk of a larger file; they are reported as duplicates when defined again
+        :type defined: Container[str]
+        :return: a tuple of the dictionary that maps the message names to their placeables, from their
+        first definition, and the list of the message names that were defined more than once.
+        """
+        self.__source = source
+        self.__length = len(source)
+
+        messages: Dict[str, CompactPlaceables] = {}
+        duplicates: List[str] = []
+        position: int = 0
+
+        while position < self.__length:
+            char: str = source[position]
+
+            if char in ("\n", "\r"):
+                position += 1
+            elif char == "#":
+                end: int = source.find("\n", position)
+                end = self.__length if end == -1 else end
+                hashes: int = len(source[position:end]) - len(
+                    source[position:end].lstrip("#")
+                )
+
+                if hashes > 3 or self.__char(position + hashes) not in (" ", "\n", "\r", ""):
+                    raise FluentTokenizerError("Invalid comment", position)
+
+                position = end
+            else:
+                is_term: bool = char == "-"
+                position, name = self.__parse_identifier(
+                    position + 1 if is_term else position
+                )
+                position = self.__skip_blank_inline(position)
+
+                if self.__char(position) != "=":
+                    raise FluentTokenizerError("Expected `=`", position)
+
+                placeables: Optional[Dict[str, int]] = (
+                    None if is_term else {}
+                )
+                position = self.__parse_entry_body(position + 1, placeables)
+
+                if not is_term:
+                    if name in messages or name in defined:
+                        duplicates.append(name)
+                    else:
+                        messages[sys.intern(name)] = make_placeables(placeables)
+
+        return messages, duplicates
@@ -0,0 +1,468 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from termcolor import cprint
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.fluent_reporter import FluentTextReporter
+from python_fluent_scanner.types.compact import CompactDictionary, clear_interned_placeables
+from python_fluent_scanner.types.models import (
+    FluentFinding,
+    ScannerConfig,
+)
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.shared_cache import SharedCache
+from python_fluent_scanner.utils.discovery import find_dictionary_files, is_dictionary_pattern
+
+# IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE, editors often save by renaming a new file
+INOTIFY_MASK: int = 0x00000002 | 0x00000008 | 0x00000080 | 0x00000100
+
+# Editors save a file in several writes, changes are read this many seconds after the first event.
+DEBOUNCE_SECONDS: float = 0.01
+
+# The stamp of a dictionary is the path, inode, size and mtime of each of its files.
+DictionaryStamp = Tuple[Tuple[str, int, int, int], ...]
+
+
+class _Inotify:
+    __libc: ctypes.CDLL
+    __fd: int
+
+    def __init__(self, directories: Set[str]) -> None:
+        """
+        The function starts watching the given directories with the inotify API of Linux.
+
+        :param directories: The `directories` parameter is the set of the directories to watch
+        :type directories: Set[str]
+        """
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.__fd = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        for directory in directories:
+            if self.__libc.inotify_add_watch(self.__fd, directory.encode(), INOTIFY_MASK) < 0:
+                os.close(self.__fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> bool:
+        """
+        The function waits for a change in the watched directories and discards the pending events.
+
+        :param timeout: The `timeout` parameter is the maximum number of seconds to wait
+        :type timeout: float
+        :return: True if a change happened before the timeout.
+        """
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+
+        if not readable:
+            return False
+
+        time.sleep(DEBOUNCE_SECONDS)
+
+        try:
+            while os.read(self.__fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+        return True
+
+    def close(self) -> None:
+        """
+        The function stops watching the directories.
+        """
+        os.close(self.__fd)
+
+
+class FluentWatcher:
+    __config: ScannerConfig
+    __reader: FluentReader
+    __comparator: FluentComparator
+    __interval: float
+    __inotify: Optional[_Inotify]
+    __stamps: Dict[str, Optional[DictionaryStamp]]
+    __dictionaries: Dict[str, CompactDictionary]
+    __fingerprints: Dict[str, Dict[str, str]]
+    __findings: Dict[str, List[FluentFinding]]
+    __overlays: Dict[str, Dict[str, str]]
+
+    def __init__(
+        self,
+        config: ScannerConfig,
+        jobs: int = 1,
+        interval: float = 0.05,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        The function initializes a watcher and loads every dictionary of the configuration, which then
+        stay in memory while the watcher runs.
+
+        :param config: The `config` parameter is the configuration of the scanner
+        :type config: ScannerConfig
+        :param jobs: The `jobs` parameter is the maximum number of processes used for the first parse
+        :type jobs: int
+        :param interval: The `interval` parameter is the number of seconds between two checks of the
+        files when inotify is not available
+        :type interval: float
+        :param use_inotify: The `use_inotify` parameter enables inotify on Linux, polling is used otherwise
+        :type use_inotify: bool
+        """
+        self.__config = config
+        self.__reader = FluentReader(
+            cache=ScannerCache(),
+            jobs=jobs,
+            backend=config.reader,
+            stream_min_bytes=config.stream_min_bytes,
+            shared_cache=SharedCache() if config.shared_cache else None,
+        )
+        self.__comparator = FluentComparator()
+        self.__interval = interval
+        self.__inotify = None
+
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self.__inotify = _Inotify(
+                    directories={
+                        os.path.dirname(os.path.abspath(file_path))
+                        for path in config.dictionaries.values()
+                        for file_path in find_dictionary_files(path)
+                    }
+                )
+            except (OSError, AttributeError):
+                self.__inotify = None
+
+        self.__stamps = {
+            language_code: self.__get_stamp(path)
+            for language_code, path in config.dictionaries.items()
+        }
+        self.__dictionaries = self.__reader.parse_by_config(config=config)
+        self.__fingerprints = {
+            language_code: self.__get_fingerprints(dictionary)
+            for language_code, dictionary in self.__dictionaries.items()
+        }
+        self.__findings = {}
+        self.__overlays = {}
+
+    def __get_stamp(self, path: str) -> Optional[DictionaryStamp]:
+        """
+        The function returns the path, inode, size and mtime of each file of a dictionary, or `None` if
+        the file of a dictionary made of a single file does not exist (e.g. while an editor replaces it).
+        """
+        stamps: List[Tuple[str, int, int, int]] = []
+
+        for file_path in find_dictionary_files(path):
+            try:
+                stat: os.stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                if not is_dictionary_pattern(path):
+                    return None
+                continue
+
+            stamps.append((file_path, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+
+        return tuple(stamps)
+
+    def __get_fingerprints(self, dictionary: CompactDictionary) -> Dict[str, str]:
+        """
+        The function computes the fingerprints of the messages of a dictionary.
+        """
+        return self.__comparator.get_fingerprints(
+            self.__comparator.get_signatures(dictionary)
+        )
+
+    def __compare(
+        self, language_code: str, message_names: Optional[Set[str]] = None
+    ) -> List[FluentFinding]:
+        """
+        The function compares a dictionary with the root dictionary, limited to `message_names` if they are
+        provided, and stores the updated findings of the dictionary.
+        """
+        root_dictionary: CompactDictionary = self.__dictionaries[self.__config.root_locale]
+        dictionary: CompactDictionary = self.__dictionaries[language_code]
+
+        findings: List[FluentFinding] = self.__comparator.compare(
+            dict_a=root_dictionary, dict_b=dictionary, message_names=message_names
+        )
+
+        if message_names is not None:
+            findings = self.__comparator.update_findings(
+                findings=self.__findings[language_code],
+                scoped_findings=findings,
+                message_names=message_names,
+                dict_a=root_dictionary,
+                dict_b=dictionary,
+            )
+
+        self.__findings[language_code] = findings
+
+        return findings
+
+    def check(self) -> Dict[str, List[FluentFinding]]:
+        """
+        The function compares every dictionary with the root dictionary.
+
+        :return: a dictionary that maps the language codes of the dictionaries to their findings.
+        """
+        return {
+            language_code: self.__compare(language_code=language_code)
+            for language_code in self.__dictionaries
+            if language_code != self.__config.root_locale
+        }
+
+    def get_findings(self) -> Dict[str, List[FluentFinding]]:
+        """
+        The function returns the findings of every dictionary as of the last comparison.
+
+        :return: a dictionary that maps the language codes of the dictionaries to their findings.
+        """
+        return dict(self.__findings)
+
+    def poll(self) -> List[str]:
+        """
+        The function finds the dictionaries whose files changed since they were last loaded.
+
+        :return: the list of the language codes of the changed dictionaries.
+        """
+        changed_language_codes: List[str] = []
+
+        for language_code, path in self.__config.dictionaries.items():
+            stamp: Optional[DictionaryStamp] = self.__get_stamp(path)
+
+            if stamp is not None and stamp != self.__stamps[language_code]:
+                self.__stamps[language_code] = stamp
+                changed_language_codes.append(language_code)
+
+        return changed_language_codes
+
+    def __replace_dictionary(
+        self,
+        dictionary: CompactDictionary,
+        changed_messages: Dict[str, Set[str]],
+    ) -> None:
+        """
+        The function replaces a dictionary and adds its messages that changed to the messages to compare
+        again for each affected dictionary: every other dictionary for the root dictionary, the dictionary
+        itself otherwise.
+
+        :param dictionary: The `dictionary` parameter is the new version of the dictionary
+        :type dictionary: CompactDictionary
+        :param changed_messages: The `changed_messages` parameter maps the language codes of the affected
+        dictionaries to the names of the messages to compare again, it is updated in place
+        :type changed_messages: Dict[str, Set[str]]
+        """
+        language_code: str = dictionary.language_code
+        fingerprints: Dict[str, str] = self.__get_fingerprints(dictionary)
+        saved_fingerprints: Dict[str, str] = self.__fingerprints[language_code]
+
+        message_names: Set[str] = {
+            message_name
+            for message_name, fingerprint in fingerprints.items()
+            if saved_fingerprints.get(message_name) != fingerprint
+        }
+        message_names.update(saved_fingerprints.keys() - fingerprints.keys())
+
+        self.__dictionaries[language_code] = dictionary
+        self.__fingerprints[language_code] = fingerprints
+
+        if language_code == self.__config.root_locale:
+            affected_language_codes: List[str] = [
+                other_language_code
+                for other_language_code in self.__dictionaries
+                if other_language_code != self.__config.root_locale
+            ]
+        else:
+            affected_language_codes = [language_code]
+
+        for affected_language_code in affected_language_codes:
+            changed_messages.setdefault(affected_language_code, set()).update(
+                message_names
+            )
+
+    def __compare_changed_messages(
+        self, changed_messages: Dict[str, Set[str]]
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function compares the changed messages of the affected dictionaries with the root dictionary.
+        """
+        return {
+            language_code: self.__compare(
+                language_code=language_code,
+                message_names=changed_messages[language_code],
+            )
+            for language_code in self.__dictionaries
+            if language_code in changed_messages
+        }
+
+    def update(self, language_codes: List[str]) -> Dict[str, List[FluentFinding]]:
+        """
+        The function parses the given dictionaries again, with their files replaced by their overlays, and
+        compares only the messages that changed in them: a change of the root dictionary is compared with
+        every other dictionary, a change of another dictionary only with the root dictionary.
+
+        :param language_codes: The `language_codes` parameter is the list of the changed dictionaries
+        :type language_codes: List[str]
+        :return: a dictionary that maps the language codes of the dictionaries that were compared again to
+        their updated findings.
+        """
+        changed_messages: Dict[str, Set[str]] = {}
+
+        # The placeables of the replaced versions of the dictionaries would stay interned otherwise.
+        clear_interned_placeables()
+
+        for language_code in language_codes:
+            self.__replace_dictionary(
+                dictionary=self.__reader.parse_by_paths(
+                    paths={language_code: self.__config.dictionaries[language_code]},
+                    overlays={
+                        (language_code, file_path): source
+                        for file_path, source in self.__overlays.get(
+                            language_code, {}
+                        ).items()
+                    },
+                )[language_code],
+                changed_messages=changed_messages,
+            )
+
+        return self.__compare_changed_messages(changed_messages=changed_messages)
+
+    def __get_file_path(self, language_code: str, path: Optional[str]) -> str:
+        """
+        The function finds the file of a dictionary designated by `path`, the path of the dictionary if it
+        is not provided, as it is listed by `find_dictionary_files`.
+        """
+        dictionary_path: str = self.__config.dictionaries[language_code]
+        real_path: str = os.path.realpath(path if path is not None else dictionary_path)
+
+        for file_path in find_dictionary_files(dictionary_path):
+            if os.path.realpath(file_path) == real_path:
+                return file_path
+
+        raise ValueError(
+            f"{path or dictionary_path} is not a file of the dictionary {language_code}"
+        )
+
+    def set_overlay(
+        self, language_code: str, source: str, path: Optional[str] = None
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function replaces a file of a dictionary with the contents of an unsaved buffer of an editor,
+        until `remove_overlay` is called; the changes of the file are ignored meanwhile, those of the other
+        files of the dictionary are still loaded. Only the messages that changed are compared again, as in
+        `update`.
+
+        :param language_code: The `language_code` parameter is the code of the language of the buffer
+        :type language_code: str
+        :param source: The `source` parameter is the contents of the buffer, the whole file
+        :type source: str
+        :param path: The `path` parameter is the path of the file of the buffer, the path of the dictionary
+        if it is not provided
+        :type path: Optional[str]
+        :return: a dictionary that maps the language codes of the dictionaries that were compared again to
+        their updated findings.
+        :raises ValueError: if `path` is not a file of the dictionary.
+        """
+        file_path: str = self.__get_file_path(language_code=language_code, path=path)
+        self.__overlays.setdefault(language_code, {})[file_path] = source
+
+        return self.update(language_codes=[language_code])
+
+    def remove_overlay(
+        self, language_code: str, path: Optional[str] = None
+    ) -> Dict[str, List[FluentFinding]]:
+        """
+        The function drops the overlay of a file of a dictionary and loads the file again.
+
+        :param language_code: The `language_code` parameter is the code of the language of the overlay
+        :type language_code: str
+        :param path: The `path` parameter is the path of the file of the overlay, the path of the
+        dictionary if it is not provided
+        :type path: Optional[str]
+        :return: a dictionary that maps the language codes of the dictionaries that were compared again to
+        their updated findings.
+        :raises ValueError: if `path` is not a file of the dictionary.
+        """
+        file_path: str = self.__get_file_path(language_code=language_code, path=path)
+        overlays: Dict[str, str] = self.__overlays.get(language_code, {})
+
+        if file_path not in overlays:
+            return {}
+
+        del overlays[file_path]
+
+        if not overlays:
+            del self.__overlays[language_code]
+
+        return self.update(language_codes=[language_code])
+
+    def wait(self) -> List[str]:
+        """
+        The function blocks until at least one dictionary file changes.
+
+        :return: the list of the language codes of the changed dictionaries.
+        """
+        while True:
+            if self.__inotify:
+                self.__inotify.wait(timeout=1.0)
+            else:
+                time.sleep(self.__interval)
+
+            if changed_language_codes := self.poll():
+                return changed_language_codes
+
+    def run(self) -> None:
+        """
+        The function prints the findings of every dictionary, then keeps printing the updated findings of
+        the dictionaries affected by each change of the files until it is interrupted. A dictionary that
+        cannot be read, e.g. a file an editor is still writing or has just removed, is reported and keeps
+        its previous version until its next change.
+        """
+        reporter: FluentTextReporter = FluentTextReporter()
+
+        for language_code, findings in self.check().items():
+            reporter.report_dictionary(language_code=language_code, findings=findings)
+
+        cprint("\nℹ Watching dictionaries for changes, press Ctrl+C to stop", "yellow")
+
+        try:
+            while True:
+                changed_language_codes: List[str] = self.wait()
+                started_at: float = time.perf_counter()
+
+                updated_findings: Dict[str, List[FluentFinding]] = {}
+                read_errors: Dict[str, Exception] = {}
+
+                for language_code in changed_language_codes:
+                    try:
+                        updated_findings.update(
+                            self.update(language_codes=[language_code])
+                        )
+                    except (OSError, UnicodeDecodeError) as error:
+                        read_errors[language_code] = error
+
+                cprint(
+                    f"\nℹ {', '.join(changed_language_codes)} changed, checked in "
+                    f"{(time.perf_counter() - started_at) * 1000:.0f} ms",
+                    "yellow",
+                )
+
+                for language_code, error in read_errors.items():
+                    reporter.report_status(
+                        f"✘ Could not read the dictionary {language_code}: {error}", "red"
+                    )
+
+                for language_code, findings in updated_findings.items():
+                    reporter.report_dictionary(
+                        language_code=language_code, findings=findings
+                    )
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.__inotify:
+                self.__inotify.close()
@@ -1,12 +1,366 @@
-from python_fluent_scanner.fluent_scanner import FluentScanner
+import argparse
+import cProfile
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from python_fluent_scanner.types.enums import FluentReportFormats
+from python_fluent_scanner.utils.git import GitError
+from python_fluent_scanner.utils.run_stamp import is_up_to_date
+from python_fluent_scanner.utils.timings import (
+    enable_timings,
+    format_timings,
+    get_timings,
+    save_timings,
+    span,
+)
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    """
+    The function builds the parser of the command line arguments of the scanner.
+    """
+    parser = argparse.ArgumentParser(
+        prog="fluent_scanner",
+        description="Scan Fluent localization dictionaries for missing and extra keys.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes used to parse dictionaries (default: CPU count)",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="keep the dictionaries in memory and check them again when their files change",
+    )
+    parser.add_argument(
+        "--daemon",
+        nargs="?",
+        const="",
+        metavar="SOCKET",
+        help="keep the dictionaries in memory and answer the requests of editors on a Unix domain "
+        "socket (default: .fluent_scanner_cache/daemon.sock)",
+    )
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        metavar="CONFIG",
+        help="check the projects of several configuration files at once, e.g. the sub-projects of "
+        "a monorepo; the paths of the dictionaries are relative to the directory of their "
+        "configuration",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="only check the dictionaries changed since this git revision",
+    )
+    parser.add_argument(
+        "--fix-renames",
+        action="store_true",
+        help="rename the extra messages and variables of the dictionaries to the missing ones they "
+        "were likely renamed from",
+    )
+    parser.add_argument(
+        "--format",
+        type=FluentReportFormats,
+        default=FluentReportFormats.TEXT,
+        choices=list(FluentReportFormats),
+        metavar="{text,jsonl,sarif}",
+        help="format of the report written to stdout (default: text)",
+    )
+    parser.add_argument(
+        "--timings",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="print the time spent in each stage, and save it as JSON to FILE if provided",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="fluent_scanner.prof",
+        metavar="FILE",
+        help="profile the run with cProfile and save the stats to FILE (default: fluent_scanner.prof)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    cache_parser = subparsers.add_parser(
+        "cache", help="manage the parse cache shared by every project"
+    )
+    cache_subparsers = cache_parser.add_subparsers(
+        dest="cache_command", metavar="COMMAND", required=True
+    )
+    cache_subparsers.add_parser(
+        "stats", help="print the location, the size and the limits of the shared cache"
+    )
+    prune_parser = cache_subparsers.add_parser(
+        "prune", help="evict the least recently used entries of the shared cache"
+    )
+    prune_parser.add_argument(
+        "--max-bytes",
+        type=int,
+        help="total size of the entries to keep (default: the limit of the cache)",
+    )
+    prune_parser.add_argument(
+        "--max-entries",
+        type=int,
+        help="number of entries to keep (default: the limit of the cache)",
+    )
+
+    query_options = argparse.ArgumentParser(add_help=False)
+    query_options.add_argument(
+        "--json",
+        action="store_true",
+        help="print the answer of each query as a JSON object on one line",
+    )
+    query_parser = subparsers.add_parser(
+        "query", help="query the index of the dictionaries of the configuration"
+    )
+    query_subparsers = query_parser.add_subparsers(
+        dest="query_command", metavar="COMMAND", required=True
+    )
+    query_subparsers.add_parser(
+        "message",
+        parents=[query_options],
+        help="print the locales that define and the locales that miss messages",
+    ).add_argument("names", nargs="+", metavar="MESSAGE")
+    query_subparsers.add_parser(
+        "variable",
+        parents=[query_options],
+        help="print the messages that use variables, with the locales in which they use them",
+    ).add_argument("names", nargs="+", metavar="VARIABLE")
+    signature_parser = query_subparsers.add_parser(
+        "signature",
+        parents=[query_options],
+        help="print the messages with the same placeables as messages, with the locales in which "
+        "they have them",
+    )
+    signature_parser.add_argument("names", nargs="+", metavar="MESSAGE")
+    signature_parser.add_argument(
+        "--locale",
+        metavar="LANGUAGE_CODE",
+        help="locale of the messages (default: the root locale)",
+    )
+
+    return parser
+
+
+def format_bytes(size: int) -> str:
+    """
+    The function formats a size in bytes in MiB.
+    """
+    return f"{size / 1024 / 1024:.1f} MiB"
+
+
+def run_cache_command(args: argparse.Namespace) -> None:
+    """
+    The function runs a `cache` subcommand on the shared cache.
+    """
+    from python_fluent_scanner.utils.shared_cache import SharedCache
+
+    shared_cache = SharedCache()
+
+    if args.cache_command == "stats":
+        stats: Dict[str, int] = shared_cache.get_stats()
+        print(f"Shared cache: {shared_cache.get_path()}")
+        print(f"Entries: {stats['entries']} / {stats['max_entries']}")
+        print(
+            f"Size: {format_bytes(stats['bytes'])} / {format_bytes(stats['max_bytes'])}"
+        )
+    else:
+        removed: Dict[str, int] = shared_cache.prune(
+            max_bytes=args.max_bytes, max_entries=args.max_entries
+        )
+        print(
+            f"Removed {removed['entries']} entries ({format_bytes(removed['bytes'])})"
+        )
+
+
+def format_locales(messages: Dict[str, List[str]]) -> str:
+    """
+    The function formats messages with the locales of each message.
+    """
+    return (
+        ", ".join(
+            f"{message_name} ({', '.join(language_codes)})"
+            for message_name, language_codes in messages.items()
+        )
+        or "-"
+    )
+
+
+def run_query_command(args: argparse.Namespace) -> None:
+    """
+    The function runs a `query` subcommand on the index of the dictionaries, updated first with the
+    locales whose files changed, and prints the answer of each query on one line.
+    """
+    from python_fluent_scanner.fluent_index import get_index
+    from python_fluent_scanner.utils.config import ConfigReader
+
+    config = ConfigReader().get_config()
+    index = get_index(config=config, jobs=max(args.jobs, 1))
+
+    for name in args.names:
+        answer: Dict[str, Any]
+
+        if args.query_command == "message":
+            answer = {
+                "message": name,
+                "locales": index.get_locales(name),
+                "missing": index.get_missing_locales(name),
+            }
+            line: str = f"{name}: {', '.join(answer['locales']) or '-'}"
+
+            if answer["missing"]:
+                line += f" (missing: {', '.join(answer['missing'])})"
+        elif args.query_command == "variable":
+            name = name.removeprefix("$")
+            answer = {"variable": name, "messages": index.get_variable_messages(name)}
+            line = f"${name}: {format_locales(answer['messages'])}"
+        else:
+            language_code: str = args.locale or config.root_locale
+            answer = {
+                "message": name,
+                "language_code": language_code,
+                "signature": index.get_fingerprint(name, language_code),
+                "messages": index.get_signature_messages(name, language_code),
+            }
+            line = f"{name}: {format_locales(answer['messages'])}"
+
+        print(json.dumps(answer, ensure_ascii=False) if args.json else line)
+
+
+def run(args: argparse.Namespace) -> bool:
+    """
+    The function creates an instance of the FluentScanner class and calls its check method, or runs a
+    FluentWatcher in watch mode, a FluentDaemon in daemon mode, or a FluentBatchScanner for several
+    configuration files. The scanner is imported here, so that the up-to-date case does not
+    import pydantic and fluent.syntax.
+
+    :return: a boolean value indicating whether any errors were found.
+    """
+    from python_fluent_scanner.fluent_batch_scanner import FluentBatchScanner
+    from python_fluent_scanner.fluent_daemon import DAEMON_SOCKET_PATH, FluentDaemon
+    from python_fluent_scanner.fluent_reporter import get_reporter
+    from python_fluent_scanner.fluent_scanner import FluentScanner
+    from python_fluent_scanner.fluent_watcher import FluentWatcher
+    from python_fluent_scanner.utils.config import ConfigReader
+
+    with span("total"):
+        if args.watch:
+            watcher = FluentWatcher(
+                config=ConfigReader().get_config(), jobs=max(args.jobs, 1)
+            )
+            watcher.run()
+
+            return False
+        elif args.daemon is not None:
+            daemon = FluentDaemon(
+                config=ConfigReader().get_config(),
+                socket_path=args.daemon or DAEMON_SOCKET_PATH,
+                jobs=max(args.jobs, 1),
+            )
+            daemon.serve()
+
+            return False
+        elif args.configs:
+            batch_scanner = FluentBatchScanner(
+                config_filenames=args.configs,
+                jobs=max(args.jobs, 1),
+                reporter=get_reporter(report_format=args.format),
+            )
+
+            return batch_scanner.check()
+        else:
+            scanner = FluentScanner(
+                jobs=max(args.jobs, 1),
+                since=args.since,
+                reporter=get_reporter(report_format=args.format),
+                fix_renames=args.fix_renames,
+            )
+
+            return scanner.check()
 
 
 def main() -> None:
     """
-    The main function creates an instance of the FluentScanner class and calls its check method.
+    The main function runs the scanner, with cProfile and the timings of its stages when they are
+    requested, which are printed to stderr so that stdout only holds the report. Nothing is parsed when
+    the run stamp proves that the root dictionary is up to date.
+
+    The process exits with the code 1 if errors were found, and 2 if the arguments are invalid, e.g. an
+    unknown `--since` revision.
     """
-    scanner = FluentScanner()
-    scanner.check()
+    parser: argparse.ArgumentParser = get_argument_parser()
+    args = parser.parse_args()
+
+    if args.command == "cache":
+        run_cache_command(args)
+        return
+
+    if args.command == "query":
+        run_query_command(args)
+        return
+
+    if (
+        sum([args.watch, args.daemon is not None, bool(args.configs), bool(args.since)])
+        > 1
+    ):
+        parser.error("--watch, --daemon, --configs and --since cannot be used together")
+
+    if (
+        args.watch or args.daemon is not None
+    ) and args.format != FluentReportFormats.TEXT:
+        parser.error("--watch and --daemon only support the text format")
+
+    if (args.watch or args.daemon is not None or args.configs) and args.fix_renames:
+        parser.error("--fix-renames cannot be used with --watch, --daemon or --configs")
+
+    if (
+        not (args.watch or args.since or args.profile or args.timings is not None)
+        and args.daemon is None
+        and not args.configs
+        and args.format == FluentReportFormats.TEXT
+        and is_up_to_date()
+    ):
+        from termcolor import cprint
+
+        cprint("✔︎ Root dictionary is up to date", "green")
+        return
+
+    profile: Optional[cProfile.Profile] = cProfile.Profile() if args.profile else None
+
+    if args.timings is not None:
+        enable_timings()
+
+    is_error_found: bool = False
+
+    try:
+        if profile:
+            is_error_found = profile.runcall(run, args)
+        else:
+            is_error_found = run(args)
+    except GitError as error:
+        parser.error(str(error))
+    finally:
+        if profile:
+            profile.dump_stats(args.profile)
+            print(f"\nProfile saved to {args.profile}", file=sys.stderr)
+
+        if args.timings is not None:
+            timings: Dict[str, Dict[str, float]] = get_timings()
+            print(f"\n{format_timings(timings)}", file=sys.stderr)
+
+            if args.timings:
+                save_timings(path=args.timings, timings=timings)
+
+    if is_error_found:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from python_fluent_scanner.types.enums import FluentPlaceableTypes
+from python_fluent_scanner.types.models import (
+    FluentDictionary,
+    FluentDictionaryCacheEntry,
+    FluentFileStamp,
+    FluentMessage,
+    FluentPlaceable,
+)
+
+# Placeable types are stored as small integers, the index of the type in `PLACEABLE_TYPES`.
+PLACEABLE_TYPES: Tuple[FluentPlaceableTypes, ...] = tuple(FluentPlaceableTypes)
+PLACEABLE_TYPE_CODES: Dict[FluentPlaceableTypes, int] = {
+    placeable_type: code for code, placeable_type in enumerate(PLACEABLE_TYPES)
+}
+VARIABLE: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.VARIABLE]
+SELECT_EXPRESSION: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.SELECT_EXPRESSION]
+FUNCTION: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.FUNCTION]
+MESSAGE_REFERENCE: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.MESSAGE_REFERENCE]
+TERM_REFERENCE: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.TERM_REFERENCE]
+ATTRIBUTE: int = PLACEABLE_TYPE_CODES[FluentPlaceableTypes.ATTRIBUTE]
+
+# The type codes of the placeables that are variables (`$count`): the variables and the variables used
+# as selectors.
+VARIABLE_TYPES: Tuple[int, ...] = (VARIABLE, SELECT_EXPRESSION)
+
+# The placeables of a message are a tuple of (name, type code) pairs in the order of the source. The
+# names are the ones of the variables (`count`), the called functions (`NUMBER()`), the referenced
+# messages and terms with their attributes (`message`, `message.title`, `-brand`) and the attributes of
+# the message itself (`.title`).
+CompactPlaceables = Tuple[Tuple[str, int], ...]
+
+# The interned placeables are dropped when there are this many, so that a long-running watcher or daemon
+# does not keep every tuple of placeables it has ever seen; tuples cannot be weakly referenced.
+INTERNED_PLACEABLES_MAX: int = 1 << 16
+
+_interned_placeables: Dict[CompactPlaceables, CompactPlaceables] = {}
+
+
+def make_placeables(placeables: Dict[str, int]) -> CompactPlaceables:
+    """
+    The function converts the placeables of a message to their compact representation. Equal
+    placeables are interned, so that the many messages that use the same variables share one tuple.
+
+    :param placeables: The `placeables` parameter maps the names of the placeables to their type codes
+    :type placeables: Dict[str, int]
+    :return: the interned tuple of the (name, type code) pairs.
+    """
+    if not placeables:
+        return ()
+
+    return intern_placeables(
+        tuple([(sys.intern(name), code) for name, code in placeables.items()])
+    )
+
+
+def intern_placeables(placeables: CompactPlaceables) -> CompactPlaceables:
+    """
+    The function returns the shared tuple equal to `placeables`, registering `placeables` if there is
+    none yet.
+
+    :param placeables: The `placeables` parameter is the tuple of the (name, type code) pairs
+    :type placeables: CompactPlaceables
+    :return: the interned tuple.
+    """
+    interned: Optional[CompactPlaceables] = _interned_placeables.get(placeables)
+
+    if interned is None:
+        if len(_interned_placeables) >= INTERNED_PLACEABLES_MAX:
+            _interned_placeables.clear()
+
+        interned = _interned_placeables[placeables] = placeables
+
+    return interned
+
+
+def clear_interned_placeables() -> None:
+    """
+    The function drops the interned placeables. The dictionaries that use them keep them, but the
+    placeables read afterwards are not shared with them anymore.
+    """
+    _interned_placeables.clear()
+
+
+@dataclass(slots=True)
+class CompactDictionary:
+    """
+    The representation of a dictionary used by the reader and the comparator. It holds the same data as
+    `FluentDictionary` without a validated object per message and per placeable; it is converted to
+    `FluentDictionary` only to be stored or exported.
+
+    The dictionary of a locale split into several files has the path of the files in the
+    configuration as `path`, and maps each message to the file that defines it in `sources`.
+    """
+
+    language_code: str
+    path: str
+    messages: Dict[str, CompactPlaceables]
+    sources: Dict[str, str] = field(default_factory=dict)
+
+    def get_source(self, message_name: str) -> str:
+        """
+        The function returns the path of the file that defines a message.
+
+        :param message_name: The `message_name` parameter is the name of the message
+        :type message_name: str
+        :return: the path of the file.
+        """
+        return self.sources.get(message_name, self.path)
+
+    @classmethod
+    def from_model(cls, dictionary: FluentDictionary) -> "CompactDictionary":
+        """
+        The function converts a `FluentDictionary` to its compact representation.
+        """
+        return cls(
+            language_code=dictionary.language_code,
+            path=dictionary.path,
+            messages={
+                sys.intern(message_name): make_placeables(
+                    {
+                        placeable_name: PLACEABLE_TYPE_CODES[placeable.placeable_type]
+                        for placeable_name, placeable in message.placeables.items()
+                    }
+                )
+                for message_name, message in dictionary.messages.items()
+            },
+            sources=dict(dictionary.sources),
+        )
+
+    def to_model(self) -> FluentDictionary:
+        """
+        The function converts the dictionary to a `FluentDictionary`.
+        """
+        return FluentDictionary(
+            language_code=self.language_code,
+            path=self.path,
+            messages={
+                message_name: FluentMessage(
+                    placeables={
+                        placeable_name: FluentPlaceable(placeable_type=PLACEABLE_TYPES[code])
+                        for placeable_name, code in placeables
+                    }
+                )
+                for message_name, placeables in self.messages.items()
+            },
+            sources=dict(self.sources),
+        )
+
+
+@dataclass(slots=True)
+class CompactCacheEntry:
+    """
+    The compact representation of `FluentDictionaryCacheEntry`.
+    """
+
+    stamp: FluentFileStamp
+    duplicates: List[str]
+    dictionary: CompactDictionary
+
+    @classmethod
+    def from_model(cls, entry: FluentDictionaryCacheEntry) -> "CompactCacheEntry":
+        """
+        The function converts a `FluentDictionaryCacheEntry` to its compact representation.
+        """
+        return cls(
+            stamp=entry.stamp,
+            duplicates=entry.duplicates,
+            dictionary=CompactDictionary.from_model(entry.dictionary),
+        )
+
+    def to_model(self) -> FluentDictionaryCacheEntry:
+        """
+        The function converts the entry to a `FluentDictionaryCacheEntry`.
+        """
+        return FluentDictionaryCacheEntry(
+            stamp=self.stamp,
+            duplicates=self.duplicates,
+            dictionary=self.dictionary.to_model(),
+        )
+
+
+# A duplicate message is the name of the message and the paths of the files of its first and its other
+# definition, which are the same when the message is defined twice in one file.
+CompactDuplicate = Tuple[str, str, str]
+
+
+@dataclass(slots=True)
+class CompactLocaleEntry:
+    """
+    The parse cache entry of a locale split into several files. It holds the merged dictionary of the
+    locale and an index of its files: their stamps, the messages each file defines and the duplicates
+    found in each file, so that the dictionary can be patched when some of the files change.
+    """
+
+    path: str
+    stamps: Dict[str, FluentFileStamp]
+    file_messages: Dict[str, List[str]]
+    file_duplicates: Dict[str, List[str]]
+    duplicates: List[CompactDuplicate]
+    dictionary: CompactDictionary
+
+
+# The stamp of a file used to tell whether it changed: its path, size and mtime in nanoseconds.
+CompactFileStamp = Tuple[str, int, int]
+
+
+@dataclass(slots=True)
+class CompactIndex:
+    """
+    The inverted index of the dictionaries of a configuration. Each locale is a bit of a bitset, the
+    position of its language code in `language_codes`:
+
+    - `message_locales` maps the names of the messages to the bitset of the locales that define them
+    - `variable_messages` maps the names of the variables to the messages that use them, each with the
+      bitset of the locales in which it uses the variable
+    - `signature_messages` maps the fingerprints of the signatures to the messages that have them, each
+      with the bitset of the locales in which it has the signature
+
+    `fingerprints` holds the fingerprint of each message of each locale and `signatures` the signature
+    of each fingerprint, so that the index can be updated with the messages that changed only. `stamps`
+    holds the stamps of the files of each locale when it was indexed, `None` if they could not prove
+    that the files did not change since.
+    """
+
+    language_codes: List[str]
+    stamps: Dict[str, Optional[Tuple[CompactFileStamp, ...]]]
+    fingerprints: Dict[str, Dict[str, str]]
+    signatures: Dict[str, CompactPlaceables]
+    message_locales: Dict[str, int]
+    variable_messages: Dict[str, Dict[str, int]]
+    signature_messages: Dict[str, Dict[str, int]]
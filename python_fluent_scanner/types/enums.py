@@ -6,3 +6,31 @@ import enum
 class FluentPlaceableTypes(enum.Enum):
     VARIABLE: str = "VARIABLE"
     SELECT_EXPRESSION: str = "SELECT_EXPRESSION"
+    FUNCTION: str = "FUNCTION"
+    MESSAGE_REFERENCE: str = "MESSAGE_REFERENCE"
+    TERM_REFERENCE: str = "TERM_REFERENCE"
+    ATTRIBUTE: str = "ATTRIBUTE"
+
+
+# The `FluentFindingTypes` class is an enumeration that represents the kinds of errors found when a
+# dictionary is compared with the root dictionary.
+class FluentFindingTypes(enum.Enum):
+    MISSING_MESSAGE: str = "MISSING_MESSAGE"
+    EXTRA_MESSAGES: str = "EXTRA_MESSAGES"
+    MISSING_PLACEABLE: str = "MISSING_PLACEABLE"
+    PLACEABLE_TYPE_MISMATCH: str = "PLACEABLE_TYPE_MISMATCH"
+    EXTRA_PLACEABLES: str = "EXTRA_PLACEABLES"
+
+
+# The `FluentReaderBackends` class is an enumeration that represents the ways to extract the messages
+# of a Fluent file.
+class FluentReaderBackends(enum.Enum):
+    AST: str = "ast"
+    FAST: str = "fast"
+
+
+# The `FluentReportFormats` class is an enumeration that represents the formats of the report of a check.
+class FluentReportFormats(enum.Enum):
+    TEXT: str = "text"
+    JSONL: str = "jsonl"
+    SARIF: str = "sarif"
@@ -1,14 +1,19 @@
-from typing import Dict
+from typing import Dict, List, Optional
 from typing_extensions import Annotated
 from pydantic import AfterValidator, BaseModel
-from python_fluent_scanner.types.enums import FluentPlaceableTypes
+from python_fluent_scanner.types.enums import (
+    FluentFindingTypes,
+    FluentPlaceableTypes,
+    FluentReaderBackends,
+)
 
+from python_fluent_scanner.utils.stream import STREAM_MIN_BYTES
 from python_fluent_scanner.validators.config_validators import (
     validate_dictionaries_dict,
-    validate_path,
+    validate_dictionary_path,
 )
 
-DictionaryPath = Annotated[str, AfterValidator(validate_path)]
+DictionaryPath = Annotated[str, AfterValidator(validate_dictionary_path)]
 ScannerConfigDict = Annotated[
     Dict[str, DictionaryPath], AfterValidator(validate_dictionaries_dict)
 ]
@@ -17,6 +22,10 @@ ScannerConfigDict = Annotated[
 class ScannerConfig(BaseModel):
     root_locale: str
     dictionaries: Dict[str, DictionaryPath]
+    reader: FluentReaderBackends = FluentReaderBackends.AST
+    stream_min_bytes: int = STREAM_MIN_BYTES
+    shared_cache: bool = False
+    index: bool = False
 
 
 class FluentPlaceable(BaseModel):
@@ -31,3 +40,47 @@ class FluentDictionary(BaseModel):
     language_code: str
     path: str
     messages: Dict[str, FluentMessage]
+    sources: Dict[str, str] = {}
+
+
+class FluentDictionaryState(BaseModel):
+    language_code: str
+    path: str
+    fingerprints: Dict[str, str]
+
+
+class FluentFileStamp(BaseModel):
+    path: str
+    size: int
+    mtime_ns: int
+    is_stat_reliable: bool
+    content_hash: str
+
+
+class FluentDictionaryCacheEntry(BaseModel):
+    stamp: FluentFileStamp
+    duplicates: List[str]
+    dictionary: FluentDictionary
+
+
+class FluentFinding(BaseModel):
+    finding_type: FluentFindingTypes
+    language_code: str
+    message_name: Optional[str] = None
+    placeable_name: Optional[str] = None
+    expected_type: Optional[FluentPlaceableTypes] = None
+    actual_type: Optional[FluentPlaceableTypes] = None
+    names: List[str] = []
+    suggestion: Optional[str] = None
+
+
+class FluentDuplicate(BaseModel):
+    message_name: str
+    first_path: str
+    second_path: str
+
+
+class FluentScanResult(BaseModel):
+    root_locale: str
+    findings: Dict[str, List[FluentFinding]]
+    duplicates: Dict[str, List[FluentDuplicate]]
@@ -1,29 +1,117 @@
-from genericpath import isdir
+import contextlib
+import hashlib
 import os
-from typing import Optional
+import tempfile
+from typing import Any, Callable, Iterator, Optional
 
 from pydantic import ValidationError
 
-from python_fluent_scanner.types.models import FluentDictionary
+from python_fluent_scanner.types.compact import (
+    CompactCacheEntry,
+    CompactDictionary,
+    CompactIndex,
+    CompactLocaleEntry,
+)
+from python_fluent_scanner.utils.cache_format import (
+    CacheFormatError,
+    dump_dictionary,
+    dump_entry,
+    dump_index,
+    dump_locale_entry,
+    load_dictionary,
+    load_entry,
+    load_index,
+    load_locale_entry,
+)
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import FluentDictionary, FluentDictionaryState
+from python_fluent_scanner.utils.locks import file_lock
+from python_fluent_scanner.utils.run_stamp import CACHE_FOLDER_NAME
+from python_fluent_scanner.utils.timings import timed
+
+# The version of the layout of the files in the cache folder, raised when cache files are moved or
+# renamed, so that the files left by the previous layouts are removed once.
+CACHE_LAYOUT_VERSION: int = 2
 
 
 class ScannerCache:
+    """
+    The cache of the scanner in the `.fluent_scanner_cache` folder of the current directory, which can be
+    used by several processes at once, e.g. a pre-commit hook and an editor. Cache files are replaced
+    atomically, read under a shared lock of the folder and written or removed under an exclusive one,
+    and only one process at a time rebuilds stale entries, see `rebuild_lock`.
+    """
+
     __cache_folder_path: str
+    __parsed_folder_path: str
+    __locales_folder_path: str
+    __state_folder_path: str
 
     def __init__(self) -> None:
         """
         The function initializes a class instance with a private variable representing the path to a cache
         folder.
         """
-        self.__cache_folder_path = f"{os.getcwd()}/.fluent_scanner_cache/"
+        self.__cache_folder_path = f"{os.getcwd()}/{CACHE_FOLDER_NAME}/"
+        self.__parsed_folder_path = f"{self.__cache_folder_path}parsed/"
+        self.__locales_folder_path = f"{self.__cache_folder_path}locales/"
+        self.__state_folder_path = f"{self.__cache_folder_path}state/"
         self.__create_cache_folder()
+        self.__remove_stale_files()
 
     def __create_cache_folder(self) -> None:
         """
-        The function creates a cache folder if it does not already exist.
+        The function creates the cache folder and its subfolders if they do not already exist.
+        """
+        os.makedirs(self.__parsed_folder_path, exist_ok=True)
+        os.makedirs(self.__locales_folder_path, exist_ok=True)
+        os.makedirs(self.__state_folder_path, exist_ok=True)
+
+    def __is_stale_file(self, folder_path: str, filename: str) -> bool:
         """
-        if not os.path.isdir(self.__cache_folder_path):
-            os.mkdir(self.__cache_folder_path)
+        The function checks whether a file of the parse cache was left by a previous layout of the cache
+        folder: the JSON entries of the first versions of the scanner, the entries of each locale saved
+        directly in the `parsed` folder and the entries that are not keyed by reader backend.
+        """
+        if filename.startswith("."):
+            return False
+
+        if folder_path == self.__parsed_folder_path:
+            return True
+
+        return not filename.endswith(
+            tuple(f".{backend.value}.bin" for backend in FluentReaderBackends)
+        )
+
+    def __remove_stale_files(self) -> None:
+        """
+        The function removes the files left in the parse cache by the previous layouts of the cache
+        folder, which are never read again. The folder is only walked when its layout version changed.
+        """
+        layout_path: str = f"{self.__cache_folder_path}layout"
+
+        try:
+            with open(layout_path) as file:
+                if file.read() == str(CACHE_LAYOUT_VERSION):
+                    return
+        except FileNotFoundError:
+            pass
+
+        with file_lock(self.__get_lock_path()):
+            for root_path in (self.__parsed_folder_path, self.__locales_folder_path):
+                for folder_path, _, filenames in os.walk(root_path):
+                    folder_path = os.path.join(folder_path, "")
+
+                    for filename in filenames:
+                        if not self.__is_stale_file(folder_path, filename):
+                            continue
+
+                        try:
+                            os.remove(f"{folder_path}{filename}")
+                        except FileNotFoundError:
+                            pass
+
+        self.__write_file(layout_path, str(CACHE_LAYOUT_VERSION).encode("utf-8"))
 
     def __get_dictionary_cache_path(self, language_code: str) -> str:
         """
@@ -35,22 +123,154 @@ class ScannerCache:
         :type language_code: str
         :return: a string that represents the path to a dictionary cache file. The path is constructed by
         concatenating the `__cache_folder_path` attribute with the `language_code` parameter and the file
-        extension ".json".
+        extension ".bin".
+        """
+        return f"{self.__cache_folder_path}{language_code}.bin"
+
+    def __get_entry_cache_path(
+        self, language_code: str, path: str, backend: FluentReaderBackends
+    ) -> str:
+        """
+        The function returns the file path for the parse cache entry of a Fluent file.
+
+        :param language_code: The `language_code` parameter is a string that represents the code for a
+        specific language
+        :type language_code: str
+        :param path: The `path` parameter is the path of the Fluent file
+        :type path: str
+        :param backend: The `backend` parameter is the reader backend that extracts the messages, the
+        backends may extract different messages from the same file
+        :type backend: FluentReaderBackends
+        :return: a string that represents the path to the parse cache entry of the file.
+        """
+        digest: str = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+
+        return f"{self.__parsed_folder_path}{language_code}/{digest}.{backend.value}.bin"
+
+    def __get_locale_entry_cache_path(
+        self, language_code: str, backend: FluentReaderBackends
+    ) -> str:
+        """
+        The function returns the file path for the parse cache entry of a locale split into several
+        files.
+
+        :param language_code: The `language_code` parameter is a string that represents the code for a
+        specific language
+        :type language_code: str
+        :param backend: The `backend` parameter is the reader backend that extracts the messages
+        :type backend: FluentReaderBackends
+        :return: a string that represents the path to the parse cache entry of the locale.
+        """
+        return f"{self.__locales_folder_path}{language_code}.{backend.value}.bin"
+
+    def __get_lock_path(self) -> str:
+        """
+        The function returns the path of the lock file of the cache folder, which the readers of cache
+        files lock shared and the writers exclusively.
+        """
+        return f"{self.__cache_folder_path}.lock"
+
+    def __get_index_cache_path(self) -> str:
+        """
+        The function returns the file path for the inverted index of the dictionaries.
+        """
+        return f"{self.__cache_folder_path}index.bin"
+
+    def __get_state_cache_path(self, language_code: str) -> str:
+        """
+        The function returns the file path for the saved state of a dictionary based on the given
+        language code.
+
+        :param language_code: The `language_code` parameter is a string that represents the code for a
+        specific language
+        :type language_code: str
+        :return: a string that represents the path to the saved state of the dictionary of the language.
+        """
+        return f"{self.__state_folder_path}{language_code}.json"
+
+    def __write_file(self, path: str, data: bytes) -> None:
+        """
+        The function writes a cache file atomically: the data is written to a temporary file in the same
+        folder, which then replaces the cache file, so that a reader never sees a partially written file.
+
+        :param path: The `path` parameter is the path to the cache file
+        :type path: str
+        :param data: The `data` parameter is the contents of the cache file
+        :type data: bytes
+        """
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+        )
+
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+
+            with file_lock(self.__get_lock_path()):
+                os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def __read_file(self, path: str) -> Optional[bytes]:
+        """
+        The function reads a cache file.
+
+        :param path: The `path` parameter is the path to the cache file
+        :type path: str
+        :return: the contents of the file, or `None` if it does not exist.
         """
-        return f"{self.__cache_folder_path}{language_code}.json"
+        try:
+            with file_lock(self.__get_lock_path(), shared=True), open(
+                path, "rb"
+            ) as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
 
+    def __discard_file(self, path: str, load: Callable[[bytes], Any]) -> None:
+        """
+        The function removes a cache file that could not be loaded, unless another process replaced it
+        with a valid file or removed it meanwhile, so that a process never removes the file another one
+        just wrote.
+
+        :param path: The `path` parameter is the path to the cache file
+        :type path: str
+        :param load: The `load` parameter is the function that decodes the contents of the cache file
+        :type load: Callable[[bytes], Any]
+        """
+        with file_lock(self.__get_lock_path()):
+            try:
+                with open(path, "rb") as file:
+                    load(file.read())
+            except FileNotFoundError:
+                pass
+            except (CacheFormatError, ValidationError):
+                os.remove(path)
+
+    @contextlib.contextmanager
+    def rebuild_lock(self) -> Iterator[None]:
+        """
+        The function locks the rebuild of stale cache entries for the duration of a `with` block, so
+        that when several processes find the same entries stale, one of them parses the files while the
+        others wait, then find the entries up to date and reuse them.
+        """
+        with file_lock(f"{self.__cache_folder_path}rebuild.lock"):
+            yield
+
+    @timed("cache.store")
     def set(self, dictionary: FluentDictionary) -> None:
         """
-        The function saves the state of a FluentDictionary object to a file.
+        The function saves the state of a FluentDictionary object to a file in the binary cache format.
 
         :param dictionary: The `dictionary` parameter is an instance of the `FluentDictionary` class
         :type dictionary: FluentDictionary
         """
-        with open(
+        self.__write_file(
             self.__get_dictionary_cache_path(language_code=dictionary.language_code),
-            "w",
-        ) as file:
-            file.write(dictionary.model_dump_json(indent=True))
+            dump_dictionary(CompactDictionary.from_model(dictionary)),
+        )
 
     def delete(self, language_code: str) -> None:
         """
@@ -62,11 +282,13 @@ class ScannerCache:
         """
         path: str = self.__get_dictionary_cache_path(language_code=language_code)
 
-        if os.path.isfile(path):
-            os.remove(path)
-        else:
+        try:
+            with file_lock(self.__get_lock_path()):
+                os.remove(path)
+        except FileNotFoundError:
             raise ValueError(f"The dictionary by {language_code} does not exist")
 
+    @timed("cache.load")
     def get(self, language_code: str) -> Optional[FluentDictionary]:
         """
         The `get` function retrieves a FluentDictionary object from a cache file, and if the file does not
@@ -76,14 +298,170 @@ class ScannerCache:
         language for which we want to retrieve the FluentDictionary
         :type language_code: str
         :return: The method is returning an instance of `FluentDictionary` if the file at the specified path
-        exists and can be successfully parsed as JSON. If the file does not exist or cannot be parsed,
-        `None` is returned.
+        exists and can be successfully decoded. If the file does not exist, was written with another
+        version of the cache format or cannot be decoded, `None` is returned.
         """
         path: str = self.__get_dictionary_cache_path(language_code=language_code)
+        data: Optional[bytes] = self.__read_file(path)
+
+        if data is not None:
+            try:
+                return load_dictionary(data).to_model()
+            except CacheFormatError:
+                self.__discard_file(path, load_dictionary)
+
+    @timed("cache.store")
+    def set_entry(self, entry: CompactCacheEntry, backend: FluentReaderBackends) -> None:
+        """
+        The function saves a parse cache entry, which holds the dictionary extracted from a file together
+        with the stamp (size, mtime and content hash) of the file it was extracted from.
+
+        :param entry: The `entry` parameter is an instance of the `CompactCacheEntry` class
+        :type entry: CompactCacheEntry
+        :param backend: The `backend` parameter is the reader backend that extracted the messages
+        :type backend: FluentReaderBackends
+        """
+        path: str = self.__get_entry_cache_path(
+            language_code=entry.dictionary.language_code,
+            path=entry.stamp.path,
+            backend=backend,
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.__write_file(path, dump_entry(entry))
+
+    @timed("cache.load")
+    def get_entry(
+        self, language_code: str, path: str, backend: FluentReaderBackends
+    ) -> Optional[CompactCacheEntry]:
+        """
+        The `get_entry` function retrieves the parse cache entry of a Fluent file, and if the entry is
+        invalid or was written with another version of the cache format, it deletes the entry file.
+
+        :param language_code: The `language_code` parameter is a string that represents the code of the
+        language of the file
+        :type language_code: str
+        :param path: The `path` parameter is the path of the Fluent file
+        :type path: str
+        :param backend: The `backend` parameter is the reader backend that extracts the messages
+        :type backend: FluentReaderBackends
+        :return: an instance of `CompactCacheEntry` if the entry exists and is valid, otherwise `None`.
+        """
+        entry_path: str = self.__get_entry_cache_path(
+            language_code=language_code, path=path, backend=backend
+        )
+        data: Optional[bytes] = self.__read_file(entry_path)
+
+        if data is not None:
+            try:
+                return load_entry(data)
+            except CacheFormatError:
+                self.__discard_file(entry_path, load_entry)
+
+    @timed("cache.store")
+    def set_locale_entry(
+        self, entry: CompactLocaleEntry, backend: FluentReaderBackends
+    ) -> None:
+        """
+        The function saves the parse cache entry of a locale split into several files, which holds the
+        merged dictionary of the locale and the index of its files.
+
+        :param entry: The `entry` parameter is an instance of the `CompactLocaleEntry` class
+        :type entry: CompactLocaleEntry
+        :param backend: The `backend` parameter is the reader backend that extracted the messages
+        :type backend: FluentReaderBackends
+        """
+        self.__write_file(
+            self.__get_locale_entry_cache_path(
+                language_code=entry.dictionary.language_code, backend=backend
+            ),
+            dump_locale_entry(entry),
+        )
+
+    @timed("cache.load")
+    def get_locale_entry(
+        self, language_code: str, backend: FluentReaderBackends
+    ) -> Optional[CompactLocaleEntry]:
+        """
+        The `get_locale_entry` function retrieves the parse cache entry of a locale split into several
+        files, and if the entry is invalid or was written with another version of the cache format, it
+        deletes the entry file.
+
+        :param language_code: The `language_code` parameter is a string that represents the code of the
+        language of the locale
+        :type language_code: str
+        :param backend: The `backend` parameter is the reader backend that extracts the messages
+        :type backend: FluentReaderBackends
+        :return: an instance of `CompactLocaleEntry` if the entry exists and is valid, otherwise `None`.
+        """
+        path: str = self.__get_locale_entry_cache_path(
+            language_code=language_code, backend=backend
+        )
+        data: Optional[bytes] = self.__read_file(path)
+
+        if data is not None:
+            try:
+                return load_locale_entry(data)
+            except CacheFormatError:
+                self.__discard_file(path, load_locale_entry)
+
+    @timed("cache.store")
+    def set_index(self, index: CompactIndex) -> None:
+        """
+        The function saves the inverted index of the dictionaries.
+
+        :param index: The `index` parameter is an instance of the `CompactIndex` class
+        :type index: CompactIndex
+        """
+        self.__write_file(self.__get_index_cache_path(), dump_index(index))
+
+    @timed("cache.load")
+    def get_index(self) -> Optional[CompactIndex]:
+        """
+        The `get_index` function retrieves the inverted index of the dictionaries, and if the index is
+        invalid or was written with another version of the cache format, it deletes the index file.
+
+        :return: an instance of `CompactIndex` if the index exists and is valid, otherwise `None`.
+        """
+        path: str = self.__get_index_cache_path()
+        data: Optional[bytes] = self.__read_file(path)
+
+        if data is not None:
+            try:
+                return load_index(data)
+            except CacheFormatError:
+                self.__discard_file(path, load_index)
+
+    @timed("cache.store")
+    def set_state(self, state: FluentDictionaryState) -> None:
+        """
+        The function saves the state of a dictionary, i.e. the fingerprints of its messages, as checked
+        by the last successful run.
+
+        :param state: The `state` parameter is an instance of the `FluentDictionaryState` class
+        :type state: FluentDictionaryState
+        """
+        self.__write_file(
+            self.__get_state_cache_path(language_code=state.language_code),
+            state.model_dump_json().encode("utf-8"),
+        )
+
+    @timed("cache.load")
+    def get_state(self, language_code: str) -> Optional[FluentDictionaryState]:
+        """
+        The `get_state` function retrieves the saved state of a dictionary, and if the state is invalid,
+        it deletes the state file.
+
+        :param language_code: The `language_code` parameter is a string that represents the code of the
+        language for which we want to retrieve the state
+        :type language_code: str
+        :return: an instance of `FluentDictionaryState` if the state exists and is valid, otherwise `None`.
+        """
+        path: str = self.__get_state_cache_path(language_code=language_code)
+        data: Optional[bytes] = self.__read_file(path)
 
-        if os.path.isfile(path):
-            with open(path) as file:
-                try:
-                    return FluentDictionary.model_validate_json(file.read())
-                except ValidationError:
-                    self.delete(language_code=language_code)
+        if data is not None:
+            try:
+                return FluentDictionaryState.model_validate_json(data)
+            except ValidationError:
+                self.__discard_file(path, FluentDictionaryState.model_validate_json)
@@ -0,0 +1,352 @@
+import marshal
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from python_fluent_scanner.types.compact import (
+    CompactCacheEntry,
+    CompactDictionary,
+    CompactIndex,
+    CompactLocaleEntry,
+    CompactPlaceables,
+    intern_placeables,
+)
+from python_fluent_scanner.types.models import FluentFileStamp
+
+# Every cache file starts with the magic, the version of the format and the version of Python that
+# wrote it, since the marshal format may change between Python versions. The version of the format is
+# also increased when the reader extracts different placeables from the same file.
+MAGIC: bytes = b"FSC\x00"
+FORMAT_VERSION: int = 4
+HEADER: struct.Struct = struct.Struct("<4sHBB")
+HEADER_BYTES: bytes = HEADER.pack(
+    MAGIC, FORMAT_VERSION, sys.version_info.major, sys.version_info.minor
+)
+
+# The stamp of a file and a dictionary as they are stored in the marshal payload.
+EncodedStamp = Tuple[str, int, int, bool, str]
+EncodedDictionary = Tuple[
+    str, str, Tuple[str, ...], Tuple[Tuple[int, ...], ...], bytes, Tuple[str, ...], bytes
+]
+
+
+class CacheFormatError(ValueError):
+    """
+    The error raised when a cache file was written with another version of the format or of Python, or
+    is corrupted. The cache file must then be discarded.
+    """
+
+
+def _encode_stamp(stamp: FluentFileStamp) -> EncodedStamp:
+    """
+    The function encodes the stamp of a file.
+    """
+    return (
+        stamp.path,
+        stamp.size,
+        stamp.mtime_ns,
+        stamp.is_stat_reliable,
+        stamp.content_hash,
+    )
+
+
+def _decode_stamp(stamp: EncodedStamp) -> FluentFileStamp:
+    """
+    The function decodes the stamp of a file encoded by `_encode_stamp`.
+    """
+    return FluentFileStamp(
+        path=stamp[0],
+        size=stamp[1],
+        mtime_ns=stamp[2],
+        is_stat_reliable=stamp[3],
+        content_hash=stamp[4],
+    )
+
+
+def _encode_dictionary(dictionary: CompactDictionary) -> EncodedDictionary:
+    """
+    The function encodes a dictionary. The names of the messages and the placeables are stored once in
+    a string table and the distinct placeables once in a placeables table, each message being a pair of
+    indexes into these tables. The sources of the messages are indexes into a table of the files.
+    """
+    strings: Dict[str, int] = {}
+    placeables_table: Dict[CompactPlaceables, int] = {}
+    messages: array = array("I")
+
+    for message_name, placeables in dictionary.messages.items():
+        placeables_index: Optional[int] = placeables_table.get(placeables)
+
+        if placeables_index is None:
+            placeables_index = placeables_table[placeables] = len(placeables_table)
+
+        messages.append(strings.setdefault(message_name, len(strings)))
+        messages.append(placeables_index)
+
+    encoded_placeables: List[Tuple[int, ...]] = []
+
+    for placeables in placeables_table:
+        encoded: List[int] = []
+
+        for placeable_name, code in placeables:
+            encoded.append(strings.setdefault(placeable_name, len(strings)))
+            encoded.append(code)
+
+        encoded_placeables.append(tuple(encoded))
+
+    files: Dict[str, int] = {}
+    sources: array = array("I")
+
+    if dictionary.sources:
+        for message_name in dictionary.messages:
+            sources.append(
+                files.setdefault(dictionary.get_source(message_name), len(files))
+            )
+
+    return (
+        dictionary.language_code,
+        dictionary.path,
+        tuple(strings),
+        tuple(encoded_placeables),
+        messages.tobytes(),
+        tuple(files),
+        sources.tobytes(),
+    )
+
+
+def _decode_dictionary(encoded_dictionary: EncodedDictionary) -> CompactDictionary:
+    """
+    The function decodes a dictionary encoded by `_encode_dictionary`.
+    """
+    (
+        language_code,
+        path,
+        strings,
+        encoded_placeables,
+        encoded_messages,
+        files,
+        encoded_sources,
+    ) = encoded_dictionary
+
+    names: List[str] = [sys.intern(string) for string in strings]
+    placeables_table: List[CompactPlaceables] = [
+        intern_placeables(
+            tuple(
+                [
+                    (names[encoded[position]], encoded[position + 1])
+                    for position in range(0, len(encoded), 2)
+                ]
+            )
+        )
+        for encoded in encoded_placeables
+    ]
+    messages: array = array("I")
+    messages.frombytes(encoded_messages)
+    message_names: List[str] = [names[index] for index in messages[0::2]]
+
+    sources: array = array("I")
+    sources.frombytes(encoded_sources)
+
+    return CompactDictionary(
+        language_code=language_code,
+        path=path,
+        messages=dict(
+            zip(message_names, [placeables_table[index] for index in messages[1::2]])
+        ),
+        sources=dict(zip(message_names, [files[index] for index in sources])),
+    )
+
+
+def _dumps(payload: tuple) -> bytes:
+    """
+    The function encodes a payload behind the header of the format.
+    """
+    return HEADER_BYTES + marshal.dumps(payload)
+
+
+def _loads(data: bytes) -> tuple:
+    """
+    The function decodes a payload encoded by `_dumps`, checking the header of the format.
+    """
+    if data[: HEADER.size] != HEADER_BYTES:
+        raise CacheFormatError("Unsupported cache format version")
+
+    try:
+        return marshal.loads(memoryview(data)[HEADER.size :])
+    except (EOFError, ValueError, TypeError) as error:
+        raise CacheFormatError(f"Corrupted cache file: {error}") from error
+
+
+def dump_entry(entry: CompactCacheEntry) -> bytes:
+    """
+    The function encodes a parse cache entry in the binary cache format.
+
+    :param entry: The `entry` parameter is the entry to encode
+    :type entry: CompactCacheEntry
+    :return: the encoded entry, header included.
+    """
+    return _dumps(
+        (
+            _encode_stamp(entry.stamp),
+            tuple(entry.duplicates),
+            _encode_dictionary(entry.dictionary),
+        )
+    )
+
+
+def load_entry(data: bytes) -> CompactCacheEntry:
+    """
+    The function decodes a parse cache entry written by `dump_entry`.
+
+    :param data: The `data` parameter is the contents of the cache file
+    :type data: bytes
+    :return: the decoded entry.
+    """
+    try:
+        stamp, duplicates, dictionary = _loads(data)
+
+        return CompactCacheEntry(
+            stamp=_decode_stamp(stamp),
+            duplicates=list(duplicates),
+            dictionary=_decode_dictionary(dictionary),
+        )
+    except (ValueError, TypeError, IndexError) as error:
+        raise CacheFormatError(f"Corrupted cache file: {error}") from error
+
+
+def dump_locale_entry(entry: CompactLocaleEntry) -> bytes:
+    """
+    The function encodes the parse cache entry of a locale split into several files in the binary
+    cache format.
+
+    :param entry: The `entry` parameter is the entry to encode
+    :type entry: CompactLocaleEntry
+    :return: the encoded entry, header included.
+    """
+    return _dumps(
+        (
+            entry.path,
+            tuple(
+                (
+                    _encode_stamp(stamp),
+                    tuple(entry.file_messages[path]),
+                    tuple(entry.file_duplicates[path]),
+                )
+                for path, stamp in entry.stamps.items()
+            ),
+            tuple(entry.duplicates),
+            _encode_dictionary(entry.dictionary),
+        )
+    )
+
+
+def load_locale_entry(data: bytes) -> CompactLocaleEntry:
+    """
+    The function decodes the parse cache entry of a locale written by `dump_locale_entry`.
+
+    :param data: The `data` parameter is the contents of the cache file
+    :type data: bytes
+    :return: the decoded entry.
+    """
+    try:
+        path, files, duplicates, dictionary = _loads(data)
+        entry: CompactLocaleEntry = CompactLocaleEntry(
+            path=path,
+            stamps={},
+            file_messages={},
+            file_duplicates={},
+            duplicates=[tuple(duplicate) for duplicate in duplicates],
+            dictionary=_decode_dictionary(dictionary),
+        )
+
+        for stamp, message_names, file_duplicates in files:
+            entry.stamps[stamp[0]] = _decode_stamp(stamp)
+            entry.file_messages[stamp[0]] = [
+                sys.intern(message_name) for message_name in message_names
+            ]
+            entry.file_duplicates[stamp[0]] = list(file_duplicates)
+
+        return entry
+    except (ValueError, TypeError, IndexError) as error:
+        raise CacheFormatError(f"Corrupted cache file: {error}") from error
+
+
+def dump_dictionary(dictionary: CompactDictionary) -> bytes:
+    """
+    The function encodes a dictionary in the binary cache format.
+
+    :param dictionary: The `dictionary` parameter is the dictionary to encode
+    :type dictionary: CompactDictionary
+    :return: the encoded dictionary, header included.
+    """
+    return _dumps(_encode_dictionary(dictionary))
+
+
+def load_dictionary(data: bytes) -> CompactDictionary:
+    """
+    The function decodes a dictionary written by `dump_dictionary`.
+
+    :param data: The `data` parameter is the contents of the cache file
+    :type data: bytes
+    :return: the decoded dictionary.
+    """
+    try:
+        return _decode_dictionary(_loads(data))
+    except (ValueError, TypeError, IndexError) as error:
+        raise CacheFormatError(f"Corrupted cache file: {error}") from error
+
+
+def dump_index(index: CompactIndex) -> bytes:
+    """
+    The function encodes the inverted index of the dictionaries in the binary cache format.
+
+    :param index: The `index` parameter is the index to encode
+    :type index: CompactIndex
+    :return: the encoded index, header included.
+    """
+    return _dumps(
+        (
+            tuple(index.language_codes),
+            index.stamps,
+            index.fingerprints,
+            index.signatures,
+            index.message_locales,
+            index.variable_messages,
+            index.signature_messages,
+        )
+    )
+
+
+def load_index(data: bytes) -> CompactIndex:
+    """
+    The function decodes the inverted index of the dictionaries written by `dump_index`.
+
+    :param data: The `data` parameter is the contents of the cache file
+    :type data: bytes
+    :return: the decoded index.
+    """
+    try:
+        (
+            language_codes,
+            stamps,
+            fingerprints,
+            signatures,
+            message_locales,
+            variable_messages,
+            signature_messages,
+        ) = _loads(data)
+
+        return CompactIndex(
+            language_codes=list(language_codes),
+            stamps=dict(stamps),
+            fingerprints=dict(fingerprints),
+            signatures={
+                fingerprint: intern_placeables(tuple(map(tuple, signature)))
+                for fingerprint, signature in signatures.items()
+            },
+            message_locales=dict(message_locales),
+            variable_messages=dict(variable_messages),
+            signature_messages=dict(signature_messages),
+        )
+    except (ValueError, TypeError, IndexError, AttributeError) as error:
+        raise CacheFormatError(f"Corrupted cache file: {error}") from error
@@ -1,16 +1,18 @@
 import json
+import os
 from typing import Any, Dict
 
 # The `FluentPlaceableTypes` class is an enumeration that represents different types of placeable
 # objects.
 from python_fluent_scanner.types.models import ScannerConfig
+from python_fluent_scanner.utils.run_stamp import CONFIG_FILENAME
 from python_fluent_scanner.validators.config_validators import validate_path
 
 
 class ConfigReader:
     __config_filename: str
 
-    def __init__(self, config_filename: str = "fluent_scanner_config.json") -> None:
+    def __init__(self, config_filename: str = CONFIG_FILENAME) -> None:
         """
         The function initializes an object with a default configuration filename.
 
@@ -24,13 +26,27 @@ class ConfigReader:
     def get_config(self) -> ScannerConfig:
         """
         The `get_config` function reads a JSON file, validates its path, and returns a `ScannerConfig`
-        object.
+        object. The paths of the dictionaries of a configuration file in another directory are relative
+        to that directory, they are made relative to the current directory.
         :return: an instance of the `ScannerConfig` class.
         """
 
-        if path := validate_path(self.__config_filename):
+        if path := validate_path(os.path.relpath(self.__config_filename)):
             with open(path) as file:
                 data: Dict[str, Any] = json.loads(file.read())
+
+                if os.path.dirname(path) and isinstance(data.get("dictionaries"), dict):
+                    data["dictionaries"] = {
+                        language_code: (
+                            os.path.normpath(
+                                os.path.join(os.path.dirname(path), dictionary_path)
+                            )
+                            if isinstance(dictionary_path, str)
+                            else dictionary_path
+                        )
+                        for language_code, dictionary_path in data["dictionaries"].items()
+                    }
+
                 config: ScannerConfig = ScannerConfig(**data)
 
                 assert (
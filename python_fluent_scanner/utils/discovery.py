@@ -0,0 +1,63 @@
+import fnmatch
+import glob
+import os
+from typing import List
+
+# A dictionary path containing one of these characters is a glob pattern.
+GLOB_CHARACTERS: str = "*?["
+
+
+def is_dictionary_pattern(path: str) -> bool:
+    """
+    The function checks whether the path of a dictionary in the configuration designates several files,
+    i.e. whether it is a directory or a glob pattern.
+
+    :param path: The `path` parameter is the path of the dictionary in the configuration
+    :type path: str
+    :return: True if the path is a directory or a glob pattern.
+    """
+    return os.path.isdir(path) or any(character in path for character in GLOB_CHARACTERS)
+
+
+def find_dictionary_files(path: str) -> List[str]:
+    """
+    The function finds the Fluent files of a dictionary. A directory designates every `.ftl` file in it
+    and its subdirectories, a glob pattern (where `**` matches any number of subdirectories) the files
+    it matches, and any other path a single file.
+
+    :param path: The `path` parameter is the path of the dictionary in the configuration
+    :type path: str
+    :return: the sorted list of the paths of the files.
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, "**", "*.ftl")
+    elif not is_dictionary_pattern(path):
+        return [path]
+
+    return sorted(
+        file_path for file_path in glob.glob(path, recursive=True) if os.path.isfile(file_path)
+    )
+
+
+def matches_dictionary_path(file_path: str, path: str) -> bool:
+    """
+    The function checks whether a file, which may not exist anymore, belongs to a dictionary. In a glob
+    pattern `*` also matches `/` here, so a pattern may match more removed files than `glob` would.
+
+    :param file_path: The `file_path` parameter is the normalized path of the file
+    :type file_path: str
+    :param path: The `path` parameter is the path of the dictionary in the configuration
+    :type path: str
+    :return: True if the file is the dictionary or one of its files.
+    """
+    if os.path.isdir(path):
+        return file_path.endswith(".ftl") and file_path.startswith(
+            os.path.join(os.path.normpath(path), "")
+        )
+
+    if not is_dictionary_pattern(path):
+        return file_path == os.path.normpath(path)
+
+    return fnmatch.fnmatchcase(file_path, path) or fnmatch.fnmatchcase(
+        file_path, path.replace("**/", "")
+    )
@@ -0,0 +1,68 @@
+import os
+import subprocess
+from typing import List, Optional, Set
+
+
+class GitError(RuntimeError):
+    """
+    The error raised when a git command fails, e.g. outside of a git repository or with an unknown
+    revision.
+    """
+
+
+def _run_git(arguments: List[str]) -> Optional[bytes]:
+    """
+    The function runs a git command in the current directory.
+
+    :return: the output of the command, or `None` if it failed.
+    """
+    try:
+        process: subprocess.CompletedProcess = subprocess.run(
+            ["git", *arguments], capture_output=True
+        )
+    except FileNotFoundError as error:
+        raise GitError("git is not installed") from error
+
+    return process.stdout if process.returncode == 0 else None
+
+
+def get_changed_files(ref: str) -> Set[str]:
+    """
+    The function finds the files of the current directory that were added, modified or removed since a
+    git revision, in the working tree included, and the untracked files.
+
+    :param ref: The `ref` parameter is the git revision, e.g. a branch, a tag or a commit
+    :type ref: str
+    :return: the set of the normalized paths of the files, relative to the current directory.
+    """
+    changed: Optional[bytes] = _run_git(
+        ["diff", "--name-only", "--no-renames", "--relative", "-z", ref, "--"]
+    )
+
+    if changed is None:
+        raise GitError(f"Cannot get the files changed since {ref}")
+
+    untracked: Optional[bytes] = _run_git(
+        ["ls-files", "--others", "--exclude-standard", "-z"]
+    )
+
+    return {
+        os.path.normpath(path)
+        for path in (changed + (untracked or b"")).decode("utf-8").split("\0")
+        if path
+    }
+
+
+def get_file_at(ref: str, path: str) -> Optional[str]:
+    """
+    The function reads a file as it was at a git revision.
+
+    :param ref: The `ref` parameter is the git revision
+    :type ref: str
+    :param path: The `path` parameter is the path of the file, relative to the current directory
+    :type path: str
+    :return: the contents of the file, or `None` if the file did not exist at that revision.
+    """
+    content: Optional[bytes] = _run_git(["show", f"{ref}:./{path}"])
+
+    return content.decode("utf-8") if content is not None else None
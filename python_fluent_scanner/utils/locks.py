@@ -0,0 +1,35 @@
+import contextlib
+import os
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+@contextlib.contextmanager
+def file_lock(path: str, shared: bool = False) -> Iterator[None]:
+    """
+    The function locks a lock file for the duration of a `with` block, so that processes sharing a cache
+    folder do not modify it at the same time. The lock is advisory, it only excludes the processes that
+    take it too, and it is released when the process dies. Nothing is locked where `fcntl` is not
+    available.
+
+    :param path: The `path` parameter is the path of the lock file, which is created if needed
+    :type path: str
+    :param shared: The `shared` parameter takes a shared lock, held by any number of readers at once,
+    instead of an exclusive one
+    :type shared: bool
+    """
+    if fcntl is None:
+        yield
+        return
+
+    descriptor: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(descriptor)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from python_fluent_scanner.utils.discovery import find_dictionary_files
+
+CONFIG_FILENAME: str = "fluent_scanner_config.json"
+CACHE_FOLDER_NAME: str = ".fluent_scanner_cache"
+RUN_STAMP_FILENAME: str = "run_stamp.json"
+RUN_STAMP_VERSION: int = 1
+
+# Files modified less than this many nanoseconds before they were read may be modified again within
+# the same mtime tick, so their size and mtime alone cannot prove that the content is unchanged.
+RACY_STAT_WINDOW_NS: int = 2_000_000_000
+
+
+def _get_run_stamp_path() -> str:
+    """
+    The function returns the path of the run stamp in the cache folder of the current directory.
+    """
+    return os.path.join(os.getcwd(), CACHE_FOLDER_NAME, RUN_STAMP_FILENAME)
+
+
+def _get_content_hash(path: str) -> str:
+    """
+    The function returns the SHA-256 hash of the contents of a file.
+    """
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def _get_stamped_files(config: Dict[str, Any], config_filename: str) -> List[str]:
+    """
+    The function returns the files whose content decides whether the root dictionary is up to date:
+    the configuration, the saved state of the root dictionary and the files of the root dictionary.
+    """
+    root_locale: str = config["root_locale"]
+
+    return [
+        config_filename,
+        os.path.join(CACHE_FOLDER_NAME, "state", f"{root_locale}.json"),
+        *find_dictionary_files(config["dictionaries"][root_locale]),
+    ]
+
+
+def save_run_stamp(config_filename: str = CONFIG_FILENAME) -> None:
+    """
+    The function saves the stamps (size, mtime and content hash) of the configuration, the saved state of
+    the root dictionary and the files of the root dictionary, after a run that found the root dictionary
+    up to date or saved its state.
+
+    :param config_filename: The `config_filename` parameter is the path of the configuration file
+    :type config_filename: str
+    """
+    with open(config_filename) as file:
+        config: Dict[str, Any] = json.load(file)
+
+    stamps: List[List[Any]] = []
+    read_at_ns: int = time.time_ns()
+
+    for path in _get_stamped_files(config=config, config_filename=config_filename):
+        stat: os.stat_result = os.stat(path)
+        stamps.append(
+            [
+                path,
+                stat.st_size,
+                stat.st_mtime_ns,
+                read_at_ns - stat.st_mtime_ns > RACY_STAT_WINDOW_NS,
+                _get_content_hash(path),
+            ]
+        )
+
+    run_stamp_path: str = _get_run_stamp_path()
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(run_stamp_path), prefix=".", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            json.dump({"version": RUN_STAMP_VERSION, "files": stamps}, file)
+
+        os.replace(temporary_path, run_stamp_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def is_up_to_date(config_filename: str = CONFIG_FILENAME) -> bool:
+    """
+    The function checks whether the configuration, the saved state of the root dictionary and the files
+    of the root dictionary are the same as when the run stamp was saved, in which case the outcome of a
+    check is known without parsing anything. The content of a file is only hashed when its size and
+    mtime cannot prove that it did not change.
+
+    :param config_filename: The `config_filename` parameter is the path of the configuration file
+    :type config_filename: str
+    :return: True if the root dictionary is up to date, False if a check must run.
+    """
+    try:
+        with open(_get_run_stamp_path()) as file:
+            run_stamp: Dict[str, Any] = json.load(file)
+
+        with open(config_filename) as file:
+            config: Dict[str, Any] = json.load(file)
+
+        stamps: Optional[List[List[Any]]] = (
+            run_stamp["files"] if run_stamp["version"] == RUN_STAMP_VERSION else None
+        )
+        paths: List[str] = _get_stamped_files(config=config, config_filename=config_filename)
+
+        if stamps is None or [stamp[0] for stamp in stamps] != paths:
+            return False
+
+        for path, size, mtime_ns, is_stat_reliable, content_hash in stamps:
+            stat: os.stat_result = os.stat(path)
+
+            if stat.st_size != size:
+                return False
+
+            if not (is_stat_reliable and stat.st_mtime_ns == mtime_ns):
+                if _get_content_hash(path) != content_hash:
+                    return False
+
+        return True
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
@@ -0,0 +1,340 @@
+import contextlib
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from python_fluent_scanner.types.compact import CompactCacheEntry, CompactDictionary
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import FluentFileStamp
+from python_fluent_scanner.utils.cache_format import (
+    CacheFormatError,
+    dump_entry,
+    load_entry,
+)
+from python_fluent_scanner.utils.locks import file_lock
+from python_fluent_scanner.utils.timings import timed
+
+SHARED_CACHE_DIR_ENV: str = "FLUENT_SCANNER_CACHE_DIR"
+SHARED_CACHE_MAX_BYTES_ENV: str = "FLUENT_SCANNER_CACHE_MAX_BYTES"
+SHARED_CACHE_MAX_ENTRIES_ENV: str = "FLUENT_SCANNER_CACHE_MAX_ENTRIES"
+
+SHARED_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+SHARED_CACHE_MAX_ENTRIES: int = 20_000
+
+# The entries are spread over one folder per first hex digit of their content hash. Each folder has its
+# own lock and a share of the limits, so that a store only scans and evicts the entries of one folder.
+SHARD_NAMES: Tuple[str, ...] = tuple("0123456789abcdef")
+
+# A folder over its share of the limits is evicted down to this fraction of it, so that the next stores
+# do not have to evict again.
+EVICTION_RATIO: float = 0.9
+
+LOCK_FILENAME: str = ".lock"
+
+# The (last use time in nanoseconds, size, path) of an entry file.
+EntryFile = Tuple[int, int, str]
+
+
+def get_shared_cache_path() -> str:
+    """
+    The function returns the location of the shared cache: `$FLUENT_SCANNER_CACHE_DIR` if it is set,
+    otherwise the `fluent_scanner` folder of `$XDG_CACHE_HOME`, or of `~/.cache` if it is not set either.
+    """
+    if path := os.environ.get(SHARED_CACHE_DIR_ENV):
+        return path
+
+    cache_home: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(cache_home, "fluent_scanner")
+
+
+class SharedCache:
+    """
+    A parse cache shared by every project of the user, which holds the dictionaries extracted from Fluent
+    files by the SHA-256 hash of their content. A file is parsed once whatever project, branch or locale
+    it belongs to, and the versions of the files of other branches stay available.
+
+    The least recently used entries are evicted when the cache holds more than `max_bytes` bytes or
+    `max_entries` entries. Entries are written atomically, and stores and evictions take a file lock, so
+    that processes can use the cache at the same time.
+    """
+
+    __path: str
+    __max_bytes: int
+    __max_entries: int
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        The function initializes the shared cache.
+
+        :param path: The `path` parameter is the folder of the cache, see `get_shared_cache_path` if it
+        is not provided
+        :type path: Optional[str]
+        :param max_bytes: The `max_bytes` parameter is the maximum total size of the entries,
+        `$FLUENT_SCANNER_CACHE_MAX_BYTES` or 512 MiB if it is not provided
+        :type max_bytes: Optional[int]
+        :param max_entries: The `max_entries` parameter is the maximum number of entries,
+        `$FLUENT_SCANNER_CACHE_MAX_ENTRIES` or 20000 if it is not provided
+        :type max_entries: Optional[int]
+        """
+        self.__path = path or get_shared_cache_path()
+        self.__max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(
+                os.environ.get(SHARED_CACHE_MAX_BYTES_ENV, SHARED_CACHE_MAX_BYTES)
+            )
+        )
+        self.__max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(
+                os.environ.get(SHARED_CACHE_MAX_ENTRIES_ENV, SHARED_CACHE_MAX_ENTRIES)
+            )
+        )
+
+    def get_path(self) -> str:
+        """
+        The function returns the folder of the cache.
+        """
+        return self.__path
+
+    def __get_entry_path(
+        self, content_hash: str, backend: FluentReaderBackends
+    ) -> str:
+        """
+        The function returns the path of the entry of a content hash.
+        """
+        return os.path.join(
+            self.__path, content_hash[0], f"{content_hash}.{backend.value}.bin"
+        )
+
+    def __list_shard(self, shard_path: str) -> List[EntryFile]:
+        """
+        The function lists the entry files of a folder of the cache.
+        """
+        entry_files: List[EntryFile] = []
+
+        try:
+            with os.scandir(shard_path) as iterator:
+                for dir_entry in iterator:
+                    if not dir_entry.name.endswith(".bin"):
+                        continue
+
+                    try:
+                        stat: os.stat_result = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    entry_files.append(
+                        (stat.st_mtime_ns, stat.st_size, dir_entry.path)
+                    )
+        except FileNotFoundError:
+            pass
+
+        return entry_files
+
+    def __evict(
+        self, entry_files: List[EntryFile], max_bytes: int, max_entries: int
+    ) -> Tuple[int, int]:
+        """
+        The function removes the least recently used entry files until the others fit in the limits.
+
+        :return: a tuple of the number and the total size of the removed entries.
+        """
+        total_bytes: int = sum(size for _, size, _ in entry_files)
+        count: int = len(entry_files)
+        removed_count: int = 0
+        removed_bytes: int = 0
+
+        for _, size, path in sorted(entry_files):
+            if total_bytes <= max_bytes and count <= max_entries:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total_bytes -= size
+            count -= 1
+            removed_count += 1
+            removed_bytes += size
+
+        return removed_count, removed_bytes
+
+    @timed("shared_cache.load")
+    def get(
+        self,
+        stamp: FluentFileStamp,
+        language_code: str,
+        backend: FluentReaderBackends,
+    ) -> Optional[CompactCacheEntry]:
+        """
+        The `get` function retrieves the dictionary extracted from a content hash by any project, and
+        marks its entry as recently used.
+
+        :param stamp: The `stamp` parameter is the stamp of the file, with its content hash
+        :type stamp: FluentFileStamp
+        :param language_code: The `language_code` parameter is the code of the language of the file
+        :type language_code: str
+        :param backend: The `backend` parameter is the reader backend that extracts the messages
+        :type backend: FluentReaderBackends
+        :return: a `CompactCacheEntry` of the file with the cached dictionary, or `None` if the content
+        hash is not in the cache.
+        """
+        path: str = self.__get_entry_path(
+            content_hash=stamp.content_hash, backend=backend
+        )
+
+        try:
+            with open(path, "rb") as file:
+                entry: CompactCacheEntry = load_entry(file.read())
+        except FileNotFoundError:
+            return None
+        except CacheFormatError:
+            with file_lock(os.path.join(os.path.dirname(path), LOCK_FILENAME)):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return CompactCacheEntry(
+            stamp=stamp,
+            duplicates=entry.duplicates,
+            dictionary=CompactDictionary(
+                language_code=language_code,
+                path=stamp.path,
+                messages=entry.dictionary.messages,
+            ),
+        )
+
+    @timed("shared_cache.store")
+    def set(self, entry: CompactCacheEntry, backend: FluentReaderBackends) -> None:
+        """
+        The function saves the dictionary extracted from a file by the content hash of the file, then
+        evicts the least recently used other entries of its folder if the folder holds more than its
+        share of the limits. The share is at least one entry, so that low limits do not disable the
+        cache.
+
+        :param entry: The `entry` parameter is the parse cache entry of the file
+        :type entry: CompactCacheEntry
+        :param backend: The `backend` parameter is the reader backend that extracted the messages
+        :type backend: FluentReaderBackends
+        """
+        path: str = self.__get_entry_path(
+            content_hash=entry.stamp.content_hash, backend=backend
+        )
+        shard_path: str = os.path.dirname(path)
+        os.makedirs(shard_path, exist_ok=True)
+
+        data: bytes = dump_entry(entry)
+
+        with file_lock(os.path.join(shard_path, LOCK_FILENAME)):
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=shard_path, prefix=".", suffix=".tmp"
+            )
+
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(data)
+
+                os.replace(temporary_path, path)
+            except BaseException:
+                os.remove(temporary_path)
+                raise
+
+            # Each folder keeps at least the entry just stored, however low the limits are.
+            max_bytes: int = max(self.__max_bytes // len(SHARD_NAMES), 1)
+            max_entries: int = max(self.__max_entries // len(SHARD_NAMES), 1)
+            entry_files: List[EntryFile] = [
+                entry_file
+                for entry_file in self.__list_shard(shard_path)
+                if entry_file[2] != path
+            ]
+
+            if (
+                sum(size for _, size, _ in entry_files) + len(data) > max_bytes
+                or len(entry_files) + 1 > max_entries
+            ):
+                self.__evict(
+                    entry_files=entry_files,
+                    max_bytes=max(int(max_bytes * EVICTION_RATIO) - len(data), 0),
+                    max_entries=max(int(max_entries * EVICTION_RATIO) - 1, 0),
+                )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        The function counts the entries of the cache.
+
+        :return: a dictionary with the number of `entries` and their total size in `bytes`, and the
+        limits of the cache.
+        """
+        entry_files: List[EntryFile] = [
+            entry_file
+            for shard_name in SHARD_NAMES
+            for entry_file in self.__list_shard(
+                os.path.join(self.__path, shard_name)
+            )
+        ]
+
+        return {
+            "entries": len(entry_files),
+            "bytes": sum(size for _, size, _ in entry_files),
+            "max_entries": self.__max_entries,
+            "max_bytes": self.__max_bytes,
+        }
+
+    def prune(
+        self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        The function evicts the least recently used entries of the whole cache until the others fit in
+        the limits. Every folder of the cache is locked meanwhile.
+
+        :param max_bytes: The `max_bytes` parameter is the maximum total size of the entries that are
+        kept, the limit of the cache if it is not provided
+        :type max_bytes: Optional[int]
+        :param max_entries: The `max_entries` parameter is the maximum number of entries that are kept,
+        the limit of the cache if it is not provided
+        :type max_entries: Optional[int]
+        :return: a dictionary with the number of removed `entries` and their total size in `bytes`.
+        """
+        shard_paths: List[str] = [
+            os.path.join(self.__path, shard_name) for shard_name in SHARD_NAMES
+        ]
+
+        with contextlib.ExitStack() as stack:
+            for shard_path in shard_paths:
+                if os.path.isdir(shard_path):
+                    stack.enter_context(
+                        file_lock(os.path.join(shard_path, LOCK_FILENAME))
+                    )
+
+            removed_count, removed_bytes = self.__evict(
+                entry_files=[
+                    entry_file
+                    for shard_path in shard_paths
+                    for entry_file in self.__list_shard(shard_path)
+                ],
+                max_bytes=self.__max_bytes if max_bytes is None else max_bytes,
+                max_entries=(
+                    self.__max_entries if max_entries is None else max_entries
+                ),
+            )
+
+        return {"entries": removed_count, "bytes": removed_bytes}
@@ -0,0 +1,131 @@
+from collections import Counter
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+NGRAM_SIZE: int = 3
+
+# Two names are similar enough to be a rename when their Dice coefficient, i.e. twice the number of
+# their common n-grams over the total number of their n-grams, is at least this value.
+MIN_SIMILARITY: float = 0.5
+
+# Only the names sharing the most n-grams with a name are scored, so that a name is matched in a bounded
+# time whatever the number of names.
+MAX_CANDIDATES: int = 8
+
+# The candidates of a name are found through its rarest n-grams, until this many names were counted, so
+# that the n-grams shared by most names, e.g. the ones of a common prefix, do not make a search slower.
+MAX_SEARCH_POSTINGS: int = 1000
+
+
+def get_ngrams(name: str) -> FrozenSet[str]:
+    """
+    The function returns the n-grams of a name, padded so that its first and last characters count as
+    much as the others.
+
+    :param name: The `name` parameter is the name of a message or of a placeable
+    :type name: str
+    :return: the set of the n-grams of the name.
+    """
+    padded: str = f"\x00{name}\x00"
+
+    return frozenset(
+        padded[position : position + NGRAM_SIZE]
+        for position in range(max(len(padded) - NGRAM_SIZE + 1, 1))
+    )
+
+
+class NGramIndex:
+    """
+    An inverted index from the n-grams of names to the names, which finds the names most similar to a
+    name without comparing it with every name.
+    """
+
+    __ngrams: List[FrozenSet[str]]
+    __postings: Dict[str, List[int]]
+
+    def __init__(self, names: List[str]) -> None:
+        """
+        The function indexes names.
+
+        :param names: The `names` parameter is the list of the names to index
+        :type names: List[str]
+        """
+        self.__ngrams = [get_ngrams(name) for name in names]
+        self.__postings = {}
+
+        for position, ngrams in enumerate(self.__ngrams):
+            for ngram in ngrams:
+                self.__postings.setdefault(ngram, []).append(position)
+
+    def search(self, name: str) -> List[Tuple[float, int]]:
+        """
+        The function finds the indexed names similar to a name.
+
+        :param name: The `name` parameter is the name to search for
+        :type name: str
+        :return: the list of the (similarity, position) pairs of the candidates at least
+        `MIN_SIMILARITY` similar to the name, `position` being the position of the candidate in the
+        indexed names.
+        """
+        ngrams: FrozenSet[str] = get_ngrams(name)
+        postings: List[List[int]] = sorted(
+            [self.__postings[ngram] for ngram in ngrams if ngram in self.__postings],
+            key=len,
+        )
+        counts: Counter = Counter()
+        budget: int = MAX_SEARCH_POSTINGS
+
+        for positions in postings:
+            if counts and len(positions) > budget:
+                break
+
+            counts.update(positions)
+            budget -= len(positions)
+
+        matches: List[Tuple[float, int]] = []
+
+        for position, _ in counts.most_common(MAX_CANDIDATES):
+            candidate_ngrams: FrozenSet[str] = self.__ngrams[position]
+            similarity: float = (
+                2
+                * len(ngrams & candidate_ngrams)
+                / (len(ngrams) + len(candidate_ngrams))
+            )
+
+            if similarity >= MIN_SIMILARITY:
+                matches.append((similarity, position))
+
+        return matches
+
+
+def match_names(names: List[str], candidates: List[str]) -> Dict[str, str]:
+    """
+    The function pairs names with the candidates they were most likely renamed to, e.g. the messages
+    missing from a dictionary with its extra messages. Each candidate is paired with one name at most,
+    the most similar pairs first.
+
+    :param names: The `names` parameter is the list of the names to pair
+    :type names: List[str]
+    :param candidates: The `candidates` parameter is the list of the candidates
+    :type candidates: List[str]
+    :return: a dictionary that maps the paired names to their candidates.
+    """
+    if not names or not candidates:
+        return {}
+
+    index: NGramIndex = NGramIndex(candidates)
+    pairs: List[Tuple[float, int, int]] = [
+        (-similarity, name_position, candidate_position)
+        for name_position, name in enumerate(names)
+        for similarity, candidate_position in index.search(name)
+    ]
+    matches: Dict[str, str] = {}
+    matched_candidates: Set[int] = set()
+
+    for _, name_position, candidate_position in sorted(pairs):
+        name: str = names[name_position]
+
+        if name not in matches and candidate_position not in matched_candidates:
+            matches[name] = candidates[candidate_position]
+            matched_candidates.add(candidate_position)
+
+    return matches
@@ -0,0 +1,85 @@
+import hashlib
+import mmap
+import re
+from typing import Iterator
+
+# Files of at least this many bytes are memory-mapped and parsed chunk by chunk instead of being read
+# and parsed at once.
+STREAM_MIN_BYTES: int = 64 * 1024 * 1024
+
+# The approximate number of bytes of a chunk of a streamed file.
+STREAM_CHUNK_BYTES: int = 1024 * 1024
+
+# A line starting with one of these characters starts a top-level entry (a message, a term or a
+# comment). `fluent.syntax` resumes parsing at such a line after a syntax error, so a file split at these
+# lines gives the same entries as the whole file.
+ENTRY_START_RE = re.compile(rb"\n(?=[a-zA-Z#-])")
+
+
+def release_pages(content: mmap.mmap, start: int, end: int) -> int:
+    """
+    The function tells the kernel that the pages of a read-only mapping between `start` and `end` are no
+    longer needed, so that the pages already read do not count in the memory of the process. It does
+    nothing on the platforms without `madvise`.
+
+    :param content: The `content` parameter is the memory-mapped file
+    :type content: mmap.mmap
+    :param start: The `start` parameter is the offset of the first released byte, aligned on a page
+    :type start: int
+    :param end: The `end` parameter is the offset of the end of the released bytes
+    :type end: int
+    :return: the offset of the end of the released pages, which is the `start` of the next call.
+    """
+    end -= end % mmap.PAGESIZE
+
+    if end > start and hasattr(content, "madvise"):
+        content.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+    return max(start, end)
+
+
+def hash_content(content: mmap.mmap, chunk_bytes: int = STREAM_CHUNK_BYTES) -> str:
+    """
+    The function computes the SHA-256 hash of a memory-mapped file one chunk at a time.
+
+    :param content: The `content` parameter is the memory-mapped file
+    :type content: mmap.mmap
+    :param chunk_bytes: The `chunk_bytes` parameter is the number of bytes hashed at a time
+    :type chunk_bytes: int
+    :return: the hexadecimal digest of the file.
+    """
+    content_hash = hashlib.sha256()
+    released: int = 0
+
+    for start in range(0, len(content), chunk_bytes):
+        content_hash.update(content[start : start + chunk_bytes])
+        released = release_pages(content, released, start + chunk_bytes)
+
+    return content_hash.hexdigest()
+
+
+def iter_entry_chunks(
+    content: mmap.mmap, chunk_bytes: int = STREAM_CHUNK_BYTES
+) -> Iterator[str]:
+    """
+    The function splits a memory-mapped Fluent file into chunks of about `chunk_bytes` bytes, each
+    ending right before a line that starts a top-level entry, and decodes them one at a time.
+
+    :param content: The `content` parameter is the memory-mapped file
+    :type content: mmap.mmap
+    :param chunk_bytes: The `chunk_bytes` parameter is the approximate number of bytes of a chunk
+    :type chunk_bytes: int
+    :return: an iterator over the decoded chunks, in the order of the file.
+    """
+    length: int = len(content)
+    start: int = 0
+    released: int = 0
+
+    while start < length:
+        match = ENTRY_START_RE.search(content, min(start + chunk_bytes, length))
+        end: int = match.end() if match else length
+
+        yield content[start:end].decode("utf-8")
+
+        released = release_pages(content, released, end)
+        start = end
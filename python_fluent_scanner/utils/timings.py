@@ -0,0 +1,138 @@
+import contextlib
+import functools
+import json
+import time
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+
+# The spans recorded since `enable_timings`, as (name, seconds) pairs in the order they ended, or `None`
+# when the timings are disabled.
+_spans: Optional[List[Tuple[str, float]]] = None
+
+# The context manager returned by `span` when the timings are disabled, which does nothing.
+_NO_SPAN: ContextManager = contextlib.nullcontext()
+
+
+class _Span:
+    """
+    A context manager that records the time spent in its block under a name.
+    """
+
+    __slots__ = ("name", "started_at")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        if _spans is not None:
+            _spans.append((self.name, time.perf_counter() - self.started_at))
+
+
+def enable_timings() -> None:
+    """
+    The function starts recording the spans, forgetting the ones recorded before.
+    """
+    global _spans
+
+    _spans = []
+
+
+def disable_timings() -> None:
+    """
+    The function stops recording the spans and forgets them.
+    """
+    global _spans
+
+    _spans = None
+
+
+def span(name: str) -> ContextManager:
+    """
+    The function returns a context manager that records the time spent in its block as a span named
+    `name`. When the timings are disabled, it returns a shared context manager that does nothing.
+
+    :param name: The `name` parameter is the name of the span, the spans with the same name are summed
+    :type name: str
+    :return: the context manager.
+    """
+    return _NO_SPAN if _spans is None else _Span(name)
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """
+    The function returns a decorator that records every call of a function as a span named `name`.
+
+    :param name: The `name` parameter is the name of the span
+    :type name: str
+    :return: the decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _spans is None:
+                return function(*args, **kwargs)
+
+            with _Span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_timings() -> Dict[str, Dict[str, float]]:
+    """
+    The function summarizes the recorded spans by name, in the order the names first ended.
+
+    :return: a dictionary that maps the names of the spans to their number of calls, total and longest
+    time in seconds.
+    """
+    timings: Dict[str, Dict[str, float]] = {}
+
+    for name, seconds in _spans or []:
+        timing: Dict[str, float] = timings.setdefault(
+            name, {"calls": 0, "total": 0.0, "max": 0.0}
+        )
+        timing["calls"] += 1
+        timing["total"] += seconds
+        timing["max"] = max(timing["max"], seconds)
+
+    return timings
+
+
+def format_timings(timings: Dict[str, Dict[str, float]]) -> str:
+    """
+    The function formats the summary of the spans as a table.
+
+    :param timings: The `timings` parameter is the result of `get_timings`
+    :type timings: Dict[str, Dict[str, float]]
+    :return: the table.
+    """
+    width: int = max([len("span"), *map(len, timings)])
+    lines: List[str] = [
+        f"{'span':<{width}} {'calls':>6} {'total, ms':>10} {'max, ms':>10}"
+    ]
+
+    for name, timing in timings.items():
+        lines.append(
+            f"{name:<{width}} {timing['calls']:>6} {timing['total'] * 1000:>10.1f} "
+            f"{timing['max'] * 1000:>10.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+def save_timings(path: str, timings: Dict[str, Dict[str, float]]) -> None:
+    """
+    The function saves the summary of the spans as JSON.
+
+    :param path: The `path` parameter is the path of the JSON file
+    :type path: str
+    :param timings: The `timings` parameter is the result of `get_timings`
+    :type timings: Dict[str, Dict[str, float]]
+    """
+    with open(path, "w") as file:
+        json.dump(timings, file, indent=4)
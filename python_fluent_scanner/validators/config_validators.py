@@ -1,5 +1,7 @@
 import os
 
+from python_fluent_scanner.utils.discovery import find_dictionary_files, is_dictionary_pattern
+
 
 def validate_path(value: str) -> str:
     """
@@ -20,6 +22,26 @@ def validate_path(value: str) -> str:
     return value
 
 
+def validate_dictionary_path(value: str) -> str:
+    """
+    The function `validate_dictionary_path` checks the path of a dictionary in the configuration, which
+    is either a file, a directory or a glob pattern that matches at least one file.
+
+    :param value: The parameter `value` is the path of the dictionary
+    :type value: str
+    :return: the input path `value` if it passes all the validation checks.
+    """
+    if not is_dictionary_pattern(value):
+        return validate_path(value)
+
+    assert value[0] != "/", f"{value} must not begin with /"
+    assert find_dictionary_files(
+        value
+    ), f"no dictionary file matches {value}, check the path"
+
+    return value
+
+
 def validate_dictionaries_dict(value: dict) -> dict:
     """
     The function `validate_dictionaries_dict` validates that a dictionary is provided as input and
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from python_fluent_scanner import fluent_async_scanner
+from python_fluent_scanner.fluent_async_scanner import FluentAsyncScanner, scan
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.models import FluentDuplicate, ScannerConfig
+
+
+class TestAsyncScanner(unittest.IsolatedAsyncioTestCase):
+    ROOT_DICTIONARY_DATA: str = "a = a\nb = { $var_b }\nc = { $var_c }\n"
+
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        with open("en.ftl", "w") as file:
+            file.write(self.ROOT_DICTIONARY_DATA)
+
+        self.config: ScannerConfig = ScannerConfig(
+            root_locale="en", dictionaries={"en": "en.ftl"}
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    async def test_scan(self):
+        """
+        The `test_scan` function checks that a scan of dictionaries from paths and from memory gives the
+        same findings as the comparator, and returns the duplicates instead of printing them.
+        """
+        sources = {"ru": "a = a\nb = { $var_x }\nd = d\nd = e\n", "kz": "a = a\n"}
+
+        for executor in (None, ProcessPoolExecutor(max_workers=2)):
+            result = await scan(config=self.config, sources=sources, executor=executor)
+
+            if executor:
+                executor.shutdown()
+
+            root_dictionary = FluentReader().parse_by_file("en.ftl", "en")
+
+            assert list(result.findings) == ["ru", "kz"]
+            assert result.root_locale == "en"
+
+            for language_code, source in sources.items():
+                assert result.findings[language_code] == FluentComparator().compare(
+                    dict_a=root_dictionary,
+                    dict_b=FluentReader().parse_by_source(source, language_code),
+                )
+
+            assert result.duplicates == {
+                "en": [],
+                "ru": [
+                    FluentDuplicate(
+                        message_name="d", first_path="<memory>", second_path="<memory>"
+                    )
+                ],
+                "kz": [],
+            }
+
+        with self.assertRaises(ValueError):
+            await scan(config=self.config.model_copy(update={"root_locale": "de"}))
+
+    async def test_concurrency(self):
+        """
+        The `test_concurrency` function checks that a scan waits while the maximum number of scans are
+        running, and that a cancelled scan does not start its remaining jobs.
+        """
+        started = []
+        release = threading.Event()
+        read_dictionary = fluent_async_scanner._read_dictionary
+
+        def blocking_read_dictionary(language_code, path, source, *args):
+            started.append(source)
+            release.wait()
+
+            return read_dictionary(language_code, path, source, *args)
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        scanner: FluentAsyncScanner = FluentAsyncScanner(
+            executor=executor, max_concurrency=1
+        )
+
+        with mock.patch.object(
+            fluent_async_scanner, "_read_dictionary", blocking_read_dictionary
+        ):
+            first = asyncio.create_task(
+                scanner.scan(config=self.config, sources={"ru": "a = a\n"})
+            )
+            second = asyncio.create_task(
+                scanner.scan(config=self.config, sources={"kz": "b = b\n"})
+            )
+            await asyncio.sleep(0.1)
+
+            assert started == [None]
+
+            first.cancel()
+            await asyncio.sleep(0.1)
+            release.set()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+
+            result = await second
+
+        executor.shutdown()
+
+        assert started == [None, None, "b = b\n"]
+        assert list(result.findings) == ["kz"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from fluent.syntax import parse
+
+from python_fluent_scanner.fluent_batch_scanner import FluentBatchScanner
+from python_fluent_scanner.fluent_reporter import FluentJsonLinesReporter
+
+
+class TestBatchScanner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("shared/en.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("shared/ru.ftl", "a = a\nb = { $var_x }\n")
+        self.__write("first/locales/kz.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("second/en.ftl", "a = a\nb = { $var_b }\nc = c\n")
+        self.__write(
+            "first/fluent_scanner_config.json",
+            json.dumps(
+                {
+                    "root_locale": "en",
+                    "dictionaries": {
+                        "en": "../shared/en.ftl",
+                        "ru": "../shared/ru.ftl",
+                        "kz": "locales/kz.ftl",
+                    },
+                }
+            ),
+        )
+        self.__write(
+            "second/fluent_scanner_config.json",
+            json.dumps(
+                {
+                    "root_locale": "en",
+                    "dictionaries": {
+                        "en": "en.ftl",
+                        "ru": "../shared/ru.ftl",
+                        "kz": "../first/locales/kz.ftl",
+                    },
+                }
+            ),
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+            file.write(data)
+
+    def test_batch_scanner(self):
+        """
+        The `test_batch_scanner` function checks that the projects of several configuration files are
+        checked in one run, each distinct content being parsed once, and reported project by project.
+        """
+        output = io.StringIO()
+        first: str = "first/fluent_scanner_config.json"
+        second: str = os.path.abspath("second/fluent_scanner_config.json")
+
+        with mock.patch(
+            "python_fluent_scanner.fluent_reader.parse", wraps=parse
+        ) as parse_mock, contextlib.redirect_stderr(io.StringIO()):
+            scanner: FluentBatchScanner = FluentBatchScanner(
+                config_filenames=[first, second, first],
+                reporter=FluentJsonLinesReporter(stream=output),
+            )
+
+            assert scanner.check()
+
+        # shared/en.ftl and first/locales/kz.ftl have the same content.
+        assert parse_mock.call_count == 3
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert [
+            (record["project"], record["language_code"], record["finding_type"])
+            for record in records[:-1]
+        ] == [
+            (first, "ru", "MISSING_PLACEABLE"),
+            (first, "ru", "EXTRA_PLACEABLES"),
+            (second, "ru", "MISSING_PLACEABLE"),
+            (second, "ru", "EXTRA_PLACEABLES"),
+            (second, "ru", "MISSING_MESSAGE"),
+            (second, "kz", "MISSING_MESSAGE"),
+        ]
+        assert records[1]["path"] == os.path.join("shared", "ru.ftl")
+        assert records[-1]["projects"][first]["kz"] == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.models import FluentDictionaryState
+from python_fluent_scanner.utils.cache import ScannerCache
+
+PARSE_LOG_FILENAME: str = "parses.log"
+
+
+def _write_and_read_states(worker: int) -> int:
+    """
+    The function saves and loads the state of a dictionary many times, while other processes do the
+    same, and returns the number of states that could not be loaded.
+    """
+    cache: ScannerCache = ScannerCache()
+    failures: int = 0
+
+    for iteration in range(100):
+        cache.set_state(
+            FluentDictionaryState(
+                language_code="en",
+                path="en.ftl",
+                fingerprints={f"message-{worker}-{iteration}": "0" * 16},
+            )
+        )
+
+        if cache.get_state(language_code="en") is None:
+            failures += 1
+
+    return failures
+
+
+def _read_dictionaries(_: int) -> Dict[str, List[str]]:
+    """
+    The function reads the dictionaries through the parse cache, while other processes do the same.
+    """
+    reader: FluentReader = FluentReader(cache=ScannerCache())
+
+    return {
+        language_code: list(dictionary.messages)
+        for language_code, (dictionary, _) in reader.read_by_paths(
+            paths={"en": "en.ftl", "ru": "ru.ftl", "kz": "kz.ftl"}
+        ).items()
+    }
+
+
+class TestCacheConcurrency(unittest.TestCase):
+    def setUp(self) -> None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("the stress tests fork the test process")
+
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("ru.ftl", "a = a\nb = { $var_b }\nc = c\n")
+        self.__write("kz.ftl", "a = a\n")
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+        # The files are dated in the past, so that their stamps prove that they did not change.
+        modified_at: float = time.time() - 60
+        os.utime(path, (modified_at, modified_at))
+
+    def test_concurrent_states(self):
+        """
+        The `test_concurrent_states` function checks that processes saving and loading the same state at
+        the same time always load a complete state.
+        """
+        ScannerCache().set_state(
+            FluentDictionaryState(language_code="en", path="en.ftl", fingerprints={})
+        )
+
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            assert pool.map(_write_and_read_states, range(8)) == [0] * 8
+
+    def test_single_flight(self):
+        """
+        The `test_single_flight` function checks that when processes read the same stale files at the
+        same time, each file is parsed by one of them and the others reuse its entries.
+        """
+        read_file_entry = FluentReader.read_file_entry
+
+        def logged_read_file_entry(reader, path, *args, **kwargs):
+            with open(PARSE_LOG_FILENAME, "a") as file:
+                file.write(f"{path}\n")
+
+            time.sleep(0.05)
+
+            return read_file_entry(reader, path, *args, **kwargs)
+
+        with mock.patch.object(
+            FluentReader, "read_file_entry", logged_read_file_entry
+        ), multiprocessing.get_context("fork").Pool(4) as pool:
+            results: List[Dict[str, List[str]]] = pool.map(_read_dictionaries, range(8))
+
+        with open(PARSE_LOG_FILENAME) as file:
+            parsed_paths: List[str] = file.read().split()
+
+        assert sorted(parsed_paths) == ["en.ftl", "kz.ftl", "ru.ftl"]
+        assert all(result == results[0] for result in results)
+        assert results[0] == {"en": ["a", "b"], "ru": ["a", "b", "c"], "kz": ["a"]}
+
+    def test_invalid_files(self):
+        """
+        The `test_invalid_files` function checks that an invalid cache file is removed when it is loaded,
+        and that removing a missing file does not fail while loading.
+        """
+        cache: ScannerCache = ScannerCache()
+        path: str = os.path.join(".fluent_scanner_cache", "state", "en.json")
+        self.__write(path, "{")
+
+        assert cache.get_state(language_code="en") is None
+        assert not os.path.exists(path)
+        assert cache.get_state(language_code="en") is None
+        assert cache.get(language_code="en") is None
+
+        with self.assertRaises(ValueError):
+            cache.delete(language_code="en")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,31 @@
+import contextlib
+import glob
+import io
 import os
+import shutil
+import struct
 import unittest
+from unittest import mock
 
 from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.cache_format import FORMAT_VERSION, MAGIC
 from python_fluent_scanner.utils.config import ConfigReader
+from python_fluent_scanner.fluent_comparator import FluentComparator
 from python_fluent_scanner.fluent_reader import FluentReader
-from python_fluent_scanner.types.enums import FluentPlaceableTypes
+from python_fluent_scanner.types.compact import (
+    ATTRIBUTE,
+    FUNCTION,
+    MESSAGE_REFERENCE,
+    SELECT_EXPRESSION,
+    TERM_REFERENCE,
+    VARIABLE,
+    CompactDictionary,
+)
+from python_fluent_scanner.types.enums import (
+    FluentFindingTypes,
+    FluentPlaceableTypes,
+    FluentReaderBackends,
+)
 from python_fluent_scanner.types.models import (
     ScannerConfig,
     FluentDictionary,
@@ -47,7 +68,149 @@ class TestCheck(unittest.TestCase):
 
         assert dictionary == cache.get(language_code=dictionary.language_code)
 
-        os.rmdir(".fluent_scanner_cache")
+        shutil.rmtree(".fluent_scanner_cache")
+
+    def test_parse_cache(self):
+        """
+        The `test_parse_cache` function checks that an unchanged file is loaded from the parse cache
+        without being parsed again, and that a changed file is parsed again.
+        """
+        with open("test_dict_file.ftl", "w") as file:
+            file.write(self.TEST_DICTIONARY_DATA)
+
+        reader: FluentReader = FluentReader(cache=ScannerCache())
+        dictionary: CompactDictionary = reader.parse_by_file(
+            path="test_dict_file.ftl", language_code="en"
+        )
+
+        with mock.patch("python_fluent_scanner.fluent_reader.parse") as parse:
+            assert dictionary == reader.parse_by_file(
+                path="test_dict_file.ftl", language_code="en"
+            )
+            parse.assert_not_called()
+
+        with open("test_dict_file.ftl", "w") as file:
+            file.write(self.TEST_DICTIONARY_DATA + "\nd = { $var_d }\n")
+
+        dictionary = reader.parse_by_file(path="test_dict_file.ftl", language_code="en")
+
+        assert ("var_d", VARIABLE) in dictionary.messages["d"]
+
+        os.remove("test_dict_file.ftl")
+        shutil.rmtree(".fluent_scanner_cache")
+
+    def test_cache_backends(self):
+        """
+        The `test_cache_backends` function checks that the parse cache keeps the dictionaries extracted
+        by each reader backend apart, so that switching the backend does not reuse the messages the other
+        backend extracted from the same files.
+        """
+        os.makedirs("test_dict_dir")
+
+        for path in ("test_dict_file.ftl", "test_dict_dir/first.ftl"):
+            with open(path, "w") as file:
+                file.write(self.TEST_DICTIONARY_DATA)
+
+        cache: ScannerCache = ScannerCache()
+        paths = {"en": "test_dict_file.ftl", "ru": "test_dict_dir"}
+        results = {}
+
+        for backend in (
+            FluentReaderBackends.FAST,
+            FluentReaderBackends.AST,
+            FluentReaderBackends.FAST,
+        ):
+            with mock.patch(
+                "python_fluent_scanner.fluent_reader.FluentTokenizer.parse",
+                return_value=({"fast": ()}, []),
+            ):
+                results[backend] = FluentReader(
+                    cache=cache, backend=backend
+                ).parse_by_paths(paths=paths)
+
+            assert [
+                list(dictionary.messages) for dictionary in results[backend].values()
+            ] == (
+                [["fast"], ["fast"]]
+                if backend == FluentReaderBackends.FAST
+                else [["a", "b", "c"], ["a", "b", "c"]]
+            )
+
+        os.remove("test_dict_file.ftl")
+        shutil.rmtree("test_dict_dir")
+        shutil.rmtree(".fluent_scanner_cache")
+
+    def test_cache_layout(self):
+        """
+        The `test_cache_layout` function checks that the files left in the parse cache by the previous
+        layouts of the cache folder, e.g. the JSON entries of the first versions, are removed.
+        """
+        stale_paths = [
+            ".fluent_scanner_cache/parsed/en.json",
+            ".fluent_scanner_cache/parsed/en.bin",
+            ".fluent_scanner_cache/parsed/en/0123456789abcdef.bin",
+            ".fluent_scanner_cache/locales/ru.bin",
+        ]
+        current_paths = [
+            ".fluent_scanner_cache/parsed/en/0123456789abcdef.ast.bin",
+            ".fluent_scanner_cache/locales/ru.fast.bin",
+            ".fluent_scanner_cache/state/en.json",
+        ]
+
+        for path in stale_paths + current_paths:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with open(path, "wb") as file:
+                file.write(b"entry")
+
+        ScannerCache()
+
+        assert [os.path.exists(path) for path in stale_paths + current_paths] == [
+            False
+        ] * len(stale_paths) + [True] * len(current_paths)
+
+        shutil.rmtree(".fluent_scanner_cache")
+
+    def test_cache_format_version(self):
+        """
+        The `test_cache_format_version` function checks that a parse cache entry survives the binary
+        cache format, and that an entry written with another version of the format is discarded.
+        """
+        with open("test_dict_file.ftl", "w") as file:
+            file.write(self.TEST_DICTIONARY_DATA)
+
+        cache: ScannerCache = ScannerCache()
+        dictionary: CompactDictionary = FluentReader(cache=cache).parse_by_file(
+            path="test_dict_file.ftl", language_code="en"
+        )
+
+        assert (
+            dictionary
+            == cache.get_entry(
+                language_code="en",
+                path="test_dict_file.ftl",
+                backend=FluentReaderBackends.AST,
+            ).dictionary
+        )
+
+        (entry_path,) = glob.glob(".fluent_scanner_cache/parsed/en/*.bin")
+
+        with open(entry_path, "r+b") as file:
+            file.seek(len(MAGIC))
+            file.write(struct.pack("<H", FORMAT_VERSION + 1))
+
+        assert (
+            cache.get_entry(
+                language_code="en",
+                path="test_dict_file.ftl",
+                backend=FluentReaderBackends.AST,
+            )
+            is None
+        )
+        assert not os.path.exists(entry_path)
+
+        os.remove("test_dict_file.ftl")
+        shutil.rmtree(".fluent_scanner_cache")
 
     def test_config_reader(self) -> ScannerConfig:
         """
@@ -71,7 +234,7 @@ class TestCheck(unittest.TestCase):
         os.remove("test_dict_file.ftl")
         os.remove("testconfigconfig.json")
 
-    def test_reader(self) -> FluentDictionary:
+    def test_reader(self) -> CompactDictionary:
         """
         The `test_reader` function creates a test Fluent dictionary file, configures a FluentReader with the
         file, parses the dictionary using the reader, and then removes the test file.
@@ -93,5 +256,142 @@ class TestCheck(unittest.TestCase):
 
         os.remove("test_dict_file.ftl")
 
+    def test_reader_placeables(self):
+        """
+        The `test_reader_placeables` function checks that both reader backends extract the placeables
+        nested in select expressions, call arguments and attributes, and the function calls and the
+        message and term references of a message.
+        """
+        source: str = (
+            "refs = { NUMBER($count) ->\n"
+            "    [one] { -brand(case: \"gen\") } { other.title }\n"
+            "   *[other] { $count ->\n"
+            "       *[other] { $name }\n"
+            "    }\n"
+            "}\n"
+            "    .label = { $name }\n"
+        )
+
+        for backend in FluentReaderBackends:
+            dictionary: CompactDictionary = FluentReader(backend=backend).parse_by_source(
+                source=source, language_code="en"
+            )
+
+            assert dictionary.messages["refs"] == (
+                ("NUMBER()", FUNCTION),
+                ("count", SELECT_EXPRESSION),
+                ("-brand", TERM_REFERENCE),
+                ("other.title", MESSAGE_REFERENCE),
+                ("name", VARIABLE),
+                (".label", ATTRIBUTE),
+            )
+
+    def test_parallel_reader(self):
+        """
+        The `test_parallel_reader` function checks that parsing dictionaries in a process pool gives the
+        same dictionaries and duplicate warnings, in the same order, as parsing them sequentially.
+        """
+        for language_code in ("en", "ru", "kz"):
+            with open(f"test_dict_{language_code}.ftl", "w") as file:
+                file.write(self.TEST_DICTIONARY_DATA + f"\n{language_code} = x\n{language_code} = y\n")
+
+        config: ScannerConfig = ScannerConfig(
+            root_locale="en",
+            dictionaries={
+                language_code: f"test_dict_{language_code}.ftl"
+                for language_code in ("en", "ru", "kz")
+            },
+        )
+
+        outputs = []
+
+        for jobs in (1, 3):
+            output = io.StringIO()
+
+            with mock.patch(
+                "python_fluent_scanner.fluent_reader.PARALLEL_PARSE_MIN_BYTES", 0
+            ), contextlib.redirect_stdout(output):
+                dictionaries = FluentReader(jobs=jobs).parse_by_config(config)
+
+            outputs.append((list(dictionaries.items()), output.getvalue()))
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0][1].index("for ru") < outputs[0][1].index("for kz")
+
+        for language_code in ("en", "ru", "kz"):
+            os.remove(f"test_dict_{language_code}.ftl")
+
+    def test_comparator(self):
+        """
+        The `test_comparator` function checks the findings of the comparison of a dictionary with the root
+        dictionary, sequentially and in a process pool.
+        """
+        root: CompactDictionary = FluentReader().parse_by_source(
+            source=self.TEST_DICTIONARY_DATA, language_code="en"
+        )
+        dictionary: CompactDictionary = FluentReader().parse_by_source(
+            source="b = { $var_b ->\n*[other] x\n}\nc = { $var_c -> \n*[other] { $x }\n}\nd = d\n",
+            language_code="ru",
+        )
+
+        findings = FluentComparator().compare(dict_a=root, dict_b=dictionary)
+
+        assert [
+            (finding.finding_type, finding.message_name, finding.placeable_name, finding.names)
+            for finding in findings
+        ] == [
+            (FluentFindingTypes.MISSING_MESSAGE, "a", None, []),
+            (FluentFindingTypes.PLACEABLE_TYPE_MISMATCH, "b", "var_b", []),
+            (FluentFindingTypes.EXTRA_PLACEABLES, "c", None, ["x"]),
+            (FluentFindingTypes.EXTRA_MESSAGES, None, None, ["d"]),
+        ]
+
+        with mock.patch(
+            "python_fluent_scanner.fluent_comparator.PARALLEL_COMPARE_MIN_MESSAGES", 0
+        ):
+            assert list(
+                FluentComparator().compare_many(
+                    root_dictionary=root, dictionaries=[dictionary, root], jobs=2
+                )
+            ) == [findings, []]
+
+    def test_comparator_message_names(self):
+        """
+        The `test_comparator_message_names` function checks that fingerprints only change with the
+        placeables of a message, and that a comparison limited to some messages only reports them.
+        """
+        comparator: FluentComparator = FluentComparator()
+        root: CompactDictionary = FluentReader().parse_by_source(
+            source=self.TEST_DICTIONARY_DATA, language_code="en"
+        )
+        changed_root: CompactDictionary = FluentReader().parse_by_source(
+            source="a = changed text\nb = { $var_x }\nc = { $var_c }\n", language_code="en"
+        )
+        dictionary: CompactDictionary = FluentReader().parse_by_source(
+            source="b = { $var_b }\nd = d\ne = e\n", language_code="ru"
+        )
+
+        fingerprints = comparator.get_fingerprints(comparator.get_signatures(root))
+        changed_fingerprints = comparator.get_fingerprints(
+            comparator.get_signatures(changed_root)
+        )
+
+        assert fingerprints["a"] == changed_fingerprints["a"]
+        assert fingerprints["b"] != changed_fingerprints["b"]
+
+        findings = comparator.compare(
+            dict_a=changed_root, dict_b=dictionary, message_names={"b", "e"}
+        )
+
+        assert [
+            (finding.finding_type, finding.message_name, finding.names)
+            for finding in findings
+        ] == [
+            (FluentFindingTypes.MISSING_PLACEABLE, "b", []),
+            (FluentFindingTypes.EXTRA_PLACEABLES, "b", ["var_b"]),
+            (FluentFindingTypes.EXTRA_MESSAGES, None, ["e"]),
+        ]
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from python_fluent_scanner.fluent_daemon import (
+    FluentDaemon,
+    FluentDaemonClient,
+    FluentDaemonError,
+)
+from python_fluent_scanner.types.enums import FluentFindingTypes
+from python_fluent_scanner.types.models import ScannerConfig
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", "a = a\nb = { $var_b }\nc = c\n")
+        self.__write("ru.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("kz.ftl", "a = a\nb = { $var_b }\nc = c\n")
+        os.makedirs(os.path.join("locales", "fr"))
+        self.__write(os.path.join("locales", "fr", "one.ftl"), "a = a\n")
+        self.__write(os.path.join("locales", "fr", "two.ftl"), "b = { $var_b }\nc = c\n")
+
+        self.__socket_path: str = os.path.join(self.__temporary_dir.name, "test.sock")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            daemon: FluentDaemon = FluentDaemon(
+                config=ScannerConfig(
+                    root_locale="en",
+                    dictionaries={
+                        "en": "en.ftl",
+                        "ru": "ru.ftl",
+                        "kz": "kz.ftl",
+                        "fr": "locales/fr/*.ftl",
+                    },
+                ),
+                socket_path=self.__socket_path,
+            )
+
+        self.__thread = threading.Thread(target=daemon.serve)
+        self.__thread.start()
+
+        while not os.path.exists(self.__socket_path):
+            time.sleep(0.01)
+
+    def tearDown(self) -> None:
+        with FluentDaemonClient(socket_path=self.__socket_path) as client:
+            client.shutdown()
+
+        self.__thread.join()
+
+        assert not os.path.exists(self.__socket_path)
+
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+        stat: os.stat_result = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_daemon(self):
+        """
+        The `test_daemon` function checks that the daemon answers the requests with the dictionaries in
+        memory, that an unsaved buffer replaces a dictionary until it is closed, and that the changes of
+        the files are loaded.
+        """
+        with FluentDaemonClient(socket_path=self.__socket_path, timeout=10) as client:
+            assert client.get_missing_messages("ru") == ["c"]
+            assert client.check("kz") == {"kz": []}
+
+            findings = client.check("ru", source="a = a\nb = { $var_x }\nc = c\n")
+
+            assert [finding.finding_type for finding in findings["ru"]] == [
+                FluentFindingTypes.MISSING_PLACEABLE,
+                FluentFindingTypes.EXTRA_PLACEABLES,
+            ]
+            assert client.get_missing_messages("ru") == []
+
+            # The buffer of the root dictionary is compared with every other dictionary.
+            findings = client.check("en", source="a = a\nb = { $var_b }\n")
+
+            assert findings["kz"][0].finding_type == FluentFindingTypes.EXTRA_MESSAGES
+            assert client.close_buffer("en")["kz"] == []
+
+            # The file of a dictionary with a buffer is ignored until the buffer is closed.
+            self.__write("ru.ftl", "a = a\n")
+
+            assert client.get_missing_messages("ru") == []
+            assert client.close_buffer("ru") == client.check("ru")
+            assert client.get_missing_messages("ru") == ["b", "c"]
+
+            with self.assertRaises(FluentDaemonError):
+                client.check("de")
+
+            with self.assertRaises(FluentDaemonError):
+                client.request("unknown")
+
+    def test_multiple_files(self):
+        """
+        The `test_multiple_files` function checks that an unsaved buffer replaces only its file in a
+        dictionary made of several files, and that the changes of the other files are still loaded.
+        """
+        one_path: str = os.path.join("locales", "fr", "one.ftl")
+
+        with FluentDaemonClient(socket_path=self.__socket_path, timeout=10) as client:
+            assert client.check("fr", source="a = A edited\n", path=one_path) == {"fr": []}
+
+            self.__write(os.path.join("locales", "fr", "two.ftl"), "b = { $var_b }\n")
+
+            assert client.get_missing_messages("fr") == ["c"]
+
+            # The file of a buffer is ignored until the buffer is closed.
+            self.__write(one_path, "")
+
+            assert client.get_missing_messages("fr") == ["c"]
+            assert client.close_buffer(
+                "fr", path=os.path.abspath(one_path)
+            ) == client.check("fr")
+            assert client.get_missing_messages("fr") == ["a", "c"]
+
+            with self.assertRaisesRegex(FluentDaemonError, "not a file of the dictionary"):
+                client.check("fr", source="a = a\n")
+
+    def test_unreadable_file(self):
+        """
+        The `test_unreadable_file` function checks that a dictionary file that cannot be read, e.g. while
+        an editor saves it, is returned as an error, and that the daemon loads it after its next change.
+        """
+        with FluentDaemonClient(socket_path=self.__socket_path, timeout=10) as client:
+            with open("ru.ftl", "wb") as file:
+                file.write("a = ä\n".encode("utf-8")[:-2])
+
+            with self.assertRaisesRegex(FluentDaemonError, "can't decode"):
+                client.get_missing_messages("ru")
+
+            os.remove("ru.ftl")
+            self.__write("ru.ftl", "a = a\n")
+
+            assert client.get_missing_messages("ru") == ["b", "c"]
+
+
+if __name__ == "__main__":
+    unittest.main()
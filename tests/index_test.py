@@ -0,0 +1,128 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from python_fluent_scanner.fluent_index import FluentIndex, get_index
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.fluent_scanner import FluentScanner
+from python_fluent_scanner.types.models import ScannerConfig
+from python_fluent_scanner.utils.cache import ScannerCache
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", "a = a\nb = { $count }\nc = { $count } { $name }\n")
+        self.__write("ru.ftl", "a = a\nb = { $count }\n")
+        self.__write("kz.ftl", "b = { $total }\nc = { $count } { $name }\n")
+        self.__config = ScannerConfig(
+            root_locale="en",
+            dictionaries={"en": "en.ftl", "ru": "ru.ftl", "kz": "kz.ftl"},
+            index=True,
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+        # The files are dated in the past, so that their size and mtime prove that they did not change.
+        modified_at: float = time.time() - 60 - len(data)
+        os.utime(path, (modified_at, modified_at))
+
+    def __get_answers(self, index: FluentIndex) -> tuple:
+        return (
+            {name: index.get_locales(name) for name in "abcd"},
+            {name: index.get_missing_locales(name) for name in "abcd"},
+            {
+                name: index.get_variable_messages(name)
+                for name in ["count", "name", "total"]
+            },
+            {name: index.get_signature_messages(name, "en") for name in "abcd"},
+        )
+
+    def test_queries(self):
+        """
+        The `test_queries` function checks the locales of the messages, the messages of the variables and
+        the messages with the same signature.
+        """
+        index: FluentIndex = get_index(config=self.__config)
+
+        assert index.get_locales("a") == ["en", "ru"]
+        assert index.get_missing_locales("a") == ["kz"]
+        assert index.get_missing_locales("d") == ["en", "ru", "kz"]
+        assert index.get_variable_messages("count") == {
+            "b": ["en", "ru"],
+            "c": ["en", "kz"],
+        }
+        assert index.get_variable_messages("missing") == {}
+        assert index.get_signature_messages("b", "en") == {"b": ["en", "ru"]}
+        assert index.get_signature_messages("c", "kz") == {"c": ["en", "kz"]}
+        assert index.get_signature_messages("a", "kz") == {}
+
+    def test_incremental_update(self):
+        """
+        The `test_incremental_update` function checks that the saved index is used without reading the
+        dictionaries again, and that updating the locales whose files changed gives the same answers as
+        indexing every locale from scratch.
+        """
+        get_index(config=self.__config)
+
+        with mock.patch.object(FluentReader, "read_by_paths") as read_by_paths:
+            get_index(config=self.__config)
+
+        read_by_paths.assert_not_called()
+
+        self.__write("ru.ftl", "b = { $count } { $name }\nd = { $total }\n")
+
+        with mock.patch.object(
+            FluentReader,
+            "read_by_paths",
+            autospec=True,
+            side_effect=FluentReader.read_by_paths,
+        ) as read_by_paths:
+            index: FluentIndex = get_index(config=self.__config)
+
+        assert list(read_by_paths.call_args.kwargs["paths"]) == ["ru"]
+        assert index.get_locales("a") == ["en"]
+        assert index.get_locales("d") == ["ru"]
+        assert index.get_signature_messages("c", "en") == {
+            "b": ["ru"],
+            "c": ["en", "kz"],
+        }
+
+        os.remove(os.path.join(".fluent_scanner_cache", "index.bin"))
+        assert self.__get_answers(index) == self.__get_answers(
+            get_index(config=self.__config)
+        )
+
+    def test_scanner(self):
+        """
+        The `test_scanner` function checks that a check updates the index when the configuration enables
+        it.
+        """
+        self.__write("fluent_scanner_config.json", self.__config.model_dump_json())
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            FluentScanner().check()
+
+        index: FluentIndex = FluentIndex.load(
+            language_codes=["en", "ru", "kz"], cache=ScannerCache()
+        )
+
+        assert index.get_locales("c") == ["en", "kz"]
+        assert index.get_stale_locales(paths=self.__config.dictionaries) == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from python_fluent_scanner import fluent_reader
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import VARIABLE
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.types.models import ScannerConfig
+from python_fluent_scanner.utils.cache import ScannerCache
+
+
+class TestLocales(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__mtime_ns = time.time_ns() - 100_000_000_000
+
+        self.__write("locales/en/main.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("locales/en/settings/page.ftl", "c = c\na = { $var_a }\n")
+        self.__write("locales/en/settings/notes.txt", "not a dictionary")
+        self.__write("locales/ru/main.ftl", "a = a\n")
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        """
+        The function writes a file with an mtime in the past, so that its size and mtime are enough to
+        prove that it did not change. Each write gets a new mtime.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+            file.write(data)
+
+        self.__mtime_ns += 1_000_000_000
+        os.utime(path, ns=(self.__mtime_ns, self.__mtime_ns))
+
+    def __parse(self, reader: FluentReader, paths):
+        """
+        The function parses dictionaries and returns them with the printed duplicate warnings.
+        """
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            dictionaries = reader.parse_by_paths(paths=paths)
+
+        return dictionaries, output.getvalue()
+
+    def test_locale_files(self):
+        """
+        The `test_locale_files` function checks that the files of a directory are merged into one
+        dictionary with the source of each message, and that duplicates across files are reported with
+        both files.
+        """
+        config: ScannerConfig = ScannerConfig(
+            root_locale="en",
+            dictionaries={"en": "locales/en", "ru": "locales/ru/*.ftl"},
+        )
+
+        dictionaries, output = self.__parse(FluentReader(), config.dictionaries)
+
+        assert list(dictionaries["en"].messages.items()) == [
+            ("a", ()),
+            ("b", (("var_b", VARIABLE),)),
+            ("c", ()),
+        ]
+        assert dictionaries["en"].get_source("c") == "locales/en/settings/page.ftl"
+        assert dictionaries["ru"].get_source("a") == "locales/ru/main.ftl"
+        assert (
+            "Found duplicate for a in locales/en/main.ftl and locales/en/settings/page.ftl"
+            in output
+        )
+
+    def test_locale_cache(self):
+        """
+        The `test_locale_cache` function checks that a change of one file of a locale only parses that
+        file, and gives the same dictionary and warnings as parsing every file without the cache.
+        """
+        paths = {"en": "locales/en"}
+        reader: FluentReader = FluentReader(cache=ScannerCache())
+
+        self.__parse(reader, paths)
+
+        with mock.patch.object(fluent_reader, "parse", wraps=fluent_reader.parse) as parse:
+            result = self.__parse(reader, paths)
+            parse.assert_not_called()
+
+        assert result == self.__parse(FluentReader(), paths)
+
+        self.__write("locales/en/settings/page.ftl", "c = { $var_c }\nd = d\n")
+        self.__write("locales/en/new.ftl", "b = b\ne = e\n")
+
+        with mock.patch.object(fluent_reader, "parse", wraps=fluent_reader.parse) as parse:
+            dictionaries, output = self.__parse(reader, paths)
+            assert parse.call_count == 2
+
+        assert (dictionaries, output) == self.__parse(FluentReader(), paths)
+        assert list(dictionaries["en"].messages) == ["a", "b", "e", "c", "d"]
+        assert dictionaries["en"].get_source("b") == "locales/en/main.ftl"
+        assert "Found duplicate for b in locales/en/main.ftl and locales/en/new.ftl" in output
+
+        os.remove("locales/en/new.ftl")
+
+        with mock.patch.object(fluent_reader, "parse", wraps=fluent_reader.parse) as parse:
+            result = self.__parse(reader, paths)
+            parse.assert_not_called()
+
+        assert result == self.__parse(FluentReader(), paths)
+        assert "e" not in result[0]["en"].messages
+
+    def test_duplicates(self):
+        """
+        The `test_duplicates` function checks that the first definition of a message is kept, whether
+        the message is defined again in the same file or in another file of the locale.
+        """
+        self.__write("one/main.ftl", "a = { $first }\na = { $second }\n")
+        self.__write("two/first.ftl", "a = { $first }\n")
+        self.__write("two/second.ftl", "a = { $second }\n")
+
+        for backend in FluentReaderBackends:
+            dictionaries, _ = self.__parse(
+                FluentReader(backend=backend),
+                {"one": "one/main.ftl", "dir": "one", "two": "two"},
+            )
+
+            for dictionary in dictionaries.values():
+                assert dictionary.messages["a"] == (("first", VARIABLE),)
+
+
+if __name__ == "__main__":
+    unittest.main()
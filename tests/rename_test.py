@@ -0,0 +1,158 @@
+import contextlib
+import io
+import json
+import os
+import stat
+import tempfile
+import unittest
+
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_renamer import FluentRenamer
+from python_fluent_scanner.fluent_scanner import FluentScanner
+from python_fluent_scanner.types.compact import (
+    TERM_REFERENCE,
+    VARIABLE,
+    CompactDictionary,
+)
+from python_fluent_scanner.types.enums import FluentFindingTypes
+from python_fluent_scanner.utils.similarity import match_names
+
+
+class TestRename(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+    def __read(self, path: str) -> str:
+        with open(path) as file:
+            return file.read()
+
+    def test_match_names(self):
+        """
+        The `test_match_names` function checks that names are paired one to one with the most similar
+        candidates, and that dissimilar names are not paired.
+        """
+        names = [f"settings-page-title-{number}" for number in range(2000)] + ["a"]
+        candidates = [
+            f"settings-page-heading-{number}" for number in reversed(range(2000))
+        ] + ["b"]
+
+        matches = match_names(names, candidates)
+
+        assert len(matches) == 2000
+        assert matches["settings-page-title-42"] == "settings-page-heading-42"
+        assert "a" not in matches
+        assert match_names(["cart-total", "cart-totals"], ["cart-totals-label"]) == {
+            "cart-totals": "cart-totals-label"
+        }
+
+    def test_suggestions(self):
+        """
+        The `test_suggestions` function checks that the missing messages and variables get the extra
+        names they were likely renamed to as suggestions, and that the other placeables, which cannot be
+        renamed, do not.
+        """
+        findings = FluentComparator().compare(
+            dict_a=CompactDictionary(
+                language_code="en",
+                path="en.ftl",
+                messages={
+                    "welcome-title": (("user_name", VARIABLE),),
+                    "goodbye": (),
+                    "c": (),
+                    "cart": (("count", VARIABLE),),
+                    "about": (("-brand-name", TERM_REFERENCE),),
+                },
+            ),
+            dict_b=CompactDictionary(
+                language_code="ru",
+                path="ru.ftl",
+                messages={
+                    "welcome-titles": (("username", VARIABLE),),
+                    "goodbye": (),
+                    "d": (),
+                    "cart": (("counts", VARIABLE),),
+                    "about": (("-brand-nam", TERM_REFERENCE),),
+                },
+            ),
+        )
+
+        assert [
+            (finding.finding_type, finding.message_name, finding.suggestion)
+            for finding in findings
+        ] == [
+            (FluentFindingTypes.MISSING_MESSAGE, "welcome-title", "welcome-titles"),
+            (FluentFindingTypes.MISSING_MESSAGE, "c", None),
+            (FluentFindingTypes.MISSING_PLACEABLE, "cart", "counts"),
+            (FluentFindingTypes.EXTRA_PLACEABLES, "cart", None),
+            (FluentFindingTypes.MISSING_PLACEABLE, "about", None),
+            (FluentFindingTypes.EXTRA_PLACEABLES, "about", None),
+            (FluentFindingTypes.EXTRA_MESSAGES, None, None),
+        ]
+
+    def test_renamer(self):
+        """
+        The `test_renamer` function checks that the renamer only changes the identifiers of the renamed
+        messages and the references to the renamed variables of their message.
+        """
+        self.__write(
+            "ru.ftl",
+            "# $count\nold-name = { $count }\n"
+            "items = { $count ->\n    [one] { $count } item\n   *[other] { $counts }\n}\n"
+            "    .title = { $count }\nother = { $count }\n",
+        )
+        os.chmod("ru.ftl", 0o640)
+
+        assert (
+            FluentRenamer().rename(
+                path="ru.ftl",
+                message_renames={"old-name": "new-name"},
+                variable_renames={"items": {"count": "number"}},
+            )
+            == 4
+        )
+        assert self.__read("ru.ftl") == (
+            "# $count\nnew-name = { $count }\n"
+            "items = { $number ->\n    [one] { $number } item\n   *[other] { $counts }\n}\n"
+            "    .title = { $number }\nother = { $count }\n"
+        )
+        assert stat.S_IMODE(os.stat("ru.ftl").st_mode) == 0o640
+
+    def test_fix_renames(self):
+        """
+        The `test_fix_renames` function checks that the scanner renames the extra messages and variables
+        of a dictionary, after which the dictionary has no errors.
+        """
+        self.__write("en.ftl", "welcome-title = { $user_name }\ncart = { $count }\n")
+        self.__write("ru.ftl", "welcome-header = { $user_name }\ncart = { $counts }\n")
+        self.__write(
+            "fluent_scanner_config.json",
+            json.dumps(
+                {"root_locale": "en", "dictionaries": {"en": "en.ftl", "ru": "ru.ftl"}}
+            ),
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert FluentScanner(fix_renames=True).check()
+
+        assert "(renamed to `welcome-header`?)" in output.getvalue()
+        assert "Renamed 2 messages and variables in ru.ftl" in output.getvalue()
+        assert self.__read("ru.ftl") == (
+            "welcome-title = { $user_name }\ncart = { $count }\n"
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert not FluentScanner().check()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from python_fluent_scanner.fluent_reporter import get_reporter
+from python_fluent_scanner.fluent_scanner import FluentScanner
+from python_fluent_scanner.types.enums import FluentReportFormats
+
+
+class TestReporter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("ru.ftl", "a = a\na = a\nb = { $var_x }\n")
+        self.__write("kz.ftl", "a = a\nb = { $var_b }\n")
+        self.__write(
+            "fluent_scanner_config.json",
+            json.dumps(
+                {
+                    "root_locale": "en",
+                    "dictionaries": {"en": "en.ftl", "ru": "ru.ftl", "kz": "kz.ftl"},
+                }
+            ),
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+    def __check(self, report_format: FluentReportFormats) -> str:
+        output = io.StringIO()
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            scanner = FluentScanner(
+                reporter=get_reporter(report_format=report_format, stream=output)
+            )
+
+            assert scanner.check()
+
+        return output.getvalue()
+
+    def test_jsonl(self):
+        """
+        The `test_jsonl` function checks that the JSON Lines report has a record per duplicate message and
+        per finding, and ends with the summary.
+        """
+        records = [
+            json.loads(line)
+            for line in self.__check(FluentReportFormats.JSONL).splitlines()
+        ]
+
+        assert [record["type"] for record in records] == [
+            "duplicate",
+            "finding",
+            "finding",
+            "summary",
+        ]
+        assert records[0]["message_name"] == "a"
+        assert records[1]["finding_type"] == "MISSING_PLACEABLE"
+        assert records[1]["path"] == "ru.ftl"
+        assert records[-1] == {
+            "type": "summary",
+            "is_error_found": True,
+            "findings": 2,
+            "duplicates": 1,
+            "locales": {
+                "ru": {
+                    "DUPLICATE_MESSAGE": 1,
+                    "MISSING_PLACEABLE": 1,
+                    "EXTRA_PLACEABLES": 1,
+                },
+                "kz": {},
+            },
+        }
+
+    def test_sarif(self):
+        """
+        The `test_sarif` function checks that the SARIF report is a valid JSON document with a result per
+        duplicate message and per finding.
+        """
+        log = json.loads(self.__check(FluentReportFormats.SARIF))
+        run = log["runs"][0]
+
+        assert log["version"] == "2.1.0"
+        assert [(result["ruleId"], result["level"]) for result in run["results"]] == [
+            ("DUPLICATE_MESSAGE", "warning"),
+            ("MISSING_PLACEABLE", "error"),
+            ("EXTRA_PLACEABLES", "error"),
+        ]
+        assert run["results"][1]["locations"][0]["logicalLocations"][0]["name"] == "b"
+        assert run["properties"]["summary"]["findings"] == 2
+
+    def test_sarif_without_results(self):
+        """
+        The `test_sarif_without_results` function checks that the SARIF log is only started by its first
+        result or by `finish`, so that a check failing before reporting anything writes nothing.
+        """
+        output = io.StringIO()
+        reporter = get_reporter(report_format=FluentReportFormats.SARIF, stream=output)
+
+        assert output.getvalue() == ""
+
+        reporter.finish(is_error_found=False)
+
+        assert json.loads(output.getvalue())["runs"][0]["results"] == []
+
+    def test_multiple_files(self):
+        """
+        The `test_multiple_files` function checks that the findings about a dictionary made of several
+        files are located in the file that defines their message, and a missing message in the dictionary.
+        """
+        os.makedirs(os.path.join("locales", "de"))
+        self.__write("en.ftl", "a = a\nb = { $var_b }\nc = c\n")
+        self.__write(os.path.join("locales", "de", "one.ftl"), "a = a\nx = x\n")
+        self.__write(os.path.join("locales", "de", "two.ftl"), "b = { $var_x }\n")
+        self.__write(
+            "fluent_scanner_config.json",
+            json.dumps(
+                {
+                    "root_locale": "en",
+                    "dictionaries": {"en": "en.ftl", "de": "locales/de/*.ftl"},
+                }
+            ),
+        )
+        expected_paths = {
+            "MISSING_MESSAGE": "locales/de/*.ftl",
+            "EXTRA_MESSAGES": "locales/de/one.ftl",
+            "MISSING_PLACEABLE": "locales/de/two.ftl",
+            "EXTRA_PLACEABLES": "locales/de/two.ftl",
+        }
+
+        records = [
+            json.loads(line)
+            for line in self.__check(FluentReportFormats.JSONL).splitlines()
+        ]
+
+        assert {
+            record["finding_type"]: record["path"]
+            for record in records
+            if record["type"] == "finding"
+        } == expected_paths
+
+        run = json.loads(self.__check(FluentReportFormats.SARIF))["runs"][0]
+
+        assert {
+            result["ruleId"]: result["locations"][0]["physicalLocation"]["artifactLocation"][
+                "uri"
+            ]
+            for result in run["results"]
+        } == expected_paths
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from python_fluent_scanner.fluent_scanner import FluentScanner
+from python_fluent_scanner.utils.run_stamp import is_up_to_date
+
+
+class TestRunStamp(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("ru.ftl", "a = a\nb = { $var_b }\n")
+        self.__write(
+            "fluent_scanner_config.json",
+            json.dumps(
+                {"root_locale": "en", "dictionaries": {"en": "en.ftl", "ru": "ru.ftl"}}
+            ),
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        with open(path, "w") as file:
+            file.write(data)
+
+    def __check(self) -> str:
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            FluentScanner().check()
+
+        return output.getvalue()
+
+    def test_run_stamp(self):
+        """
+        The `test_run_stamp` function checks that the root dictionary is only up to date for the fast path
+        when the configuration, the root dictionary and its saved state did not change since a
+        successful check.
+        """
+        assert not is_up_to_date()
+        assert "checked successfully" in self.__check()
+        assert is_up_to_date()
+
+        # Other dictionaries do not change the outcome of a check.
+        self.__write("ru.ftl", "a = a\n")
+        assert is_up_to_date()
+
+        # Rewriting the same content changes the mtime but not the hash.
+        self.__write("en.ftl", "a = a\nb = { $var_b }\n")
+        assert is_up_to_date()
+
+        self.__write("en.ftl", "a = a\nb = { $var_c }\n")
+        assert not is_up_to_date()
+        assert "ru" in self.__check()
+        assert not is_up_to_date()
+
+        self.__write("en.ftl", "a = a\nb = { $var_b }\n")
+        assert "Root dictionary is up to date" in self.__check()
+        assert is_up_to_date()
+
+        os.remove(".fluent_scanner_cache/state/en.json")
+        assert not is_up_to_date()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.types.compact import VARIABLE
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.shared_cache import SharedCache
+
+
+class TestSharedCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__shared_cache_path: str = os.path.join(
+            self.__temporary_dir.name, "shared"
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+            file.write(data)
+
+    def __read(self, project: str, path: str, language_code: str):
+        """
+        The function reads a file of a project with the parse cache of the project and the shared cache.
+        """
+        os.chdir(os.path.join(self.__temporary_dir.name, project))
+
+        try:
+            reader: FluentReader = FluentReader(
+                cache=ScannerCache(),
+                shared_cache=SharedCache(path=self.__shared_cache_path),
+            )
+
+            return reader.parse_by_file(path=path, language_code=language_code)
+        finally:
+            os.chdir(self.__temporary_dir.name)
+
+    def test_shared_cache(self):
+        """
+        The `test_shared_cache` function checks that a content already parsed by a project is not parsed
+        again by another project or after a branch switch, and is stored once.
+        """
+        self.__write("first/en.ftl", "a = { $var_a }\n")
+        self.__write("second/locales/en-US.ftl", "a = { $var_a }\n")
+
+        self.__read("first", "en.ftl", "en")
+
+        with mock.patch("python_fluent_scanner.fluent_reader.parse") as parse:
+            dictionary = self.__read("second", "locales/en-US.ftl", "en-US")
+            parse.assert_not_called()
+
+        assert dictionary.language_code == "en-US"
+        assert dictionary.path == "locales/en-US.ftl"
+        assert dictionary.messages == {"a": (("var_a", VARIABLE),)}
+        assert SharedCache(path=self.__shared_cache_path).get_stats()["entries"] == 1
+
+        # Switching back to a version of a file parsed before does not parse it again.
+        self.__write("first/en.ftl", "a = { $var_b }\n")
+        self.__read("first", "en.ftl", "en")
+        self.__write("first/en.ftl", "a = { $var_a }\n")
+
+        with mock.patch("python_fluent_scanner.fluent_reader.parse") as parse:
+            self.__read("first", "en.ftl", "en")
+            parse.assert_not_called()
+
+    def test_eviction(self):
+        """
+        The `test_eviction` function checks that the least recently used entries are evicted first.
+        """
+        for index in range(4):
+            self.__write(f"project/{index}.ftl", f"message_{index} = {index}\n")
+            self.__read("project", f"{index}.ftl", "en")
+
+        shared_cache: SharedCache = SharedCache(path=self.__shared_cache_path)
+        entry_paths = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(self.__shared_cache_path)
+            for name in names
+            if name.endswith(".bin")
+        )
+
+        for age, entry_path in enumerate(entry_paths):
+            os.utime(entry_path, ns=(age * 10**9, age * 10**9))
+
+        assert shared_cache.prune(max_entries=3)["entries"] == 1
+        assert not os.path.exists(entry_paths[0])
+        assert shared_cache.get_stats()["entries"] == 3
+
+        assert shared_cache.prune(max_bytes=0)["entries"] == 3
+        assert shared_cache.get_stats()["entries"] == 0
+
+    def test_eviction_on_store(self):
+        """
+        The `test_eviction_on_store` function checks that a store evicts the entries over the share of
+        the limits of a folder, but never the entry it stores, even when the limits are lower than the
+        number of folders.
+        """
+        for limits in ({"max_entries": 10}, {"max_bytes": 1}):
+            shared_cache: SharedCache = SharedCache(
+                path=os.path.join(self.__shared_cache_path, str(limits)), **limits
+            )
+
+            for index in range(40):
+                self.__write(f"project/{index}.ftl", f"message_{index} = {index}\n")
+                entry = FluentReader().read_file_entry(
+                    path=f"project/{index}.ftl", language_code="en"
+                )
+                shared_cache.set(entry=entry, backend=FluentReaderBackends.AST)
+
+                assert shared_cache.get(
+                    stamp=entry.stamp,
+                    language_code="en",
+                    backend=FluentReaderBackends.AST,
+                )
+
+            assert 0 < shared_cache.get_stats()["entries"] <= 16
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from python_fluent_scanner import fluent_reader
+from python_fluent_scanner.fluent_scanner import FluentScanner
+from python_fluent_scanner.main import main
+from python_fluent_scanner.utils.git import GitError, get_changed_files
+
+
+class TestSince(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__git("init", "-q")
+        self.__write("en.ftl", "a = a\nb = { $var_b }\nc = { $var_c }\n")
+        self.__write("ru.ftl", "a = a\nb = { $var_b }\nc = { $var_x }\n")
+        self.__write("kz.ftl", "a = a\nb = { $var_b }\nc = { $var_c }\n")
+        self.__write("locales/de/main.ftl", "a = a\nb = { $var_b }\n")
+        self.__write("locales/de/extra.ftl", "c = { $var_c }\n")
+        self.__write(
+            "fluent_scanner_config.json",
+            json.dumps(
+                {
+                    "root_locale": "en",
+                    "dictionaries": {
+                        "en": "en.ftl",
+                        "ru": "ru.ftl",
+                        "kz": "kz.ftl",
+                        "de": "locales/de",
+                    },
+                }
+            ),
+        )
+        self.__git("add", ".")
+        self.__git("commit", "-q", "-m", "Initial dictionaries")
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __git(self, *arguments: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@test", *arguments],
+            check=True,
+        )
+
+    def __write(self, path: str, data: str) -> None:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+            file.write(data)
+
+    def __check_since(self, ref: str):
+        """
+        The function checks the changes since a revision and returns the output and the paths of the
+        files parsed from the working tree.
+        """
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output), mock.patch.object(
+            fluent_reader.FluentReader,
+            "read_file_entry",
+            autospec=True,
+            side_effect=fluent_reader.FluentReader.read_file_entry,
+        ) as read_file_entry:
+            FluentScanner(since=ref).check()
+
+        return output.getvalue(), {
+            call.kwargs["path"] for call in read_file_entry.call_args_list
+        }
+
+    def test_since(self):
+        """
+        The `test_since` function checks that only the changed dictionaries are parsed, and only the
+        changed messages are checked, the previous versions being read from git.
+        """
+        output, parsed = self.__check_since("HEAD")
+
+        assert "No dictionary changed since HEAD" in output
+        assert parsed == set()
+
+        # A changed translation is checked on its changed messages only: the error of `c` in ru is older.
+        self.__write("ru.ftl", "a = a\nb = { $var_y }\nc = { $var_x }\n")
+        output, parsed = self.__check_since("HEAD")
+
+        assert parsed == {"en.ftl", "ru.ftl"}
+        assert "placeable `var_b` was not found" in output
+        assert "`var_c`" not in output
+        assert "CHECKING DICTIONARY kz" not in output
+
+        # A removed file of a locale split into several files is seen as a change of the locale.
+        os.remove("locales/de/extra.ftl")
+        self.__write("en.ftl", "a = a\nb = { $var_b }\nc = { $var_c }\nd = d\n")
+        output, parsed = self.__check_since("HEAD")
+
+        assert parsed == {"en.ftl", "ru.ftl", "kz.ftl", "locales/de/main.ftl"}
+        assert "2 messages of the root dictionary changed" not in output
+        assert "1 messages of the root dictionary changed" in output
+        assert "DICT(kz): message `d` was not found" in output
+        assert "DICT(de): message `c` was not found" in output
+        assert "DICT(de): message `d` was not found" in output
+        assert "`var_c` was not found" not in output.split("CHECKING DICTIONARY ru")[1]
+
+    def test_since_errors(self):
+        """
+        The `test_since_errors` function checks that an unknown revision is reported, and that the
+        scanner then exits with the code of invalid arguments rather than the one of a failed check,
+        without writing a part of the report.
+        """
+        with self.assertRaises(GitError):
+            get_changed_files("unknown-revision")
+
+        with mock.patch.object(
+            sys,
+            "argv",
+            ["fluent_scanner", "--since", "unknown-revision", "--format", "sarif"],
+        ), contextlib.redirect_stdout(
+            io.StringIO()
+        ) as output, contextlib.redirect_stderr(
+            io.StringIO()
+        ) as error, self.assertRaises(
+            SystemExit
+        ) as exit:
+            main()
+
+        assert exit.exception.code == 2
+        assert "Cannot get the files changed since unknown-revision" in error.getvalue()
+        # The SARIF log is not started, rather than left unterminated.
+        assert output.getvalue() == ""
+
+
+if __name__ == "__main__":
+    unittest.main()
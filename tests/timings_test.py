@@ -0,0 +1,88 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.main import main
+from python_fluent_scanner.utils.cache import ScannerCache
+from python_fluent_scanner.utils.timings import (
+    disable_timings,
+    enable_timings,
+    format_timings,
+    get_timings,
+    span,
+)
+
+
+class TestTimings(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        with open("en.ftl", "w") as file:
+            file.write("a = a\nb = { $var_b }\n")
+
+    def tearDown(self) -> None:
+        disable_timings()
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def test_timings(self):
+        """
+        The `test_timings` function checks that the spans are only recorded while the timings are enabled,
+        and are summed by name.
+        """
+        with span("disabled"):
+            pass
+
+        enable_timings()
+
+        for _ in range(2):
+            with span("enabled"):
+                pass
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reader: FluentReader = FluentReader(cache=ScannerCache())
+            reader.parse_by_file(path="en.ftl", language_code="en")
+
+        timings = get_timings()
+
+        assert list(timings) == ["enabled", "cache.load", "parse en", "cache.store"]
+        assert timings["enabled"]["calls"] == 2
+        assert timings["enabled"]["total"] >= timings["enabled"]["max"]
+        assert "parse en" in format_timings(timings)
+
+        disable_timings()
+
+        assert get_timings() == {}
+
+    def test_timings_output(self):
+        """
+        The `test_timings_output` function checks that the timings and the profile are printed to stderr,
+        so that a machine-readable report on stdout stays valid.
+        """
+        with open("fluent_scanner_config.json", "w") as file:
+            json.dump({"root_locale": "en", "dictionaries": {"en": "en.ftl"}}, file)
+
+        arguments = ["--format", "sarif", "--timings", "--profile", "run.prof"]
+
+        with mock.patch.object(
+            sys, "argv", ["fluent_scanner", *arguments]
+        ), contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(
+            io.StringIO()
+        ) as error:
+            main()
+
+        assert json.loads(output.getvalue())["version"] == "2.1.0"
+        assert "parse en" in error.getvalue()
+        assert "Profile saved to run.prof" in error.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
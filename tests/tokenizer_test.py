@@ -0,0 +1,158 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from python_fluent_scanner import fluent_reader
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.fluent_tokenizer import FluentTokenizer, FluentTokenizerError
+from python_fluent_scanner.types.enums import FluentReaderBackends
+from python_fluent_scanner.utils.stream import iter_entry_chunks
+
+
+class TestTokenizer(unittest.TestCase):
+    # The first 18 files are valid, the others must make the tokenizer fall back to the AST.
+    CORPUS = [
+        "a = alksjdf\nb = { $var_b }\nc = { $var_c ->\n[one] one_text\n*[other] other_text\n}",
+        "### Resource comment\n\n## Group comment\n# Comment\nhello-world = Hello, { $user_name }!\n",
+        "-brand = Firefox\n    .gender = masculine\nabout = About { $version } of the app\n",
+        "multi =\n    First line { $a }\n\n    second line { $b }\n    third\nnext = x\n",
+        "login = Log in\n    .title = { $user } logs in\n    .aria-label = Log in\n",
+        (
+            "emails = { $count ->\n"
+            "    [0] No { \"}\" } emails { NUMBER($count, minimumFractionDigits: 2) }\n"
+            "    [one] One email from { -brand(case: \"gen\") } and { other.attr }\n"
+            "   *[other] { $count } emails, { $unread ->\n"
+            "        [one] one unread\n"
+            "       *[other] { $unread } unread\n"
+            "    }\n"
+            "}\n"
+        ),
+        "crlf = { $a }\r\n    continued\r\n\r\nsecond = { $b ->\r\n  *[x] y\r\n}\r\n",
+        "dup = { $a }\ndup = { $b }\ndup = c\n",
+        "twice = { $a } and { $a ->\n  *[other] x\n}\n",
+        "text-with-special = Price: 5 * 3 [not a variant] \"quoted\" . dot\n",
+        "a_b-c = { $x }{ $y }\n",
+        "term-ref = { -brand }\n",
+        "function = { NUMBER($n) }\n",
+        "function-selector = { NUMBER($n) ->\n  *[other] x\n}\n",
+        "only-attributes =\n    .title = Title { $x }\n",
+        "nested = { { $x } }\n",
+        "literal = { \"text\" }\n",
+        (
+            "refs = { -brand.gender ->\n"
+            "    [masculine] { other.title } { -brand(case: \"gen\") }\n"
+            "   *[other] { DATETIME(NUMBER($n), style: \"long\") } { $n }\n"
+            "}\n"
+            "    .label = { $n ->\n  *[other] { message }\n}\n"
+        ),
+        "empty =\nafter = { $z }\n",
+        "unindented = first\nsecond line\n",
+        "brace = text } here\n",
+        "no-default = { $a ->\n  [one] x\n}\n",
+        "one-line = { $a -> [one] x *[other] y }\n",
+        "#invalid comment\nx = y\n",
+        "  indented = entry\n",
+        "message-selector = { other ->\n  *[other] x\n}\n",
+        "term-selector = { -brand ->\n  *[other] x\n}\n",
+        "placeable-selector = { { $x } ->\n  *[other] x\n}\n",
+        "term-attribute = { -brand.gender }\n",
+        "lower-case-function = { number($n) }\n",
+        "-term-without-value =\n    .attr = x\n",
+        "unindented-variant = { $x ->\n *[one] x\ny\n }\n",
+        "unterminated-select = { $x ->\n *[one] x\nnext = { $y }\n",
+        "empty-variant = { $x ->\n *[one]\n\n}\n",
+    ]
+
+    def __parse(self, source: str, backend: FluentReaderBackends):
+        """
+        The function parses a source with a backend and returns the messages of the dictionary, the
+        duplicate warnings, or the type of the exception raised.
+        """
+        output = io.StringIO()
+
+        try:
+            with contextlib.redirect_stdout(output):
+                dictionary = FluentReader(backend=backend).parse_by_source(
+                    source=source, language_code="en"
+                )
+        except Exception as exception:
+            return type(exception)
+
+        return dictionary, output.getvalue()
+
+    def __assert_same(self, source: str) -> None:
+        """
+        The function checks that both backends give the same result for a source.
+        """
+        assert self.__parse(source, FluentReaderBackends.FAST) == self.__parse(
+            source, FluentReaderBackends.AST
+        ), source
+
+    def test_corpus(self):
+        """
+        The `test_corpus` function checks that both backends give the same dictionaries, duplicate warnings
+        and errors on a corpus of valid and invalid files.
+        """
+        for source in self.CORPUS:
+            self.__assert_same(source)
+
+        self.__assert_same("\n".join(self.CORPUS[:18]))
+
+    def test_random_corpus(self):
+        """
+        The `test_random_corpus` function checks both backends on files made of random valid entries.
+        """
+        generator: random.Random = random.Random(0)
+        entries = self.CORPUS[:18]
+
+        for _ in range(50):
+            source = "\n".join(generator.choice(entries) for _ in range(10))
+            self.__assert_same(source)
+
+    def test_stream(self):
+        """
+        The `test_stream` function checks that both backends give the same entries when a file is read as a
+        stream of small chunks as when it is read at once, including the entries cut by a chunk.
+        """
+        generator: random.Random = random.Random(0)
+        entries = self.CORPUS + ["cut = { $a } {\nNUMBER($n)\n}\n"]
+
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+            fluent_reader,
+            "iter_entry_chunks",
+            side_effect=lambda content: iter_entry_chunks(content, chunk_bytes=32),
+        ):
+            path: str = os.path.join(directory, "stream.ftl")
+
+            for _ in range(50):
+                with open(path, "w", newline="") as file:
+                    file.write("\n".join(generator.choice(entries) for _ in range(10)))
+
+                for backend in FluentReaderBackends:
+                    results = []
+
+                    for stream_min_bytes in (1, os.path.getsize(path) + 1):
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            entry = FluentReader(
+                                backend=backend, stream_min_bytes=stream_min_bytes
+                            ).read_file_entry(path=path, language_code="en")
+
+                        results.append(entry)
+
+                    assert results[0] == results[1]
+
+    def test_fallback(self):
+        """
+        The `test_fallback` function checks that the tokenizer refuses the files with syntax errors.
+        """
+        for source in self.CORPUS[18:]:
+            with self.assertRaises(FluentTokenizerError):
+                FluentTokenizer().parse(source)
+
+
+if __name__ == "__main__":
+    unittest.main()
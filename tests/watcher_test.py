@@ -0,0 +1,140 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from python_fluent_scanner.fluent_comparator import FluentComparator
+from python_fluent_scanner.fluent_reader import FluentReader
+from python_fluent_scanner.fluent_watcher import FluentWatcher
+from python_fluent_scanner.types import compact
+from python_fluent_scanner.types.models import ScannerConfig
+
+
+class TestWatch(unittest.TestCase):
+    ROOT_DICTIONARY_DATA: str = "a = a\nb = { $var_b }\nc = { $var_c }\n"
+
+    def setUp(self) -> None:
+        self.__previous_dir = os.getcwd()
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.__temporary_dir.name)
+
+        self.__write("en.ftl", self.ROOT_DICTIONARY_DATA)
+        self.__write("ru.ftl", "a = a\nb = { $var_x }\nd = d\n")
+        self.__write("kz.ftl", self.ROOT_DICTIONARY_DATA)
+
+        self.config: ScannerConfig = ScannerConfig(
+            root_locale="en",
+            dictionaries={"en": "en.ftl", "ru": "ru.ftl", "kz": "kz.ftl"},
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.__previous_dir)
+        self.__temporary_dir.cleanup()
+
+    def __write(self, path: str, data: str) -> None:
+        """
+        The function writes a file and moves its mtime forward, so that a write within the same mtime
+        tick as the previous one is still seen as a change.
+        """
+        with open(path, "w") as file:
+            file.write(data)
+
+        stat: os.stat_result = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def __check_from_scratch(self):
+        """
+        The function compares the current files without the watcher.
+        """
+        dictionaries = FluentReader().parse_by_config(self.config)
+
+        return {
+            language_code: FluentComparator().compare(
+                dict_a=dictionaries["en"], dict_b=dictionaries[language_code]
+            )
+            for language_code in ("ru", "kz")
+        }
+
+    def test_watch(self):
+        """
+        The `test_watch` function simulates writes to the dictionaries and checks that the watcher only
+        compares the affected dictionaries and gives the same findings as a check from scratch.
+        """
+        watcher: FluentWatcher = FluentWatcher(config=self.config, use_inotify=False)
+
+        assert watcher.check() == self.__check_from_scratch()
+        assert watcher.poll() == []
+
+        self.__write("ru.ftl", "a = a\nb = { $var_b }\nc = { $var_c ->\n *[other] x\n}\n")
+
+        assert watcher.poll() == ["ru"]
+        assert watcher.update(["ru"]) == {"ru": self.__check_from_scratch()["ru"]}
+
+        self.__write("en.ftl", "b = { $var_b }\nc = { $var_c ->\n *[other] x\n}\ne = e\n")
+
+        assert watcher.poll() == ["en"]
+        assert watcher.update(["en"]) == self.__check_from_scratch()
+
+    def test_interned_placeables(self):
+        """
+        The `test_interned_placeables` function checks that the placeables of the replaced versions of
+        the dictionaries do not stay interned, and that the interned placeables are bounded.
+        """
+        watcher: FluentWatcher = FluentWatcher(config=self.config, use_inotify=False)
+        watcher.check()
+
+        for index in range(3):
+            self.__write("ru.ftl", f"a = a\nb = {{ $var_{index} }}\n")
+            watcher.update(watcher.poll())
+
+        assert (("var_0", compact.VARIABLE),) not in compact._interned_placeables
+        assert (("var_2", compact.VARIABLE),) in compact._interned_placeables
+
+        with mock.patch.object(compact, "INTERNED_PLACEABLES_MAX", 2):
+            for index in range(5):
+                compact.make_placeables({f"var_{index}": compact.VARIABLE})
+
+            assert len(compact._interned_placeables) <= 2
+
+    def test_unreadable_file(self):
+        """
+        The `test_unreadable_file` function checks that the watcher reports a dictionary that cannot be
+        read, e.g. while an editor writes it, and keeps watching.
+        """
+        watcher: FluentWatcher = FluentWatcher(config=self.config, use_inotify=False)
+
+        def write_half():
+            with open("ru.ftl", "wb") as file:
+                file.write("a = ä\n".encode("utf-8")[:-2])
+
+        changes = iter(
+            [
+                write_half,
+                lambda: os.remove("ru.ftl"),
+                lambda: self.__write("ru.ftl", self.ROOT_DICTIONARY_DATA),
+            ]
+        )
+
+        def wait():
+            change = next(changes, None)
+
+            if change is None:
+                raise KeyboardInterrupt
+
+            change()
+
+            return ["ru"]
+
+        with mock.patch.object(watcher, "wait", wait), contextlib.redirect_stdout(
+            io.StringIO()
+        ) as output:
+            watcher.run()
+
+        assert output.getvalue().count("Could not read the dictionary ru") == 2
+        assert watcher.get_findings()["ru"] == []
+
+
+if __name__ == "__main__":
+    unittest.main()